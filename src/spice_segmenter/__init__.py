@@ -18,6 +18,7 @@ from .collections import (
 # 3. Then ops (which depend on core)
 # 4. Then optimizers (which depend on ops and properties)
 # 5. Then collections (which depend on properties)
+# 6. Then the solver front-ends (which depend on all of the above)
 from .core import (
     BooleanProperty,
     Constraint,
@@ -87,6 +88,7 @@ from .properties import (
     BoresightX,
     BoresightY,
     BoresightZ,
+    ChebyshevSurrogate,
     CylindricalCoordinates,
     Distance,
     DistanceInTargetBodyRadii,
@@ -146,6 +148,10 @@ from .support.serialization import (
     unstructure_constraint,
 )
 
+# isort: split
+from .constraint_solver.batch import solve_many
+from .constraint_solver.sweep import sweep
+
 # Get version
 __version__ = importlib.metadata.version("spice_segmenter")
 
@@ -194,10 +200,15 @@ __all__ = [
     "BodyFOVVisibility",
     "JupiterShineIdealCondition",
     "SurfaceIlluminationAngles",
+    # Properties - Surrogates
+    "ChebyshevSurrogate",
     # Constraint Operations
     "Constant",
     "MinMaxConstraint",
     "Inverted",
+    # Solving
+    "solve_many",
+    "sweep",
     # Optimization
     "ConstraintOptimizer",
     "optimize_constraint",
@@ -37,43 +37,73 @@ def register_all(engine: SpiceEngine) -> None:
         TargetSizeOnSensor,
     )
     from .observation import (
+        angular_size_rate_scalar,
+        angular_size_rate_vector,
         angular_size_scalar,
         angular_size_vector,
+        approx_altitude_rate_scalar,
+        approx_altitude_rate_vector,
         approx_altitude_scalar,
         approx_altitude_vector,
+        distance_in_target_radii_rate_scalar,
+        distance_in_target_radii_rate_vector,
         distance_in_target_radii_scalar,
         distance_in_target_radii_vector,
+        distance_rate_scalar,
+        distance_rate_vector,
         distance_scalar,
         distance_vector,
         phase_angle_scalar,
         phase_angle_vector,
         sub_observer_pixel_scale_scalar,
         sub_observer_pixel_scale_vector,
+        target_size_on_sensor_rate_scalar,
+        target_size_on_sensor_rate_vector,
         target_size_on_sensor_scalar,
         target_size_on_sensor_vector,
         relative_speed_scalar
     )
 
-    engine.register(Distance, scalar_fn=distance_scalar, vector_fn=distance_vector, compute_unit="km")
+    engine.register(
+        Distance,
+        scalar_fn=distance_scalar,
+        vector_fn=distance_vector,
+        derivative_fn=distance_rate_scalar,
+        derivative_vector_fn=distance_rate_vector,
+        compute_unit="km",
+    )
     engine.register(PhaseAngle, scalar_fn=phase_angle_scalar, vector_fn=phase_angle_vector, compute_unit="rad")
-    engine.register(AngularSize, scalar_fn=angular_size_scalar, vector_fn=angular_size_vector, compute_unit="rad")
+    engine.register(
+        AngularSize,
+        scalar_fn=angular_size_scalar,
+        vector_fn=angular_size_vector,
+        derivative_fn=angular_size_rate_scalar,
+        derivative_vector_fn=angular_size_rate_vector,
+        compute_unit="rad",
+    )
     engine.register(RelativeSpeed, scalar_fn=relative_speed_scalar, compute_unit="km/s")
     engine.register(
         ApproximatedAltitude,
         scalar_fn=approx_altitude_scalar,
         vector_fn=approx_altitude_vector,
+        derivative_fn=approx_altitude_rate_scalar,
+        derivative_vector_fn=approx_altitude_rate_vector,
         compute_unit="km",
     )
     engine.register(
         TargetSizeOnSensor,
         scalar_fn=target_size_on_sensor_scalar,
         vector_fn=target_size_on_sensor_vector,
+        derivative_fn=target_size_on_sensor_rate_scalar,
+        derivative_vector_fn=target_size_on_sensor_rate_vector,
         compute_unit="px",
     )
     engine.register(
         DistanceInTargetBodyRadii,
         scalar_fn=distance_in_target_radii_scalar,
         vector_fn=distance_in_target_radii_vector,
+        derivative_fn=distance_in_target_radii_rate_scalar,
+        derivative_vector_fn=distance_in_target_radii_rate_vector,
         compute_unit="",
     )
     engine.register(
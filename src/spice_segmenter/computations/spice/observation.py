@@ -63,6 +63,45 @@ def distance_vector(prop: Distance, times_et: np.ndarray) -> np.ndarray:
     return np.linalg.norm(positions, axis=1)
 
 
+# The norm and its rate do not depend on the frame: the states are taken in
+# J2000 so that no frame derivative (e.g. from a CK) is needed.
+
+
+def _distance_and_rate_scalar(prop: Distance, time_et: float) -> tuple[float, float]:
+    state, _ = spiceypy.spkezr(
+        prop.target.name,
+        time_et,
+        "J2000",
+        prop.light_time_correction,
+        prop.observer.name,
+    )
+    return spiceypy.vnorm(state[:3]), spiceypy.dvnorm(state)
+
+
+def _distance_and_rate_vector(prop: Distance, times_et: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    from spiceypy import cyice
+
+    states, _ = cyice.spkezr_v(
+        prop.target.name,
+        times_et,
+        "J2000",
+        prop.light_time_correction,
+        prop.observer.name,
+    )
+    states = np.asarray(states)
+    distances = np.linalg.norm(states[:, :3], axis=1)
+    return distances, np.einsum("ij,ij->i", states[:, :3], states[:, 3:]) / distances
+
+
+def distance_rate_scalar(prop: Distance, time_et: float) -> float:
+    """Range rate (km/s)."""
+    return _distance_and_rate_scalar(prop, time_et)[1]
+
+
+def distance_rate_vector(prop: Distance, times_et: np.ndarray) -> np.ndarray:
+    return _distance_and_rate_vector(prop, times_et)[1]
+
+
 # ---------------------------------------------------------------------------
 # PhaseAngle
 # ---------------------------------------------------------------------------
@@ -105,6 +144,21 @@ def angular_size_vector(prop: AngularSize, times_et: np.ndarray) -> np.ndarray:
     return 2 * np.arctan(prop.target.radius / distances)
 
 
+def _angular_size_rate(radius: float, distance, rate):
+    # d/dt 2 atan(R / d) = -2 R d' / (d^2 + R^2)
+    return -2 * radius * rate / (distance**2 + radius**2)
+
+
+def angular_size_rate_scalar(prop: AngularSize, time_et: float) -> float:
+    d, rate = _distance_and_rate_scalar(prop, time_et)
+    return float(_angular_size_rate(prop.target.radius, d, rate))
+
+
+def angular_size_rate_vector(prop: AngularSize, times_et: np.ndarray) -> np.ndarray:
+    distances, rates = _distance_and_rate_vector(prop, times_et)
+    return _angular_size_rate(prop.target.radius, distances, rates)
+
+
 # ---------------------------------------------------------------------------
 # ApproximatedAltitude  (derived)
 # ---------------------------------------------------------------------------
@@ -121,6 +175,11 @@ def approx_altitude_vector(
     return distance_vector(prop, times_et) - prop.target.radius
 
 
+# the radius is constant: the altitude changes at the range rate
+approx_altitude_rate_scalar = distance_rate_scalar
+approx_altitude_rate_vector = distance_rate_vector
+
+
 # ---------------------------------------------------------------------------
 # TargetSizeOnSensor  (derived)
 # ---------------------------------------------------------------------------
@@ -137,6 +196,17 @@ def target_size_on_sensor_vector(
     return angular_size_vector(prop, times_et) / np.mean(prop.observer.ifov)
 
 
+def target_size_on_sensor_rate_scalar(prop: TargetSizeOnSensor, time_et: float) -> float:
+    return angular_size_rate_scalar(prop, time_et) / np.mean(prop.observer.ifov)
+
+
+def target_size_on_sensor_rate_vector(
+    prop: TargetSizeOnSensor,
+    times_et: np.ndarray,
+) -> np.ndarray:
+    return angular_size_rate_vector(prop, times_et) / np.mean(prop.observer.ifov)
+
+
 # ---------------------------------------------------------------------------
 # DistanceInTargetBodyRadii  (derived)
 # ---------------------------------------------------------------------------
@@ -156,6 +226,20 @@ def distance_in_target_radii_vector(
     return distance_vector(prop, times_et) / prop.target.radius
 
 
+def distance_in_target_radii_rate_scalar(
+    prop: DistanceInTargetBodyRadii,
+    time_et: float,
+) -> float:
+    return distance_rate_scalar(prop, time_et) / prop.target.radius
+
+
+def distance_in_target_radii_rate_vector(
+    prop: DistanceInTargetBodyRadii,
+    times_et: np.ndarray,
+) -> np.ndarray:
+    return distance_rate_vector(prop, times_et) / prop.target.radius
+
+
 # ---------------------------------------------------------------------------
 # SubObserverPixelScale  (derived — calls pixel_scale helper)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,202 @@
+"""Solve a constraint from asyncio code, in a cancellable worker process.
+
+The search runs in a separate (spawned) process that furnishes the kernels
+loaded in the parent, so the event loop is never blocked by SPICE.  The
+window is searched in consecutive time chunks, which gives meaningful
+progress (fraction done and intervals found so far) and a cancellation point
+between chunks; inside a chunk, gfevnt/gfocce searches report their progress
+and are interrupted through their ``udbail`` hook.  Solvers without a bail
+hook (e.g. gfuds) are stopped by terminating the worker if it does not exit
+shortly after the cancellation request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import multiprocessing
+import pickle
+import queue
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from loguru import logger as log
+
+from ..core.spice_window import SpiceWindow
+from ..core.time_segments_collection import TimeSegmentsCollection
+from ..support.search_reporter import EventReporter, SolveEvent, reporting_to
+from .parallel import _furnish, clip_intervals, is_chunkable, loaded_kernels, split_window
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+    from ..support.config import Config
+
+# how often the event loop polls the worker, seconds
+POLL_INTERVAL = 0.05
+# minimum time between two progress events from inside a GF search, seconds
+MIN_EVENT_INTERVAL = 0.1
+
+
+def _worker(
+    constraint: ConstraintBase,
+    intervals: np.ndarray,
+    solve_kwargs: dict[str, Any],
+    config: Config,
+    kernels: list[str],
+    n_chunks: int,
+    events: multiprocessing.Queue,
+    cancel: multiprocessing.Event,
+) -> None:
+    """Process entry point: solve chunk by chunk, posting events to *events*."""
+    from .constraint_solver import MasterSolver
+
+    try:
+        _furnish(kernels)
+        start = time.monotonic()
+        window = SpiceWindow.from_et_array(intervals)
+        step = solve_kwargs.get("step") or config.solver_step_seconds
+        chunks = split_window(window, n_chunks if is_chunkable(constraint) else 1, margin=step)
+
+        found = SpiceWindow()
+        done = 0
+        last_post = 0.0
+
+        def post(kind: str, chunk_fraction: float = 0.0, search: str = "") -> None:
+            nonlocal last_post
+            now = time.monotonic()
+            if search and 0.0 < chunk_fraction < 1.0 and now - last_post < MIN_EVENT_INTERVAL:
+                return  # the GF searches report at every step, do not flood the queue
+            last_post = now
+            events.put((
+                "event",
+                SolveEvent(
+                    kind=kind,
+                    fraction=(done + chunk_fraction) / len(chunks),
+                    intervals_found=len(found),
+                    search=search,
+                    elapsed=now - start,
+                ),
+            ))
+
+        def reporter() -> EventReporter:
+            return EventReporter(
+                on_progress=lambda fraction, search: post("progress", fraction, search),
+                should_bail=cancel.is_set,
+            )
+
+        post("started")
+        with config, reporting_to(reporter):
+            for core_start, core_end, padded in chunks:
+                if cancel.is_set():
+                    break
+
+                result = MasterSolver(constraint=constraint, **solve_kwargs).solve(
+                    TimeSegmentsCollection._from_spice_window(SpiceWindow.from_et_array(padded)),
+                )
+                if cancel.is_set():
+                    break  # a bailed-out search returns a partial result
+
+                core = clip_intervals(result._to_spice_window().to_et_array(), core_start, core_end)
+                found = found.union(SpiceWindow.from_et_array(core))
+                done += 1
+                post("progress")
+
+        if cancel.is_set():
+            post("cancelled")
+            events.put(("cancelled", None))
+        else:
+            post("finished")
+            events.put(("result", found.to_et_array()))
+
+    except Exception as exc:  # forwarded to the awaiting coroutine
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(repr(exc))
+        events.put(("error", exc))
+
+
+async def solve_async(
+    constraint: ConstraintBase,
+    window: TimeSegmentsCollection,
+    *,
+    on_event: Callable[[SolveEvent], Any] | None = None,
+    progress_chunks: int = 20,
+    grace: float = 5.0,
+    **kwargs,
+) -> TimeSegmentsCollection:
+    """Solve *constraint* over *window* in a worker process, without blocking the event loop.
+
+    *on_event* (a function or a coroutine function) receives the
+    :class:`~spice_segmenter.support.search_reporter.SolveEvent` stream.
+    Cancelling the awaiting task sets the bail flag of the worker; if it has
+    not stopped after *grace* seconds it is terminated.  Other keyword
+    arguments are passed to :class:`MasterSolver`.
+    """
+    from ..support.config import get_active_config
+
+    ctx = multiprocessing.get_context("spawn")
+    events = ctx.Queue()
+    cancel = ctx.Event()
+    worker = ctx.Process(
+        target=_worker,
+        args=(
+            constraint,
+            window._to_spice_window().to_et_array(),
+            kwargs,
+            get_active_config().override(show_progressbar=False),
+            loaded_kernels(),
+            progress_chunks,
+            events,
+            cancel,
+        ),
+        daemon=True,
+    )
+    worker.start()
+
+    async def dispatch(event: SolveEvent) -> None:
+        if on_event is None:
+            return
+        outcome = on_event(event)
+        if inspect.isawaitable(outcome):
+            await outcome
+
+    try:
+        polls_since_exit = 0
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                if not worker.is_alive():
+                    # leave some time to the last messages to come through the pipe
+                    polls_since_exit += 1
+                    if polls_since_exit * POLL_INTERVAL > 1.0:
+                        raise RuntimeError(
+                            f"Solver process died (exit code {worker.exitcode})",
+                        ) from None
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+
+            if kind == "event":
+                await dispatch(payload)
+            elif kind == "result":
+                return TimeSegmentsCollection._from_spice_window(SpiceWindow.from_et_array(payload))
+            elif kind == "error":
+                raise payload
+            elif kind == "cancelled":
+                raise asyncio.CancelledError
+
+    except asyncio.CancelledError:
+        log.debug("Cancelling solve of {}", constraint)
+        cancel.set()
+        await asyncio.get_running_loop().run_in_executor(None, worker.join, grace)
+        if worker.is_alive():
+            log.warning("Solver process did not bail out within {} s, terminating it", grace)
+            worker.terminate()
+        raise
+
+    finally:
+        worker.join(0.1)
+        events.close()
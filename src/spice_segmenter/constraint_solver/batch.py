@@ -0,0 +1,155 @@
+"""Solve many constraints over the same window, sharing property samples.
+
+Constraints solved one by one re-evaluate the properties they have in common
+(e.g. the same ``Distance`` in a rule per instrument).  :func:`solve_many`
+samples every distinct leaf property once, on a grid shared by all the
+constraints, and solves each leaf from those samples; only the refinement of
+the transitions evaluates the properties again.  Compound constraints are
+then combined with window operations.  Constraints with a global min/max
+are solved whole, as their extremum is taken over the window left by the
+other operands.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+
+import numpy as np
+from loguru import logger as log
+
+from ..core.constraints import ConstraintBase, ConstraintTypes
+from ..core.spice_window import SpiceWindow
+from ..core.time_segments_collection import TimeSegmentsCollection
+from ..ops.constraint_operations import Inverted, WrappedConstraint
+from ..support.config import _default_window, get_active_config
+from .constraint_solver import (
+    MasterSolver,
+    VectorizedBooleanSolver,
+    VectorizedExtremaSolver,
+    VectorizedRangeSolver,
+    VectorizedScalarSolver,
+)
+from .parallel import is_chunkable
+from .sharing import leaf_constraints, property_key
+from .vector_search import sample_grid
+
+
+def _sampled_solver(constraint: ConstraintBase, step: float) -> type | None:
+    """Return the vectorized solver able to solve *constraint* from shared samples."""
+    if constraint.time_step not in (None, step) or not is_chunkable(constraint):
+        return None  # needs its own grid, or the whole window
+    for solver in (VectorizedScalarSolver, VectorizedBooleanSolver, VectorizedRangeSolver, VectorizedExtremaSolver):
+        if solver.can_solve(constraint):
+            return solver
+    return None
+
+
+def combine_leaves(
+    constraint: ConstraintBase,
+    window: SpiceWindow,
+    solve_leaf: Callable[[ConstraintBase], SpiceWindow],
+) -> SpiceWindow:
+    """Solve *constraint* over *window* from the results of its leaves.
+
+    AND, OR and NOT become window intersections, unions and differences;
+    *solve_leaf* is called for every leaf.
+    """
+    if isinstance(constraint, Inverted):
+        return window.difference(combine_leaves(constraint.parent, window, solve_leaf))
+    if isinstance(constraint, WrappedConstraint):
+        return combine_leaves(constraint.parent, window, solve_leaf)
+    if constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        left = combine_leaves(constraint.left, window, solve_leaf)
+        right = combine_leaves(constraint.right, window, solve_leaf)
+        return left.intersect(right) if constraint.operator == "&" else left.union(right)
+    return solve_leaf(constraint)
+
+
+def solve_many(
+    constraints: Mapping[str, ConstraintBase] | Iterable[ConstraintBase],
+    window: TimeSegmentsCollection | None = None,
+    *,
+    step: float | None = None,
+    tol: float | None = None,
+) -> dict[str, TimeSegmentsCollection] | list[TimeSegmentsCollection]:
+    """Solve several constraints over the same *window*.
+
+    Parameters
+    ----------
+    constraints : mapping or iterable of ConstraintBase
+        Constraints to solve, either keyed by a name or as a plain sequence.
+    window : TimeSegmentsCollection, optional
+        Search window. Defaults to the window of the active
+        :class:`~spice_segmenter.support.config.Config`.
+    step : float, optional
+        Sampling step in seconds. Defaults to ``Config.solver_step``.
+    tol : float, optional
+        Convergence tolerance of the transition times, in seconds. Defaults
+        to ``Config.solver_tolerance`` (1 ms when unset).
+
+    Returns
+    -------
+    dict of str to TimeSegmentsCollection, or list of TimeSegmentsCollection
+        The results, keyed like *constraints*, or in the order of *constraints*
+        when a sequence is given (constraints are not hashable, as ``==``
+        builds a new constraint, and different constraints can share a repr).
+
+    Examples
+    --------
+    >>> results = solve_many({"close": d < 5000, "lit": incidence < 80}, window)
+    >>> results["close"]
+    """
+    config = get_active_config()
+    window = _default_window(window, "solve_many()")
+
+    if not isinstance(constraints, Mapping):
+        results = solve_many(dict(enumerate(constraints)), window, step=step, tol=tol)
+        return list(results.values())
+
+    if not len(window):
+        return {name: TimeSegmentsCollection() for name in constraints}
+
+    step = step or config.solver_step_seconds
+    sw = window._to_spice_window()
+    times, offsets = sample_grid(sw.to_et_array(), step)
+
+    from ..engines.evaluator import get_evaluator
+
+    evaluator = get_evaluator()
+    samples: dict[tuple, np.ndarray] = {}
+    n_leaves = 0
+    for constraint in constraints.values():
+        if not is_chunkable(constraint):
+            continue
+        for leaf in leaf_constraints(constraint):
+            n_leaves += 1
+            key = property_key(leaf.left) if _sampled_solver(leaf, step) else None
+            if key is not None and key not in samples:
+                samples[key] = evaluator.evaluate_vector_raw(leaf.left, times)
+
+    log.info(
+        "Sampled {} distinct properties on {} points for {} leaf constraints",
+        len(samples),
+        len(times),
+        n_leaves,
+    )
+
+    solved: dict[int, SpiceWindow] = {}  # by id(), a leaf can be shared by several constraints
+
+    def solve_leaf(leaf: ConstraintBase) -> SpiceWindow:
+        if id(leaf) not in solved:
+            if solver := _sampled_solver(leaf, step):
+                raw = samples[property_key(leaf.left)]
+                solved[id(leaf)] = solver(leaf, step=step, tol=tol).solve_sampled(sw, times, offsets, raw)
+            else:
+                # no shared sampling possible (e.g. FOV, own time step): solve it on its own
+                solved[id(leaf)] = MasterSolver(constraint=leaf, step=step, tol=tol).solve(window)._to_spice_window()
+        return solved[id(leaf)]
+
+    def solve(constraint: ConstraintBase) -> TimeSegmentsCollection:
+        if not is_chunkable(constraint):
+            # the global min/max is taken over the window left by the other operands
+            return MasterSolver(constraint=constraint, step=step, tol=tol).solve(window)
+        return TimeSegmentsCollection._from_spice_window(combine_leaves(constraint, sw, solve_leaf))
+
+    return {name: solve(constraint) for name, constraint in constraints.items()}
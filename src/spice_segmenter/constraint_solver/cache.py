@@ -0,0 +1,176 @@
+"""Content-addressed cache of solved constraint windows.
+
+A solved window is identified by everything that can change it:
+
+* a canonical fingerprint of the constraint (its serialized form),
+* the confinement window,
+* the solver settings (step, minimum interval size, solver choice),
+* the loaded kernel pool (file names, sizes and modification times).
+
+Loading, unloading or updating a kernel changes the key, so stale results
+are never returned.  Results are kept in an in-memory LRU and, when a
+directory is configured, persisted as ``.npy`` arrays of ``[start, end]`` ETs
+so that they survive between sessions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import spiceypy
+from attrs import define, field
+from loguru import logger as log
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+
+
+def _sha256(*parts: bytes | str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+_converter = None
+
+
+def constraint_fingerprint(constraint: ConstraintBase) -> str | None:
+    """Return a canonical hash of *constraint*, or ``None`` if it cannot be serialized."""
+    from ..support.serialization import create_property_converter, unstructure_constraint
+
+    global _converter
+    if _converter is None:
+        # building the converter walks all the property classes, do it once
+        _converter = create_property_converter()
+
+    try:
+        data = unstructure_constraint(constraint, _converter)
+    except Exception as exc:
+        log.debug("Cannot fingerprint {}: {}", constraint, exc)
+        return None
+
+    return _sha256(json.dumps(data, sort_keys=True, default=str))
+
+
+def kernel_fingerprint() -> str:
+    """Return a hash of the loaded kernel pool, in load order.
+
+    The kernel files are stat-ed on every call, which is cheap next to a
+    solve: a text kernel edited and loaded again under the same path (text
+    kernels all have handle 0) changes the hash.
+    """
+    entries = []
+    for i in range(spiceypy.ktotal("ALL")):
+        filename, ktype, _source, _handle = spiceypy.kdata(i, "ALL")
+        try:
+            stat = os.stat(filename)
+            entries.append(f"{filename}|{ktype}|{stat.st_size}|{stat.st_mtime_ns}")
+        except OSError:
+            entries.append(f"{filename}|{ktype}")
+    return _sha256(*entries)
+
+
+def cache_key(
+    constraint: ConstraintBase,
+    intervals: np.ndarray,
+    settings: dict[str, Any],
+) -> str | None:
+    """Return the cache key for solving *constraint* over *intervals* with *settings*.
+
+    ``None`` means the result must not be cached.
+    """
+    fingerprint = constraint_fingerprint(constraint)
+    if fingerprint is None:
+        return None
+
+    return _sha256(
+        fingerprint,
+        np.ascontiguousarray(intervals, dtype=np.float64).tobytes(),
+        json.dumps(settings, sort_keys=True, default=str),
+        kernel_fingerprint(),
+    )
+
+
+@define(repr=False, order=False, eq=False)
+class SolveCache:
+    """In-memory LRU of solved windows, optionally backed by a directory of ``.npy`` files."""
+
+    directory: Path | None = field(default=None, converter=lambda x: Path(x) if x else None)
+    max_entries: int = 256
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _memory: OrderedDict[str, np.ndarray] = field(factory=OrderedDict, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.npy"
+
+    def _remember(self, key: str, intervals: np.ndarray) -> None:
+        self._memory[key] = intervals
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the ``(N, 2)`` intervals stored under *key*, or ``None``."""
+        intervals = self._memory.get(key)
+        if intervals is not None:
+            self._memory.move_to_end(key)
+        elif self.directory is not None and self._path(key).exists():
+            intervals = np.load(self._path(key))
+            self._remember(key, intervals)
+
+        if intervals is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return intervals.copy()
+
+    def put(self, key: str, intervals: np.ndarray) -> None:
+        """Store the ``(N, 2)`` array of ET *intervals* under *key*."""
+        intervals = np.ascontiguousarray(intervals, dtype=np.float64).reshape(-1, 2)
+        self._remember(key, intervals)
+
+        if self.directory is not None:
+            # write then rename, so that concurrent readers never see a partial file
+            tmp = self.directory / f"{key}.{os.getpid()}.tmp.npy"
+            np.save(tmp, intervals)
+            tmp.replace(self._path(key))
+
+    def clear(self, disk: bool = False) -> None:
+        """Forget all in-memory entries and, with *disk*, remove the stored files."""
+        self._memory.clear()
+        self.hits = self.misses = 0
+        if disk and self.directory is not None:
+            for path in self.directory.glob("*.npy"):
+                path.unlink()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+
+_caches: dict[Path | None, SolveCache] = {}
+
+
+def get_solve_cache() -> SolveCache:
+    """Return the cache for the active ``Config.cache_dir`` (in memory only when unset)."""
+    from ..support.config import get_active_config
+
+    directory = get_active_config().cache_dir
+    directory = Path(directory).expanduser() if directory else None
+    if directory not in _caches:
+        _caches[directory] = SolveCache(directory)
+    return _caches[directory]
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 import pint
 import spiceypy
@@ -12,24 +15,140 @@ from spice_segmenter.core.constraints import (
     ConstraintBase,
     ConstraintTypes,
 )
-from spice_segmenter.core.property import BooleanProperty, PropertyTypes
+from spice_segmenter.core.property import BooleanProperty, Property, PropertyTypes
 from spice_segmenter.core.spice_window import SpiceWindow
 from spice_segmenter.core.time_segments_collection import TimeSegmentsCollection
 from spice_segmenter.ops.constant_values import BoolConstant, Constant
-from spice_segmenter.ops.constraint_operations import Inverted
+from spice_segmenter.ops.constraint_operations import Inverted, Pruned, RangeConstraint
 from spice_segmenter.properties.occultation_types import OccultationTypes
 from spice_segmenter.support.config import get_active_config
 from spice_segmenter.support.search_reporter import (
+    EventReporter,
     NoSearchReporter,
     SearchReporter,
     get_default_reporter_class,
 )
 
+from .cache import cache_key, get_solve_cache
+from .incremental import solve_incremental
+from .parallel import is_chunkable, solve_in_chunks
+from .planning import flatten_operands, order_operands
+from .profile import active_profile, count, current_node, profiling, run_profiled
+from .sharing import active_shared_samples, plan_shared_samples, sharing
+from .vector_search import (
+    assemble_intervals,
+    bisect_transitions,
+    brent,
+    derivative_sign_changes,
+    golden_section,
+    grid_steps,
+    level_crossings,
+    local_extrema_brackets,
+    refined_maximum,
+    sample_grid,
+    state_changes,
+    uncertain_steps,
+)
+
+
+def _record_capacity(cell: SpiceWindow) -> None:
+    """Record the number of intervals *cell* can hold in the profile of the running solver."""
+    if (node := current_node()) is not None:
+        node.capacity = cell.size // 2
+
+
+def _note(**notes) -> None:
+    if (node := current_node()) is not None:
+        node.notes.update(notes)
+
+
+# convergence tolerance of the GF routines that take no tol argument (CNVTOL)
+GF_DEFAULT_TOLERANCE = 1e-6
+# SPICE has no getter for gfstol: the tolerance set by the enclosing _gf_tolerance
+_gf_active_tolerance = GF_DEFAULT_TOLERANCE
+
+
+@contextmanager
+def _gf_tolerance(tol: float | None) -> Iterator[None]:
+    """Use *tol* as convergence tolerance of gfuds, gfudb and gftfov in the block.
+
+    These routines have no tol argument, the tolerance is global SPICE state
+    (``gfstol``) and is set back to its previous value afterwards, so that the
+    blocks nest.  None leaves it alone.
+    """
+    global _gf_active_tolerance
+
+    if tol is None:
+        yield
+        return
+
+    previous = _gf_active_tolerance
+    spiceypy.gfstol(tol)
+    _gf_active_tolerance = tol
+    try:
+        yield
+    finally:
+        spiceypy.gfstol(previous)
+        _gf_active_tolerance = previous
+
+
+def _reference_value(constraint: ConstraintBase) -> float:
+    """Return the right-hand constant of *constraint* in the compute unit of its left property.
+
+    Compute functions (and thus SPICE callbacks and vector evaluations) return
+    raw values in the unit registered with the engine, not the display unit,
+    so the reference value must be converted to that unit.
+    """
+    right_value = constraint.right.value
+
+    runit = constraint.right.unit
+    lunit = constraint.left.unit
+
+    try:
+        from ..engines.evaluator import get_evaluator
+        comp_unit = get_evaluator()._engine.get_compute_unit(type(constraint.left))
+    except Exception:
+        comp_unit = None
+    target_unit = comp_unit if comp_unit is not None else lunit
+
+    if runit == pint.Unit("dimensionless"):
+        log.debug(
+            f"right unit is dimensionless. Assuming same as left property unit {lunit}",
+        )
+        runit = lunit
+
+    if runit != target_unit:
+        log.debug(
+            f"converting right value from {runit} to compute unit {target_unit}",
+        )
+        try:
+            right_value = pint.Quantity(right_value, runit).to(target_unit).magnitude
+        except Exception:
+            log.warning(f"Unit conversion failed: {runit} → {target_unit}, using raw value")
+
+    return right_value
+
+
+def _range_bounds(constraint: ConstraintBase) -> tuple[float, float]:
+    """Return the bounds of a (possibly inverted) :class:`RangeConstraint` in the compute unit."""
+    band: RangeConstraint = constraint.parent if isinstance(constraint, Inverted) else constraint
+    above, below = band.parts
+    return float(_reference_value(above)), float(_reference_value(below))
+
 
 @define(repr=False, order=False, eq=False)
 class BaseSolver(ABC):
     """The interface for any ConstraintSolvers"""
 
+    # Rough cost of one search step, relative to a native gfevnt step. Used by
+    # the planning module to order the operands of compound constraints.
+    relative_cost: ClassVar[float] = 10.0
+    # SPICE GF routine (or other search method) doing the work, as shown by explain
+    routine: ClassVar[str] = ""
+    # Convergence tolerance (seconds) when neither the solver nor the Config
+    # set one. None leaves the SPICE default of the GF routine.
+    default_tolerance: ClassVar[float | None] = 1e-3
+
     constraint: ConstraintBase | None
     _step: float | None = field(
         factory=lambda: get_active_config().solver_step_seconds,
@@ -37,6 +156,7 @@ class BaseSolver(ABC):
         if isinstance(x, float | int | None)
         else pd.Timedelta(x).total_seconds(),
     )
+    _tol: float | None = None  # seconds
 
     @property
     def step(self) -> float:
@@ -48,6 +168,17 @@ class BaseSolver(ABC):
 
         return get_active_config().solver_step_seconds
 
+    @property
+    def tol(self) -> float | None:
+        if self._tol is not None:
+            return self._tol
+
+        configured = get_active_config().solver_tolerance
+        if configured is not None:
+            return configured
+
+        return self.default_tolerance
+
     @abstractmethod
     def solve(self, window: SpiceWindow) -> SpiceWindow:
         """Solve the constraint on the given window"""
@@ -128,6 +259,7 @@ class SpiceEventSolverConfigurator:
         """
         from ..ops.constraint_operations import Inverted
         from ..properties.component_selector import ComponentSelector
+        from ..properties.coordinates import SubObserverPoint, SubObserverPointMethods, Vector
 
         inverted = isinstance(constraint, Inverted)
         # Inverted/WrappedConstraint delegates .left/.right/.operator to the
@@ -165,19 +297,28 @@ class SpiceEventSolverConfigurator:
         elif quantity == "coordinate":
             # left is a ComponentSelector wrapping a coordinate property (e.g.
             # LatitudinalCoordinates) which itself wraps a Vector.
+            # The x, y, z components select directly from the Vector.
             coord = left.vector       # e.g. LatitudinalCoordinates
-            vec = coord.vector        # Vector has .origin, .target, .frame, .abcorr
-            method = getattr(vec, "method", "ellipsoid")
+            if isinstance(coord, Vector):
+                vec, system = coord, "rectangular"
+            else:
+                vec, system = coord.vector, coord.name  # Vector has .origin, .target, .frame, .abcorr
+            if isinstance(vec, SubObserverPoint):
+                definition = "SUB-OBSERVER POINT"
+                method = SubObserverPointMethods.GF_METHODS[str(vec.method).upper()]
+            else:
+                definition = "position"
+                method = getattr(vec, "method", "ellipsoid")
             self.add_str_parameter("TARGET", vec.target.name)
             self.add_str_parameter("OBSERVER", vec.origin.name)
             self.add_str_parameter("ABCORR", vec.abcorr)
-            self.add_str_parameter("COORDINATE SYSTEM", coord.name)
+            self.add_str_parameter("COORDINATE SYSTEM", system)
             self.add_str_parameter(
                 "COORDINATE",
                 left.name.upper().replace("_", " "),
             )
             self.add_str_parameter("REFERENCE FRAME", vec.frame.name)
-            self.add_str_parameter("VECTOR DEFINITION", "position")
+            self.add_str_parameter("VECTOR DEFINITION", definition)
             self.add_str_parameter("METHOD", str(method))
             self.add_str_parameter("DREF", "")
             self.add_vector_parameter("DVEC", [0.0, 0.0, 0.0])
@@ -230,9 +371,14 @@ class SpiceEventSolverConfigurator:
     def _get_spice_quantity(prop) -> str | None:
         """Return the SPICE gfevnt quantity name for *prop*, or ``None``."""
         from ..properties.component_selector import ComponentSelector
+        from ..properties.coordinates import Vector
 
         if isinstance(prop, ComponentSelector):
-            return "coordinate"
+            # only the coordinates of a Vector, not the components of any vector property
+            coord = prop.vector
+            if isinstance(coord, Vector) or isinstance(getattr(coord, "vector", None), Vector):
+                return "coordinate"
+            return None
         name = getattr(prop, "name", None)
         if name and name in SpiceEventSolverConfigurator.known_properties():
             return name
@@ -401,9 +547,12 @@ class SpiceEventSolverConfigurator:
 class SpiceEventSolver(BaseSolver):
     """Wrapper to the gfevnt solver from spice/spiceypy"""
 
+    relative_cost: ClassVar[float] = 1.0
+    routine: ClassVar[str] = "gfevnt"
+
     config: dict = field(factory=dict)
     result: SpiceWindow | None = None
-    reporter: SearchReporter | NoSearchReporter = field(
+    reporter: SearchReporter | NoSearchReporter | EventReporter = field(
         factory=get_default_reporter_class,
     )
 
@@ -428,6 +577,7 @@ class SpiceEventSolver(BaseSolver):
         maxval = 100000
         cnfine = window.spice_window  # the window
         self.result = SpiceWindow(size=maxval)  # the resulting window
+        _record_capacity(self.result)
 
         log.debug(f"Setting step size at {self.step} seconds.")
 
@@ -437,14 +587,14 @@ class SpiceEventSolver(BaseSolver):
             udstep=spiceypy.utils.callbacks.SpiceUDFUNS(gfstep),
             udrefn=spiceypy.utils.callbacks.SpiceUDREFN(gfrefn),
             lenvals=100,
-            tol=1e-3,
+            tol=self.tol,
             rpt=True,
             udrepi=self.reporter.init_search_spice,
             udrepu=self.reporter.update_function_spice,
             udrepf=self.reporter.end_search_spice,
             nintvls=maxval,
             bail=True,
-            udbail=spiceypy.utils.callbacks.SpiceUDBAIL(spiceypy.gfbail),
+            udbail=self.reporter.bail_function_spice,
             cnfine=cnfine,
             result=self.result.spice_window,
             **self.config,
@@ -453,7 +603,7 @@ class SpiceEventSolver(BaseSolver):
         inverted = constraint_config.get("inverted", False)
         if inverted:
             log.debug("INVERTING RESULT")
-            self.result = self.result.complement(window)
+            self.result = window.difference(self.result)
 
         return self.result
 
@@ -474,7 +624,7 @@ class SpiceEventSolver(BaseSolver):
 
     @staticmethod
     def can_solve(constraint: ConstraintBase) -> bool:
-        if constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        if constraint.ctype in (ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT, ConstraintTypes.RANGE):
             return False
 
         quantity = SpiceEventSolverConfigurator._get_spice_quantity(constraint.left)
@@ -488,9 +638,12 @@ class SpiceEventSolver(BaseSolver):
 class SpiceOccultationSolver(BaseSolver):
     """Occultation Solver"""
 
+    relative_cost: ClassVar[float] = 1.0
+    routine: ClassVar[str] = "gfocce"
+
     config: dict = field(factory=dict)
     result: SpiceWindow | None = None
-    reporter: SearchReporter | NoSearchReporter = field(
+    reporter: SearchReporter | NoSearchReporter | EventReporter = field(
         factory=get_default_reporter_class,
     )
 
@@ -527,7 +680,7 @@ class SpiceOccultationSolver(BaseSolver):
                 "bframe": occ.back.frame,
                 "abcorr": occ.light_time_correction,
                 "obsrvr": occ.observer.name,
-                "tol": 1e-3,
+                "tol": self.tol,
                 "udstep": spiceypy.utils.callbacks.SpiceUDFUNS(gfstep),
                 "udrefn": spiceypy.utils.callbacks.SpiceUDREFN(gfrefn),
                 "rpt": True,
@@ -535,7 +688,7 @@ class SpiceOccultationSolver(BaseSolver):
                 "udrepu": self.reporter.update_function_spice,
                 "udrepf": self.reporter.end_search_spice,
                 "bail": True,
-                "udbail": spiceypy.utils.callbacks.SpiceUDBAIL(spiceypy.gfbail),
+                "udbail": self.reporter.bail_function_spice,
             },
         )
 
@@ -557,6 +710,7 @@ class SpiceOccultationSolver(BaseSolver):
         maxval = 10000
         cnfine = window.spice_window  # the window
         self.result = SpiceWindow(size=maxval)  # the resulting window
+        _record_capacity(self.result)
 
         spiceypy.gfsstp(self.step)  # set the step size
 
@@ -589,13 +743,13 @@ class SpiceOccultationSolver(BaseSolver):
 
         if isinstance(self.constraint, Inverted):
             log.debug("INVERTING RESULT")
-            self.result = self.result.complement(window)
+            self.result = window.difference(self.result)
 
         return self.result
 
     @staticmethod
     def can_solve(constraint: ConstraintBase) -> bool:
-        if constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        if constraint.ctype in (ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT, ConstraintTypes.RANGE):
             return False
 
         if constraint.left.name in ["occultation"]:
@@ -609,6 +763,10 @@ class SpiceOccultationSolver(BaseSolver):
 class SpiceWindowSolver(BaseSolver):
     """Solves a constraints made by two constraints returing SpiceWindow objects"""
 
+    # the operands are costed individually
+    relative_cost: ClassVar[float] = 0.0
+    routine: ClassVar[str] = "window operations"
+
     def solve(self, window: SpiceWindow) -> SpiceWindow:
         if not self.constraint or not self.can_solve(self.constraint):
             log.error("No constraint set or constraint cannot be solved")
@@ -625,38 +783,69 @@ class SpiceWindowSolver(BaseSolver):
         if not len(window):
             return SpiceWindow()
 
-        solver: type[BaseSolver] = get_appropriate_solver(self.constraint.left)
-
-        # step = self.constraint.time_step if self.constraint.time_step else self.step
-
-        # solve the first constraint
-        result = solver(self.constraint.left, step=self.step).solve(window)
-
-        assert result is not None
-
-        solver = get_appropriate_solver(self.constraint.right)
-        if self.constraint.operator == "&":
-            log.debug("solving an AND operator")
-            result2 = solver(self.constraint.right, step=self.step).solve(result)
-            op_res = result.intersect(result2)
-
-        elif self.constraint.operator == "|":
-            log.debug("solving an OR operator")
-            result2 = solver(self.constraint.right, step=self.step).solve(
-                result.complement(window),
-            )
-            op_res = result.union(result2)
-
-        else:
+        if self.constraint.operator not in ("&", "|"):
             log.error("Operator {} not implemented", self.constraint.operator)
             raise NotImplementedError
 
+        # a & b & c is built as ((a & b) & c): solve it as a single n-ary node
+        operands = flatten_operands(self.constraint)
+        if get_active_config().reorder_operands:
+            # both operators are commutative: solve the cheapest, most selective operands first
+            operands = order_operands(operands, self.constraint.operator, window, self.step)
+
+        shared = None
+        if get_active_config().share_samples and active_shared_samples() is None:
+            # outermost compound node: leaves on the same property share one sampling
+            shared = plan_shared_samples(self.constraint, window, self.step)
+
+        with sharing(shared):
+            if self.constraint.operator == "&":
+                log.debug("solving an AND of {} operands", len(operands))
+                op_res = self._solve_and(operands, window)
+            else:
+                log.debug("solving an OR of {} operands", len(operands))
+                op_res = self._solve_or(operands, window)
+
         if isinstance(self.constraint, Inverted):
             log.debug("INVERTING RESULT")
-            op_res = op_res.complement(window)  # invert the result
+            # invert the result within the intervals of the window, not its hull
+            op_res = window.difference(op_res)
 
         return op_res
 
+    def _solve_operand(self, operand: ConstraintBase, window: SpiceWindow) -> SpiceWindow:
+        solver = get_appropriate_solver(operand)(operand, step=self.step)
+        shared = active_shared_samples()
+        if shared is not None and shared.serves(solver):
+            result = run_profiled(solver, window, lambda w: shared.solve(solver, w))
+        else:
+            result = run_profiled(solver, window)
+        assert result is not None
+        return result
+
+    def _solve_and(self, operands: list[ConstraintBase], window: SpiceWindow) -> SpiceWindow:
+        """Each operand is only searched where all the previous ones hold."""
+        remaining = window
+        for i, operand in enumerate(operands):
+            remaining = remaining.intersect(self._solve_operand(operand, remaining))
+            if not len(remaining):
+                log.debug("AND window empty after {} of {} operands", i + 1, len(operands))
+                break
+        return remaining
+
+    def _solve_or(self, operands: list[ConstraintBase], window: SpiceWindow) -> SpiceWindow:
+        """Each operand is only searched where none of the previous ones hold."""
+        result = SpiceWindow()
+        remaining = window
+        for i, operand in enumerate(operands):
+            found = self._solve_operand(operand, remaining)
+            result = result.union(found)
+            remaining = remaining.difference(found)
+            if not len(remaining):
+                log.debug("OR window covered after {} of {} operands", i + 1, len(operands))
+                break
+        return result
+
     @staticmethod
     def can_solve(constraint: ConstraintBase) -> bool:
         if constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
@@ -665,6 +854,175 @@ class SpiceWindowSolver(BaseSolver):
         return False
 
 
+@define(repr=False, order=False, eq=False)
+class PrunedSolver(BaseSolver):
+    """Solves the necessary condition of a :class:`Pruned` constraint first, then the
+    constraint itself only where the condition holds."""
+
+    # the condition and the constraint are costed individually
+    relative_cost: ClassVar[float] = 0.0
+    routine: ClassVar[str] = "window operations"
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        if not self.constraint or not self.can_solve(self.constraint):
+            log.error("No constraint set or constraint cannot be solved")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        inverted = isinstance(self.constraint, Inverted)
+        pruned: Pruned = self.constraint.parent if inverted else self.constraint
+
+        condition = pruned.condition
+        kept = run_profiled(get_appropriate_solver(condition)(condition, step=self.step), window)
+        log.debug("Necessary condition {} kept {} intervals", condition, len(kept))
+
+        if len(kept):
+            parent = pruned.parent
+            result = run_profiled(get_appropriate_solver(parent)(parent, step=self.step), kept)
+        else:
+            result = SpiceWindow()
+
+        if inverted:
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
+
+        return result
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        if isinstance(constraint, Inverted):
+            constraint = constraint.parent
+        return isinstance(constraint, Pruned)
+
+
+def rate_bound_property(prop: Property) -> Property | None:
+    """Return a property whose value bounds ``|d prop / dt|`` at every time, or None.
+
+    The value is in the compute unit of *prop* per second.  The distance
+    between two bodies changes at most at their relative speed; other
+    properties have no such bound yet.
+    """
+    from ..properties.observation_properties import Distance, RelativeSpeed
+
+    if type(prop) is Distance:
+        return RelativeSpeed(prop.observer, prop.target, light_time_correction=prop.light_time_correction)
+    return None
+
+
+@define(repr=False, order=False, eq=False)
+class AdaptiveStepSolver(BaseSolver):
+    """Searches a scalar constraint at its step only where the property can reach the threshold.
+
+    Used when ``Config.min_event_duration`` is set, the step then being that
+    duration, for the properties whose rate of change is bounded by another
+    property (see :func:`rate_bound_property`: the relative speed for a
+    distance).  The property and its bound are sampled on a pilot grid
+    ``coarsening`` times coarser; the rate is bounded by the largest value of
+    the bound over the window, its local maxima refined between the pilot
+    samples, times ``rate_margin``.  Over a pilot step whose values are too
+    far from the thresholds to reach them at that rate, the state is the one
+    of its end points; the other pilot steps are searched by the usual solver
+    of the constraint.  The other constraints are searched at the step
+    everywhere.
+
+    The bound holds if the pilot samples show every peak of the bound (e.g.
+    of the relative speed at closest approach) as a local maximum; a peak
+    narrower than the pilot step between two higher samples would be missed.
+
+    Long cruise phases far from the thresholds only cost the pilot samples,
+    while the approaches are searched at the resolution of the shortest event.
+    """
+
+    # costed by the planning module as the pilot sampling plus the inner solver
+    relative_cost: ClassVar[float] = 0.0
+    routine: ClassVar[str] = "pilot sampling"
+    # pilot step, in steps
+    coarsening: ClassVar[int] = 32
+    # safety factor on the bound of the rate of change (light time, refinement)
+    rate_margin: ClassVar[float] = 1.1
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
+        if not self.constraint or not self.can_solve(self.constraint):
+            log.error("No constraint set or constraint cannot be solved")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        inverted = isinstance(self.constraint, Inverted)
+        leaf = self.constraint.parent if inverted else self.constraint
+        prop = leaf.left
+        if leaf.ctype == ConstraintTypes.RANGE:
+            levels = np.array(_range_bounds(leaf))
+        else:
+            levels = np.array([float(_reference_value(leaf))])
+
+        evaluator = get_evaluator()
+        bound = rate_bound_property(prop)
+
+        def bound_function(times: np.ndarray) -> np.ndarray:
+            count("vector_samples", len(times))
+            return np.abs(np.asarray(evaluator.evaluate_vector_raw(bound, times), dtype=np.float64))
+
+        times, offsets = sample_grid(window.to_et_array(), self.coarsening * self.step)
+        values = np.asarray(evaluator.evaluate_vector_raw(prop, times), dtype=np.float64)
+        count("vector_samples", len(times))
+        rate = self.rate_margin * refined_maximum(bound_function, times, offsets, bound_function(times), self.step)
+
+        if leaf.ctype == ConstraintTypes.RANGE:
+            holds = (values > levels[0]) & (values < levels[1])
+        elif leaf.operator == ">":
+            holds = values > levels[0]
+        elif leaf.operator == "<":
+            holds = values < levels[0]
+        else:  # "=" only holds at instants
+            holds = np.zeros(len(values), dtype=bool)
+        holds = holds != inverted
+
+        # the state is the same over the pilot steps that cannot reach a level
+        steps = grid_steps(offsets)
+        search = uncertain_steps(times, offsets, values, levels, rate)
+        known = np.setdiff1d(steps, search)
+        known = known[holds[known]]
+        result = SpiceWindow.from_et_array(np.column_stack([times[known], times[known + 1]]))
+        log.debug("Searching {} of {} pilot steps of {}", len(search), len(steps), prop)
+        _note(searched_fraction=len(search) / max(len(steps), 1))
+
+        if len(search):
+            searched = SpiceWindow.from_et_array(np.column_stack([times[search], times[search + 1]]))
+            solver = self.inner_solver(self.constraint)(self.constraint, step=self.step, tol=self._tol)
+            result = result.union(run_profiled(solver, searched))
+
+        return result
+
+    @staticmethod
+    def inner_solver(constraint: ConstraintBase) -> type[BaseSolver]:
+        """Return the solver searching *constraint* where it can change state."""
+        for solver in _candidate_solvers():
+            if solver is not AdaptiveStepSolver and solver.can_solve(constraint):
+                return solver
+        raise NotImplementedError(f"No solver implemented for constraint {constraint}")
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        if get_active_config().min_event_duration is None or constraint.time_step:
+            return False
+        leaf = constraint.parent if isinstance(constraint, Inverted) else constraint
+        if leaf.time_step:
+            return False
+        if leaf.ctype != ConstraintTypes.RANGE and not (
+            leaf.ctype == ConstraintTypes.COMPARE_TO_CONSTANT
+            and leaf.operator in (">", "<", "=")
+            and leaf.left.type == PropertyTypes.SCALAR
+        ):
+            return False
+        return rate_bound_property(leaf.left) is not None
+
+
 @define(repr=False, order=False, eq=False)
 class FovVisibilitySolver(BaseSolver):
     """
@@ -673,11 +1031,16 @@ class FovVisibilitySolver(BaseSolver):
     We need to use https://naif.jpl.nasa.gov/pub/naif/toolkit_docs/C/cspice/gffove_c.html to get progress.
     """
 
+    relative_cost: ClassVar[float] = 2.0
+    routine: ClassVar[str] = "gftfov"
+    default_tolerance: ClassVar[float | None] = None
+
     def solve(self, window: SpiceWindow) -> SpiceWindow:
         if not len(window):
             return SpiceWindow()
 
         result = SpiceWindow()  # the resulting window
+        _record_capacity(result)
 
         pars = dict(
             inst=self.constraint.left.observer.name,
@@ -703,13 +1066,15 @@ class FovVisibilitySolver(BaseSolver):
         # cnfine    I-O  SPICE window to which the search is restricted.
         # result     O   SPICE window containing results.
 
-        spiceypy.gftfov(**pars)
+        with _gf_tolerance(self.tol):
+            spiceypy.gftfov(**pars)
 
         log.debug("Result {}", result)
 
-        if self.constraint.right is False:
+        # == False, or NOT (== True): the target is out of the FOV
+        if isinstance(self.constraint, Inverted) == bool(self.constraint.right.value):
             log.debug("Inverting result")
-            result = result.complement(window)
+            result = window.difference(result)
 
         return result
 
@@ -729,6 +1094,10 @@ class FovVisibilitySolver(BaseSolver):
 class BooleanPropertySolver(BaseSolver):
     """Solver for boolean properties"""
 
+    relative_cost: ClassVar[float] = 20.0
+    routine: ClassVar[str] = "gfudb"
+    default_tolerance: ClassVar[float | None] = None
+
     @staticmethod
     def can_solve(constraint: ConstraintBase) -> bool:
         if constraint.ctype == ConstraintTypes.COMPARE_TO_CONSTANT:
@@ -749,19 +1118,25 @@ class BooleanPropertySolver(BaseSolver):
             return SpiceWindow()
 
         result = SpiceWindow()
+        _record_capacity(result)
 
         right_value: BoolConstant = self.constraint.right(
             0,
         )  # call returns the underlaying value
         left_prop: BooleanProperty = self.constraint.left
 
-        spiceypy.gfudb(
-            spiceypy.utils.callbacks.SpiceUDFUNS(spiceypy.udf),
-            left_prop.compute_as_spice_function(invert=~right_value),
-            self.step,
-            window.spice_window,
-            result.spice_window,
-        )
+        with _gf_tolerance(self.tol):
+            spiceypy.gfudb(
+                spiceypy.utils.callbacks.SpiceUDFUNS(spiceypy.udf),
+                left_prop.compute_as_spice_function(invert=~right_value),
+                self.step,
+                window.spice_window,
+                result.spice_window,
+            )
+
+        if isinstance(self.constraint, Inverted):
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
 
         return result
 
@@ -770,6 +1145,10 @@ class BooleanPropertySolver(BaseSolver):
 class GenericScalarSolver(BaseSolver):
     """Solver for any scalar property"""
 
+    relative_cost: ClassVar[float] = 20.0
+    routine: ClassVar[str] = "gfuds"
+    default_tolerance: ClassVar[float | None] = None
+
     @staticmethod
     def can_solve(constraint: ConstraintBase) -> bool:
         if constraint.ctype == ConstraintTypes.COMPARE_TO_CONSTANT or constraint.ctype == ConstraintTypes.MINMAX:
@@ -778,6 +1157,8 @@ class GenericScalarSolver(BaseSolver):
         return False
 
     def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
         if not self.constraint:
             log.error("No constraint set")
             raise ValueError
@@ -790,81 +1171,555 @@ class GenericScalarSolver(BaseSolver):
             return SpiceWindow()
 
         result = SpiceWindow()
+        _record_capacity(result)
 
         left_prop = self.constraint.left
 
         as_spice_f = left_prop.compute_as_spice_function()
 
-        def is_dec(func: spiceypy.utils.callbacks.UDFUNC, t: float) -> bool:
-            return spiceypy.uddc(as_spice_f, t, 1.0)
-
-        if self.constraint.ctype == ConstraintTypes.MINMAX:
-            # Convert minmax condition types to SPICE operator codes
-            minmax_to_spice = {
-                "local_minimum": "LOCMIN",
-                "local_maximum": "LOCMAX",
-                "global_minimum": "ABSMIN",
-                "global_maximum": "ABSMAX",
-            }
-            operator = minmax_to_spice.get(self.constraint.operator)
-            if not operator:
-                log.error(f"Unknown minmax operator: {self.constraint.operator}")
-                raise ValueError
-
-            # For minmax constraints, use 0.0 as the right value (unused)
-            spiceypy.gfuds(
-                as_spice_f,
-                spiceypy.utils.callbacks.SpiceUDFUNB(is_dec),
-                operator,
-                0.0,
-                0.0,
-                self.step,
-                10000,
-                window.spice_window,
-                result.spice_window,
-            )
-        else:
-            # For constant comparison constraints
-            right_value: BoolConstant = self.constraint.right.value
+        evaluator = get_evaluator()
+        if evaluator.has_derivative(left_prop):
+            # exact derivative: one call instead of two property evaluations in uddc
+            log.debug("Using the registered derivative of {} for monotonicity", left_prop)
 
-            runit = self.constraint.right.unit
-            lunit = self.constraint.left.unit
+            def is_dec(func: spiceypy.utils.callbacks.UDFUNC, t: float) -> bool:
+                count("derivative_callbacks")
+                return evaluator.evaluate_derivative_raw(left_prop, t) < 0.0
 
-            # Convert right_value to the compute unit (what gfuds/evaluate_scalar_raw returns),
-            # not the display unit, because compute_as_spice_function returns raw compute-unit values.
-            try:
-                from ..engines.evaluator import get_evaluator
-                comp_unit = get_evaluator()._engine.get_compute_unit(type(left_prop))
-            except Exception:
-                comp_unit = None
-            target_unit = comp_unit if comp_unit is not None else lunit
+        else:
 
-            if runit == pint.Unit("dimensionless"):
-                log.debug(
-                    f"right unit is dimensionless. Assuming same as left property unit {lunit}",
+            def is_dec(func: spiceypy.utils.callbacks.UDFUNC, t: float) -> bool:
+                count("derivative_callbacks")
+                return spiceypy.uddc(as_spice_f, t, 1.0)
+
+        with _gf_tolerance(self.tol):
+            if self.constraint.ctype == ConstraintTypes.MINMAX:
+                # Convert minmax condition types to SPICE operator codes
+                minmax_to_spice = {
+                    "local_minimum": "LOCMIN",
+                    "local_maximum": "LOCMAX",
+                    "global_minimum": "ABSMIN",
+                    "global_maximum": "ABSMAX",
+                }
+                operator = minmax_to_spice.get(self.constraint.operator)
+                if not operator:
+                    log.error(f"Unknown minmax operator: {self.constraint.operator}")
+                    raise ValueError
+
+                # For minmax constraints, use 0.0 as the right value (unused)
+                spiceypy.gfuds(
+                    as_spice_f,
+                    spiceypy.utils.callbacks.SpiceUDFUNB(is_dec),
+                    operator,
+                    0.0,
+                    0.0,
+                    self.step,
+                    10000,
+                    window.spice_window,
+                    result.spice_window,
+                )
+            else:
+                # For constant comparison constraints
+                right_value = _reference_value(self.constraint)
+
+                spiceypy.gfuds(
+                    as_spice_f,
+                    spiceypy.utils.callbacks.SpiceUDFUNB(is_dec),
+                    self.constraint.operator,
+                    right_value,
+                    0.0,
+                    self.step,
+                    10000,
+                    window.spice_window,
+                    result.spice_window,
                 )
-                runit = lunit
 
-            if runit != target_unit:
-                log.debug(
-                    f"converting right value from {runit} to compute unit {target_unit}",
+        if isinstance(self.constraint, Inverted):
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
+
+        return result
+
+
+@define(repr=False, order=False, eq=False)
+class RangeSolver(BaseSolver):
+    """Solver for ``lower < property < upper`` with a single gfuds search.
+
+    The property is searched as its distance to the middle of the band,
+    ``|value - centre| < half width``, so that both level crossings come out
+    of one stream of callbacks instead of two searches.
+    """
+
+    relative_cost: ClassVar[float] = 20.0
+    routine: ClassVar[str] = "gfuds"
+    default_tolerance: ClassVar[float | None] = None
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        if constraint.ctype != ConstraintTypes.RANGE:
+            return False
+        return constraint.left.type == PropertyTypes.SCALAR
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
+        if not self.constraint or not self.can_solve(self.constraint):
+            log.error("No constraint set or constraint cannot be solved")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        result = SpiceWindow()
+        _record_capacity(result)
+
+        lower, upper = _range_bounds(self.constraint)
+        if upper > lower:
+            centre, half_width = 0.5 * (lower + upper), 0.5 * (upper - lower)
+            left_prop = self.constraint.left
+            evaluator = get_evaluator()
+
+            def offset(t: float) -> float:
+                count("callbacks")
+                return abs(float(evaluator.evaluate_scalar_raw(left_prop, float(t))) - centre)
+
+            offset_f = spiceypy.utils.callbacks.SpiceUDFUNS(offset)
+
+            if evaluator.has_derivative(left_prop):
+                # d|value - centre|/dt has the sign of the derivative above the centre
+                def is_dec(func: spiceypy.utils.callbacks.UDFUNC, t: float) -> bool:
+                    count("callbacks")
+                    count("derivative_callbacks")
+                    side = np.sign(float(evaluator.evaluate_scalar_raw(left_prop, t)) - centre)
+                    return side * evaluator.evaluate_derivative_raw(left_prop, t) < 0.0
+
+            else:
+
+                def is_dec(func: spiceypy.utils.callbacks.UDFUNC, t: float) -> bool:
+                    count("derivative_callbacks")
+                    return spiceypy.uddc(offset_f, t, 1.0)
+
+            with _gf_tolerance(self.tol):
+                spiceypy.gfuds(
+                    offset_f,
+                    spiceypy.utils.callbacks.SpiceUDFUNB(is_dec),
+                    "<",
+                    half_width,
+                    0.0,
+                    self.step,
+                    10000,
+                    window.spice_window,
+                    result.spice_window,
                 )
-                try:
-                    right_value = pint.Quantity(right_value, runit).to(target_unit).magnitude
-                except Exception:
-                    log.warning(f"Unit conversion failed: {runit} → {target_unit}, using raw value")
-
-            spiceypy.gfuds(
-                as_spice_f,
-                spiceypy.utils.callbacks.SpiceUDFUNB(is_dec),
-                self.constraint.operator,
-                right_value,
-                0.0,
-                self.step,
-                10000,
-                window.spice_window,
-                result.spice_window,
+
+        if isinstance(self.constraint, Inverted):
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
+
+        return result
+
+
+@define(repr=False, order=False, eq=False)
+class VectorizedScalarSolver(BaseSolver):
+    """Grid-and-bracket solver for scalar properties compared to a constant.
+
+    Alternative to :class:`GenericScalarSolver` that avoids the per-step
+    Python callbacks of gfuds. The left property is sampled once over the
+    whole window through ``Evaluator.evaluate_vector_raw``, the sign changes
+    of ``value - refval`` are found in NumPy and all the bracketed crossings
+    are refined together by batched bisection.
+
+    Local extrema of the samples that stay on one side of the threshold are
+    refined too (golden section), so that short excursions falling between
+    two grid points are not missed, as gfuds does by checking monotonicity.
+
+    Enabled through ``Config.vectorized_solvers`` or per solve with
+    ``constraint.solve(window, vectorized=True)``.
+    """
+
+    relative_cost: ClassVar[float] = 3.0
+    routine: ClassVar[str] = "vector sampling"
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        if constraint.ctype != ConstraintTypes.COMPARE_TO_CONSTANT:
+            return False
+        if constraint.operator not in [">", "<", "="]:
+            return False
+        return constraint.left.type == PropertyTypes.SCALAR
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
+        if not self.constraint:
+            log.error("No constraint set")
+            raise ValueError
+
+        if not self.can_solve(self.constraint):
+            log.error("Constraint not solvable")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        times, offsets = sample_grid(window.to_et_array(), self.step)
+        raw = get_evaluator().evaluate_vector_raw(self.constraint.left, times)
+        count("vector_samples", len(times))
+        log.debug("Sampled {} on {} points", self.constraint.left, len(times))
+
+        return self.solve_sampled(window, times, offsets, raw)
+
+    def solve_sampled(
+        self,
+        window: SpiceWindow,
+        times: np.ndarray,
+        offsets: np.ndarray,
+        raw: np.ndarray,
+    ) -> SpiceWindow:
+        """Solve from *raw* values of the left property sampled on ``sample_grid(window)``.
+
+        Lets constraints on the same property share one evaluation of the grid
+        (see :func:`~spice_segmenter.constraint_solver.batch.solve_many`).
+        """
+        from ..engines.evaluator import get_evaluator
+
+        evaluator = get_evaluator()
+        left_prop = self.constraint.left
+        refval = float(_reference_value(self.constraint))
+        sign = -1.0 if self.constraint.operator == "<" else 1.0
+
+        def search_function(times: np.ndarray) -> np.ndarray:
+            # positive wherever the constraint holds (for "=", above the threshold)
+            count("vector_samples", len(times))
+            raw = np.asarray(evaluator.evaluate_vector_raw(left_prop, times), dtype=np.float64)
+            return sign * (raw - refval)
+
+        def state(times: np.ndarray) -> np.ndarray:
+            return search_function(times) > 0
+
+        values = sign * (np.asarray(raw, dtype=np.float64) - refval)
+        mask = values > 0
+
+        # sign changes between consecutive samples of the same grid
+        change = state_changes(mask, offsets)
+        toggles = [
+            bisect_transitions(state, times[change], times[change + 1], mask[change], self.tol),
+        ]
+
+        # excursions across the threshold starting and ending between two samples:
+        # maxima of the search function where it is negative, minima where positive
+        for maximum in (True, False):
+            idx = local_extrema_brackets(values, offsets, maximum=maximum)
+            quiet = (mask[idx - 1] == mask[idx]) & (mask[idx + 1] == mask[idx]) & (mask[idx] != maximum)
+            idx = idx[quiet]
+
+            t_ext, v_ext = golden_section(
+                search_function, times[idx - 1], times[idx + 1], self.tol, maximize=maximum,
+            )
+            flipped = (v_ext > 0) != mask[idx]
+            idx, t_ext = idx[flipped], t_ext[flipped]
+            log.debug("Found {} crossings between samples", 2 * len(idx))
+
+            toggles.append(bisect_transitions(state, times[idx - 1], t_ext, mask[idx], self.tol))
+            toggles.append(bisect_transitions(state, t_ext, times[idx + 1], ~mask[idx], self.tol))
+
+        crossings = np.sort(np.concatenate(toggles))
+
+        if self.constraint.operator == "=":
+            intervals = np.column_stack([crossings, crossings])
+        else:
+            intervals = assemble_intervals(times, offsets, mask, crossings)
+
+        result = SpiceWindow.from_et_array(intervals)
+
+        if isinstance(self.constraint, Inverted):
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
+
+        return result
+
+
+@define(repr=False, order=False, eq=False)
+class VectorizedBooleanSolver(BaseSolver):
+    """Grid-and-bracket solver for boolean and discrete properties compared to a constant.
+
+    Alternative to :class:`BooleanPropertySolver` that avoids the per-step
+    Python callbacks of gfudb. The property is evaluated on a regular grid
+    with a single vector call (e.g. ``fovtrg_v`` / ``occult_v`` where
+    registered), every flip is located with ``np.diff`` and all transition
+    brackets are refined in lock-step, one vector call per bisection level.
+
+    Also handles discrete properties such as ``Occultation == OccultationTypes.ANY``.
+    """
+
+    relative_cost: ClassVar[float] = 3.0
+    routine: ClassVar[str] = "vector sampling"
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        if constraint.ctype != ConstraintTypes.COMPARE_TO_CONSTANT:
+            return False
+        if constraint.operator not in ["=", "=="]:
+            return False
+        return constraint.left.type in [PropertyTypes.BOOLEAN, PropertyTypes.DISCRETE]
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
+        if not self.constraint:
+            log.error("No constraint set")
+            raise ValueError
+
+        if not self.can_solve(self.constraint):
+            log.error("Constraint not solvable")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        times, offsets = sample_grid(window.to_et_array(), self.step)
+        raw = get_evaluator().evaluate_vector_raw(self.constraint.left, times)
+        count("vector_samples", len(times))
+
+        return self.solve_sampled(window, times, offsets, raw)
+
+    def _matches(self, values: np.ndarray) -> np.ndarray:
+        expected = self.constraint.right.value
+        if self.constraint.left.type == PropertyTypes.BOOLEAN:
+            return np.asarray(values, dtype=bool) == bool(expected)
+        # discrete values (e.g. OccultationTypes) carry their own equality rules
+        return np.array([v == expected for v in values], dtype=bool)
+
+    def solve_sampled(
+        self,
+        window: SpiceWindow,
+        times: np.ndarray,
+        offsets: np.ndarray,
+        raw: np.ndarray,
+    ) -> SpiceWindow:
+        """Solve from *raw* values of the left property sampled on ``sample_grid(window)``.
+
+        Lets constraints on the same property share one evaluation of the grid
+        (see :func:`~spice_segmenter.constraint_solver.batch.solve_many`).
+        """
+        from ..engines.evaluator import get_evaluator
+
+        evaluator = get_evaluator()
+        left_prop = self.constraint.left
+
+        def state(times: np.ndarray) -> np.ndarray:
+            count("vector_samples", len(times))
+            return self._matches(evaluator.evaluate_vector_raw(left_prop, times))
+
+        mask = self._matches(raw)
+
+        change = state_changes(mask, offsets)
+        log.debug("{} on {} points: {} transitions", left_prop, len(times), len(change))
+
+        flips = bisect_transitions(state, times[change], times[change + 1], mask[change], self.tol)
+        result = SpiceWindow.from_et_array(assemble_intervals(times, offsets, mask, flips))
+
+        if isinstance(self.constraint, Inverted):
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
+
+        return result
+
+
+@define(repr=False, order=False, eq=False)
+class VectorizedExtremaSolver(BaseSolver):
+    """Grid-and-Brent solver for the local and global extrema of scalar properties.
+
+    Alternative to :class:`GenericScalarSolver` for min/max constraints. The
+    property is sampled once over the window with a vector call and extrema
+    are bracketed where its derivative changes sign between two samples.
+    With a registered exact derivative the sign change itself is bisected;
+    otherwise the slope comes from a second, offset vector evaluation and the
+    extrema are refined together from the values by a batched Brent search.
+    Global extrema are the best of the local ones and of the window bounds.
+    """
+
+    relative_cost: ClassVar[float] = 3.0
+    routine: ClassVar[str] = "vector sampling"
+
+    finite_difference_step: float = 1.0  # seconds, as uddc in GenericScalarSolver
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        if constraint.ctype != ConstraintTypes.MINMAX:
+            return False
+        return constraint.left.type == PropertyTypes.SCALAR
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
+        if not self.constraint:
+            log.error("No constraint set")
+            raise ValueError
+
+        if not self.can_solve(self.constraint):
+            log.error("Constraint not solvable")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        times, offsets = sample_grid(window.to_et_array(), self.step)
+        raw = get_evaluator().evaluate_vector_raw(self.constraint.left, times)
+        count("vector_samples", len(times))
+
+        return self.solve_sampled(window, times, offsets, raw)
+
+    def find(
+        self,
+        times: np.ndarray,
+        offsets: np.ndarray,
+        raw: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the times of the extrema and the raw values there, from samples on ``sample_grid``."""
+        from ..engines.evaluator import get_evaluator
+
+        evaluator = get_evaluator()
+        left_prop = self.constraint.left
+        operator = self.constraint.operator
+        if operator not in ("local_minimum", "local_maximum", "global_minimum", "global_maximum"):
+            log.error(f"Unknown minmax operator: {operator}")
+            raise ValueError
+        maximum = operator.endswith("maximum")
+
+        def fn(times: np.ndarray) -> np.ndarray:
+            count("vector_samples", len(times))
+            return evaluator.evaluate_vector_raw(left_prop, times)
+
+        values = np.asarray(raw, dtype=np.float64)
+
+        if evaluator.has_derivative(left_prop):
+            # the root of the derivative is located to tol, whereas from the values
+            # alone an extremum is only as sharp as the function is curved
+            def rising(times: np.ndarray) -> np.ndarray:
+                count("derivative_samples", len(times))
+                return np.asarray(evaluator.evaluate_derivative_vector_raw(left_prop, times)) > 0.0
+
+            idx = derivative_sign_changes(
+                np.asarray(evaluator.evaluate_derivative_vector_raw(left_prop, times), dtype=np.float64),
+                offsets,
+                maximum=maximum,
             )
+            count("derivative_samples", len(times))
+            log.debug("{}: refining {} {} brackets", left_prop, len(idx), operator)
+            t_ext = bisect_transitions(rising, times[idx], times[idx + 1], np.full(len(idx), maximum), self.tol)
+            v_ext = np.asarray(fn(t_ext), dtype=np.float64)
+        else:
+            idx = derivative_sign_changes(self._slopes(fn, times, offsets, values), offsets, maximum=maximum)
+            log.debug("{}: refining {} {} brackets", left_prop, len(idx), operator)
+            t_ext, v_ext = brent(fn, times[idx], times[idx + 1], self.tol, maximize=maximum)
+
+        if operator.startswith("global"):
+            bounds = np.concatenate([offsets[:-1], offsets[1:] - 1])
+            t_ext = np.concatenate([t_ext, times[bounds]])
+            v_ext = np.concatenate([v_ext, values[bounds]])
+            if not len(t_ext):
+                return t_ext, v_ext
+            best = np.argmax(v_ext) if maximum else np.argmin(v_ext)
+            return t_ext[[best]], v_ext[[best]]
+
+        return t_ext, v_ext
+
+    def _slopes(
+        self,
+        fn: Callable[[np.ndarray], np.ndarray],
+        times: np.ndarray,
+        offsets: np.ndarray,
+        values: np.ndarray,
+    ) -> np.ndarray:
+        """Finite-difference slope at every sample, with one more vector call.
+
+        Same information gfuds gets from ``uddc`` at every step: it reveals
+        extrema between two samples, or in the first/last step of a grid,
+        that the sampled values alone would not show.
+        """
+        h = np.full(len(times), self.finite_difference_step)
+        h[offsets[1:] - 1] *= -1.0  # stay inside the window at the end of each grid
+        return (np.asarray(fn(times + h), dtype=np.float64) - values) / h
+
+    def solve_sampled(
+        self,
+        window: SpiceWindow,
+        times: np.ndarray,
+        offsets: np.ndarray,
+        raw: np.ndarray,
+    ) -> SpiceWindow:
+        """Solve from *raw* values of the left property sampled on ``sample_grid(window)``."""
+        t_ext, _ = self.find(times, offsets, raw)
+        return SpiceWindow.from_et_array(np.column_stack([t_ext, t_ext]))
+
+
+@define(repr=False, order=False, eq=False)
+class VectorizedRangeSolver(BaseSolver):
+    """Grid-and-bracket solver for ``lower < property < upper``.
+
+    Alternative to :class:`RangeSolver`: the property is sampled once and
+    the crossings of both bounds, between samples or by excursions between
+    two samples, are refined together (see ``vector_search.level_crossings``).
+    """
+
+    relative_cost: ClassVar[float] = 3.0
+    routine: ClassVar[str] = "vector sampling"
+
+    @staticmethod
+    def can_solve(constraint: ConstraintBase) -> bool:
+        return RangeSolver.can_solve(constraint)
+
+    def solve(self, window: SpiceWindow) -> SpiceWindow:
+        from ..engines.evaluator import get_evaluator
+
+        if not self.constraint or not self.can_solve(self.constraint):
+            log.error("No constraint set or constraint cannot be solved")
+            raise ValueError
+
+        if not len(window):
+            return SpiceWindow()
+
+        lower, upper = _range_bounds(self.constraint)
+        if upper <= lower:  # empty band, nothing to sample
+            return window.difference(SpiceWindow()) if isinstance(self.constraint, Inverted) else SpiceWindow()
+
+        times, offsets = sample_grid(window.to_et_array(), self.step)
+        raw = get_evaluator().evaluate_vector_raw(self.constraint.left, times)
+        count("vector_samples", len(times))
+
+        return self.solve_sampled(window, times, offsets, raw)
+
+    def solve_sampled(
+        self,
+        window: SpiceWindow,
+        times: np.ndarray,
+        offsets: np.ndarray,
+        raw: np.ndarray,
+    ) -> SpiceWindow:
+        """Solve from *raw* values of the property sampled on ``sample_grid(window)``."""
+        from ..engines.evaluator import get_evaluator
+
+        evaluator = get_evaluator()
+        left_prop = self.constraint.left
+
+        def fn(times: np.ndarray) -> np.ndarray:
+            count("vector_samples", len(times))
+            return np.asarray(evaluator.evaluate_vector_raw(left_prop, times), dtype=np.float64)
+
+        lower, upper = _range_bounds(self.constraint)
+        if upper > lower:
+            values = np.asarray(raw, dtype=np.float64)
+            above, crossings, _ = level_crossings(fn, times, offsets, values, np.array([lower, upper]), self.tol)
+            # with lower < upper, every crossing of either bound enters or leaves the band
+            inside = above[0] & ~above[1]
+            result = SpiceWindow.from_et_array(assemble_intervals(times, offsets, inside, crossings))
+        else:
+            result = SpiceWindow()
+
+        if isinstance(self.constraint, Inverted):
+            log.debug("INVERTING RESULT")
+            result = window.difference(result)
 
         return result
 
@@ -876,8 +1731,62 @@ class MasterSolver(BaseSolver):
     constraint: ConstraintBase | None = None
     minimum_interval_size: float = 0.0  # seconds
     solver_config: dict = {}
+    # None keeps Config.vectorized_solvers, True/False overrides it for this solve
+    vectorized: bool | None = None
+    # None keeps Config.solver_chunks, an int overrides it for this solve
+    chunks: int | None = None
+    # None keeps Config.cache_results, True/False overrides it for this solve
+    cache: bool | None = None
+    # result of an earlier solve and the window it covered: only the new part
+    # of the window is searched again
+    previous: TimeSegmentsCollection | None = None
+    previous_window: TimeSegmentsCollection | None = None
+    # None keeps Config.profile_solves, True/False overrides it for this solve
+    profile: bool | None = None
+    # None keeps Config.min_event_duration; a duration overrides it for this
+    # solve, and becomes the step
+    min_event_duration: float | None = field(
+        default=None,
+        converter=lambda x: x
+        if isinstance(x, float | int | None)
+        else pd.Timedelta(x).total_seconds(),
+    )
+
+    @property
+    def step(self) -> float:
+        if self.min_event_duration is not None and not (self.constraint and self.constraint.time_step):
+            return self.min_event_duration
+        return super().step
 
     def solve(self, window: TimeSegmentsCollection) -> TimeSegmentsCollection:
+        use_profile = self.profile if self.profile is not None else get_active_config().profile_solves
+        if use_profile and active_profile() is None:
+            with profiling() as profile:
+                result = run_profiled(self, window, self._solve_with_settings)
+            result.profile = profile
+            return result
+
+        # inside a profiled solve (e.g. a chunk or a batch) this is just another node
+        return run_profiled(self, window, self._solve_with_settings)
+
+    def settings(self) -> AbstractContextManager:
+        """Return the context in which the overrides of this solve (vectorized, tol, min_event_duration) apply."""
+        overrides = {}
+        if self.vectorized is not None:
+            overrides["vectorized_solvers"] = self.vectorized
+        if self._tol is not None:
+            # through the config, so that every sub-solver and worker uses it
+            overrides["solver_tolerance"] = self._tol
+        if self.min_event_duration is not None:
+            overrides["min_event_duration"] = self.min_event_duration
+
+        return get_active_config().override(**overrides) if overrides else nullcontext()
+
+    def _solve_with_settings(self, window: TimeSegmentsCollection) -> TimeSegmentsCollection:
+        with self.settings():
+            return self._solve(window)
+
+    def _solve(self, window: TimeSegmentsCollection) -> TimeSegmentsCollection:
         if not self.constraint or not self.can_solve(self.constraint):
             log.error("No constraint set or constraint not solvable")
             raise ValueError
@@ -885,23 +1794,90 @@ class MasterSolver(BaseSolver):
         if not len(window):
             return TimeSegmentsCollection()
 
+        tolerance = get_active_config().solver_tolerance
+
         # Convert to internal SpiceWindow for the SPICE solver chain
         sw = window._to_spice_window()
+
+        use_cache = self.cache if self.cache is not None else get_active_config().cache_results
+        key = self._cache_key(sw) if use_cache else None
+        if key is not None:
+            cached = get_solve_cache().get(key)
+            if cached is not None:
+                log.debug("Solve cache hit for {}", self.constraint)
+                _note(cache="hit")
+                result = TimeSegmentsCollection._from_spice_window(SpiceWindow.from_et_array(cached))
+                result.tolerance = tolerance
+                return result
+
         result_sw = self._solve_spice(sw)
 
         if self.minimum_interval_size > 0.0:
             log.debug("Removing small intervals")
             result_sw.remove_small_intervals(self.minimum_interval_size)
 
-        return TimeSegmentsCollection._from_spice_window(result_sw)
+        if key is not None:
+            get_solve_cache().put(key, result_sw.to_et_array())
+
+        result = TimeSegmentsCollection._from_spice_window(result_sw)
+        result.tolerance = tolerance
+        return result
+
+    def _cache_key(self, window: SpiceWindow) -> str | None:
+        config = get_active_config()
+        min_event_duration = config.min_event_duration
+        settings = {
+            "step": self.step,
+            "minimum_interval_size": self.minimum_interval_size,
+            "solver_config": self.solver_config,
+            "vectorized_solvers": config.vectorized_solvers,
+            "solver_tolerance": config.solver_tolerance,
+            # the pilot sampling of AdaptiveStepSolver can find other events
+            "min_event_duration": None if min_event_duration is None else min_event_duration.total_seconds(),
+        }
+        return cache_key(self.constraint, window.to_et_array(), settings)
 
     def _solve_spice(self, window: SpiceWindow) -> SpiceWindow:
         """Internal solve using the SpiceWindow-based solver chain."""
+        if (self.previous is None) != (self.previous_window is None):
+            log.error("previous and previous_window must be given together")
+            raise ValueError
+
+        if self.previous is not None:
+            if is_chunkable(self.constraint):
+                _note(incremental=True)
+                return solve_incremental(
+                    self._solve_window,
+                    window,
+                    self.previous._to_spice_window(),
+                    self.previous_window._to_spice_window(),
+                    margin=self.step,
+                )
+            log.warning("Constraint needs the whole window (global min/max), solving it all again")
+
+        return self._solve_window(window)
+
+    def _solve_window(self, window: SpiceWindow) -> SpiceWindow:
+        config = get_active_config()
+        chunks = self.chunks if self.chunks is not None else config.solver_chunks
+
+        if chunks > 1:
+            if is_chunkable(self.constraint):
+                log.debug(f"Solving in {chunks} parallel chunks")
+                _note(chunks=chunks)
+                return solve_in_chunks(
+                    self.constraint,
+                    window,
+                    chunks,
+                    step=self.step,
+                    solver_config=self.solver_config,
+                    processes=config.solver_processes,
+                )
+            log.warning("Constraint needs the whole window (global min/max), solving serially")
+
         solver = get_appropriate_solver(self.constraint)
         log.debug(f"Using as solver step size {self.step} seconds")
-        return solver(self.constraint, step=self.step, **self.solver_config).solve(
-            window,
-        )
+        return run_profiled(solver(self.constraint, step=self.step, **self.solver_config), window)
 
     @staticmethod
     def can_solve(constraint: ConstraintBase) -> bool:
@@ -912,18 +1888,46 @@ class MasterSolver(BaseSolver):
 
 # All the known solvers. The MasterSolver goes through this list until it finds an appropriate solver.
 SOLVERS: list[type[BaseSolver]] = [
+    PrunedSolver,
+    AdaptiveStepSolver,
     FovVisibilitySolver,
     SpiceEventSolver,
     SpiceOccultationSolver,
     SpiceWindowSolver,
     BooleanPropertySolver,
     GenericScalarSolver,
+    RangeSolver,
+]
+
+# Solvers relying on per-step Python callbacks into the SPICE GF routines.
+CALLBACK_SOLVERS: list[type[BaseSolver]] = [
+    BooleanPropertySolver,
+    GenericScalarSolver,
+    RangeSolver,
 ]
 
+# Array-based alternatives, tried before the callback solvers when
+# Config.vectorized_solvers is set. Native SPICE solvers keep precedence.
+VECTORIZED_SOLVERS: list[type[BaseSolver]] = [
+    VectorizedScalarSolver,
+    VectorizedBooleanSolver,
+    VectorizedExtremaSolver,
+    VectorizedRangeSolver,
+]
+
+
+def _candidate_solvers() -> list[type[BaseSolver]]:
+    if not get_active_config().vectorized_solvers:
+        return SOLVERS
+
+    native = [s for s in SOLVERS if s not in CALLBACK_SOLVERS]
+    callback = [s for s in SOLVERS if s in CALLBACK_SOLVERS]
+    return native + VECTORIZED_SOLVERS + callback
+
 
 def get_appropriate_solver(constraint: ConstraintBase) -> type[BaseSolver]:
     log.debug(f"Looking for a solver to solve {constraint}")
-    for solver in SOLVERS:
+    for solver in _candidate_solvers():
         if solver.can_solve(constraint):
             log.info(
                 "Selected solver {} for constraint {}, of type {}",
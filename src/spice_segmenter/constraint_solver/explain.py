@@ -0,0 +1,281 @@
+"""Execution plan of a solve, optionally annotated with measurements.
+
+``constraint.explain(window)`` walks the constraint tree the way the solvers
+will: AND/OR chains are flattened and ordered as :class:`SpiceWindowSolver`
+does, and every leaf gets the solver picked by ``get_appropriate_solver``.
+Each node shows that solver, the SPICE routine (native GF search, Python
+callbacks or vector sampling), the effective step and where it comes from,
+whether the property has a dedicated vector function, and the estimated
+cost from the planning module.
+
+With ``analyze=True`` the constraint is also solved with profiling on, and
+the measured wall time, property evaluations and number of intervals are
+attached to the matching plan nodes.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from attrs import define, field
+
+from ..core.constraints import ConstraintBase, ConstraintTypes
+from ..support.config import get_active_config
+from .planning import _has_vector_support, estimate_cost, flatten_operands, order_operands
+
+if TYPE_CHECKING:
+    from ..core.spice_window import SpiceWindow
+    from ..core.time_segments_collection import TimeSegmentsCollection
+    from .profile import ProfileNode, SolveProfile
+
+
+@define(repr=False, order=False, eq=False)
+class PlanNode:
+    """One node of the execution plan."""
+
+    constraint: str
+    label: str
+    solver: str
+    # native (SPICE GF search in C), callback (GF search calling Python at every
+    # step), vectorized (NumPy sampling), adaptive (pilot sampling, then the
+    # search near the thresholds) or windows (combination of the children)
+    path: str
+    routine: str
+    step: float
+    # where the step comes from: the constraint time_step, inherited from a
+    # parent constraint, the step given to solve(), or Config.solver_step
+    step_source: str
+    # the property has a dedicated vector function; None for compound nodes
+    vector_fn: bool | None
+    # estimated cost of the search, in native gfevnt steps over the window
+    cost: float
+    children: list[PlanNode] = field(factory=list)
+    # measured by explain(analyze=True); None when the node did not run
+    wall_time: float | None = None
+    callbacks: int | None = None  # property evaluations from SPICE callbacks
+    samples: int | None = None  # property evaluations of the vectorized solvers
+    intervals: int | None = None
+    notes: dict[str, Any] = field(factory=dict)
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, PlanNode]]:
+        """Yield ``(depth, node)`` for this node and all its descendants."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "constraint": self.constraint,
+            "label": self.label,
+            "solver": self.solver,
+            "path": self.path,
+            "routine": self.routine,
+            "step": self.step,
+            "step_source": self.step_source,
+            "vector_fn": self.vector_fn,
+            "cost": self.cost,
+            "wall_time": self.wall_time,
+            "callbacks": self.callbacks,
+            "samples": self.samples,
+            "intervals": self.intervals,
+            "notes": self.notes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def describe(self) -> str:
+        how = self.routine if self.path == "windows" else f"{self.path} {self.routine}"
+        vector = "" if self.vector_fn is None else f", vector fn: {'yes' if self.vector_fn else 'no'}"
+        text = (
+            f"{self.label} [{self.solver}, {how}, "
+            f"step {self.step:g} s ({self.step_source}){vector}, est. cost {self.cost:.3g}]"
+        )
+        if self.wall_time is not None:
+            text += f" -> {self.wall_time:.3f} s, {self.intervals} intervals"
+            if self.callbacks:
+                text += f", {self.callbacks} callbacks"
+            if self.samples:
+                text += f", {self.samples} samples"
+        for name, value in self.notes.items():
+            text += f", {name}={value}"
+        return text
+
+    def __repr__(self) -> str:
+        return f"<PlanNode {self.solver}: {self.constraint}>"
+
+
+@define(repr=False, order=False, eq=False)
+class Explanation:
+    """Execution plan of a constraint, as returned by ``constraint.explain``."""
+
+    root: PlanNode
+    analyzed: bool = False
+    # solve result and profile, with analyze=True
+    result: TimeSegmentsCollection | None = None
+    profile: SolveProfile | None = None
+
+    def nodes(self) -> Iterator[tuple[int, PlanNode]]:
+        """Yield ``(depth, node)`` for every node, depth first."""
+        yield from self.root.walk()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"analyzed": self.analyzed, "plan": self.root.to_dict()}
+
+    def to_json(self, path: str | Path | None = None, indent: int | None = 2) -> str:
+        """Return the plan as JSON, and write it to *path* if given."""
+        text = json.dumps(self.to_dict(), indent=indent, default=str)
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+    def __str__(self) -> str:
+        return "\n".join(f"{'  ' * depth}{node.describe()}" for depth, node in self.nodes())
+
+    def __repr__(self) -> str:
+        kind = "analyzed plan" if self.analyzed else "plan"
+        return f"<Explanation {kind}, {len(list(self.nodes()))} nodes, est. cost {self.root.cost:.3g}>"
+
+
+def _label(constraint: ConstraintBase) -> str:
+    from ..ops.constraint_operations import Inverted, Pruned
+
+    inner = constraint.parent if isinstance(constraint, Inverted) else constraint
+    if isinstance(inner, Pruned):
+        return "NOT PRUNED" if inner is not constraint else "PRUNED"
+    if constraint.ctype != ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        return str(constraint)
+    name = "AND" if constraint.operator == "&" else "OR"
+    return f"NOT {name}" if isinstance(constraint, Inverted) else name
+
+
+def _path(solver: type) -> str:
+    from .constraint_solver import (
+        CALLBACK_SOLVERS,
+        VECTORIZED_SOLVERS,
+        AdaptiveStepSolver,
+        PrunedSolver,
+        SpiceWindowSolver,
+    )
+
+    if solver in (SpiceWindowSolver, PrunedSolver):
+        return "windows"
+    if solver is AdaptiveStepSolver:
+        return "adaptive"
+    if solver in CALLBACK_SOLVERS:
+        return "callback"
+    if solver in VECTORIZED_SOLVERS:
+        return "vectorized"
+    return "native"
+
+
+def build_plan(
+    constraint: ConstraintBase,
+    window: SpiceWindow,
+    step: float,
+    step_source: str,
+) -> PlanNode:
+    """Return the plan of *constraint*, searched over *window* with the inherited *step*."""
+    from ..ops.constraint_operations import Inverted
+    from .constraint_solver import PrunedSolver, SpiceWindowSolver, get_appropriate_solver
+
+    if constraint.time_step:
+        step = constraint.time_step
+        step_source = "constraint"
+
+    solver = get_appropriate_solver(constraint)
+    node_path = _path(solver)
+    duration = sum(end - start for start, end in window.to_et_array())
+    node = PlanNode(
+        constraint=str(constraint),
+        label=_label(constraint),
+        solver=solver.__name__,
+        path=node_path,
+        routine=solver.routine,
+        step=step,
+        step_source=step_source,
+        vector_fn=None if node_path == "windows" else _has_vector_support(constraint),
+        cost=estimate_cost(constraint, step) * duration,
+    )
+
+    inherited = "parent" if step_source == "constraint" else step_source
+    if solver is SpiceWindowSolver:
+        operands = flatten_operands(constraint)
+        if get_active_config().reorder_operands:
+            operands = order_operands(operands, constraint.operator, window, step)
+        node.children = [build_plan(operand, window, step, inherited) for operand in operands]
+    elif solver is PrunedSolver:
+        # the condition, then the constraint where it holds
+        pruned = constraint.parent if isinstance(constraint, Inverted) else constraint
+        node.children = [build_plan(part, window, step, inherited) for part in (pruned.condition, pruned.parent)]
+
+    return node
+
+
+def _annotate(plan: PlanNode, profile: SolveProfile) -> None:
+    """Attach the measurements of *profile* to the matching nodes of *plan*."""
+    runs: dict[tuple[str, str], list[ProfileNode]] = defaultdict(list)
+    for _, run in profile.nodes():
+        runs[(run.constraint, run.solver)].append(run)
+
+    for _, node in plan.walk():
+        matched = runs.get((node.constraint, node.solver))
+        if not matched:
+            continue  # not run: e.g. AND already empty, cache hit or worker process
+
+        totals: dict[str, int] = defaultdict(int)
+        for run in matched:
+            for _, sub in run.walk():
+                for name, n in sub.counters.items():
+                    totals[name] += n
+
+        node.wall_time = sum(run.wall_time for run in matched)
+        node.intervals = sum(run.window_out for run in matched)
+        node.callbacks = totals["callbacks"] + totals["derivative_callbacks"]
+        node.samples = totals["vector_samples"]
+        if len(matched) > 1:
+            node.notes["runs"] = len(matched)
+
+
+def explain(
+    constraint: ConstraintBase,
+    window: TimeSegmentsCollection,
+    *,
+    analyze: bool = False,
+    **kwargs,
+) -> Explanation:
+    """Return the execution plan of *constraint* over *window*.
+
+    With *analyze*, the constraint is solved and the plan annotated with the
+    measurements.  Other keyword arguments are passed to :class:`MasterSolver`,
+    as for ``solve``; with ``optimize=True`` the plan is the one of the
+    optimized constraint, the tree that is actually solved.
+    """
+    from .constraint_solver import MasterSolver
+
+    constraint = constraint._optimized(kwargs)
+    solver = MasterSolver(constraint=constraint, **kwargs)
+    if constraint.time_step:
+        step_source = "constraint"
+    elif solver.step != get_active_config().solver_step_seconds:
+        step_source = "solver"
+    else:
+        step_source = "config"
+
+    with solver.settings():
+        plan = build_plan(constraint, window._to_spice_window(), solver.step, step_source)
+
+    if not analyze:
+        return Explanation(plan)
+
+    solver.profile = True
+    result = solver.solve(window)
+    _annotate(plan, result.profile)
+    if result.profile is not None:
+        for _, run in result.profile.nodes():
+            if run.notes.get("cache") == "hit":
+                plan.notes["cache"] = "hit"
+
+    return Explanation(plan, analyzed=True, result=result, profile=result.profile)
@@ -0,0 +1,54 @@
+"""Incremental re-solving when the search window grows or shifts.
+
+Given the result of a previous solve and the window it was computed on, only
+the part of the new window not covered by the old one is searched again.  The
+new spans are padded by one solver step so that events close to the seams are
+found with the same context as in a full search; the old intervals are reused
+where the two windows overlap and the pieces are merged by a window union.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+from loguru import logger as log
+
+from ..core.spice_window import SpiceWindow
+
+
+def pad_window(window: SpiceWindow, margin: float) -> SpiceWindow:
+    """Return *window* with every interval extended by *margin* on both sides."""
+    intervals = window.to_et_array()
+    intervals[:, 0] -= margin
+    intervals[:, 1] += margin
+    return SpiceWindow.from_et_array(intervals)
+
+
+def solve_incremental(
+    solve: Callable[[SpiceWindow], SpiceWindow],
+    window: SpiceWindow,
+    previous: SpiceWindow,
+    previous_window: SpiceWindow,
+    margin: float,
+) -> SpiceWindow:
+    """Solve over *window* reusing *previous*, the result obtained over *previous_window*.
+
+    *solve* is only called on the spans of *window* outside *previous_window*,
+    each extended by *margin* (within *window*).
+    """
+    reused_window = window.intersect(previous_window)
+    delta = window.difference(previous_window)
+
+    if not len(delta):
+        log.debug("Window already solved, reusing the previous result")
+        return previous.intersect(window)
+
+    search = pad_window(delta, margin).intersect(window)
+    log.debug(
+        "Incremental solve over {:.0f} s of {:.0f} s",
+        float(np.sum(np.diff(search.to_et_array(), axis=1))),
+        float(np.sum(np.diff(window.to_et_array(), axis=1))),
+    )
+
+    return previous.intersect(reused_window).union(solve(search))
@@ -0,0 +1,90 @@
+"""Solve one property against many thresholds with a single search.
+
+Coverage studies compare the same property with a whole ladder of values
+(``Distance`` below 50k, 100k, 200k, 500k and 1M km, phase angle in 10 deg
+bins...).  Solved one by one, every threshold is a full search over the
+window.  Here the property is sampled once on a regular grid, the local
+extrema of the samples are refined once (they tell which thresholds are
+crossed between two samples), and the crossings of all the thresholds are
+then bisected together, one vector call per bisection level.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from loguru import logger as log
+
+from ..core.spice_window import SpiceWindow
+from ..core.time_segments_collection import TimeSegmentsCollection
+from ..support.config import get_active_config
+from .constraint_solver import BaseSolver, _reference_value
+from .vector_search import assemble_intervals, level_crossings, sample_grid
+
+if TYPE_CHECKING:
+    from ..core.property import Property
+
+
+def solve_level_sets(
+    prop: Property,
+    thresholds: Iterable[Any],
+    window: TimeSegmentsCollection,
+    *,
+    operator: str = "<",
+    step: float | None = None,
+    tol: float | None = None,
+) -> dict[Any, TimeSegmentsCollection]:
+    """Solve ``prop <operator> threshold`` over *window* for every threshold at once.
+
+    *thresholds* are numbers (in the unit of *prop*) or quantities, as on
+    the right of a comparison; *operator* is ``"<"``, ``">"`` or ``"="``.
+    *step* and *tol* default to ``Config.solver_step`` and
+    ``Config.solver_tolerance``.
+
+    Returns one window per threshold, keyed by the thresholds as given.
+    """
+    from ..engines.evaluator import get_evaluator
+
+    if operator not in ("<", ">", "="):
+        raise ValueError(f"Unsupported operator {operator!r}, expected '<', '>' or '='")
+
+    thresholds = list(thresholds)
+    if not thresholds:
+        return {}
+    if not len(window):
+        return {threshold: TimeSegmentsCollection() for threshold in thresholds}
+
+    config = get_active_config()
+    step = step or config.solver_step_seconds
+    if tol is None:
+        tol = config.solver_tolerance if config.solver_tolerance is not None else BaseSolver.default_tolerance
+
+    # work on sign * value so that the searched state is always "above the level"
+    sign = -1.0 if operator == "<" else 1.0
+    levels = sign * np.array([float(_reference_value(prop < threshold)) for threshold in thresholds])
+
+    evaluator = get_evaluator()
+
+    def fn(times: np.ndarray) -> np.ndarray:
+        return sign * np.asarray(evaluator.evaluate_vector_raw(prop, times), dtype=np.float64)
+
+    sw = window._to_spice_window()
+    times, offsets = sample_grid(sw.to_et_array(), step)
+    values = fn(times)
+    log.debug("Sampled {} on {} points for {} thresholds", prop, len(times), len(levels))
+
+    above, crossings, crossing_levels = level_crossings(fn, times, offsets, values, levels, tol)
+    log.debug("Found {} crossings", len(crossings))
+
+    results = {}
+    for j, threshold in enumerate(thresholds):
+        toggles = np.sort(crossings[crossing_levels == j])
+        if operator == "=":
+            intervals = np.column_stack([toggles, toggles])
+        else:
+            intervals = assemble_intervals(times, offsets, above[j], toggles)
+        results[threshold] = TimeSegmentsCollection._from_spice_window(SpiceWindow.from_et_array(intervals))
+
+    return results
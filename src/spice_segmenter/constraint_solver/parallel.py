@@ -0,0 +1,220 @@
+"""Process-parallel chunked solving.
+
+SPICE is not thread-safe, so long searches are parallelised with processes:
+the confinement window is split into time chunks, each chunk (padded by one
+solver step on both sides) is solved in a worker process that furnishes the
+same kernel set as the parent, and the per-chunk results are clipped back to
+their chunk and stitched together.  Intervals that touch at a chunk border are
+merged by the SPICE window insertion itself.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.reduction import ForkingPickler
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import spiceypy
+from loguru import logger as log
+from planetary_coverage.spice.references import AbstractSpiceRef
+
+from ..core.spice_window import SpiceWindow
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+    from ..support.config import Config
+
+
+def _rebuild_spice_ref(cls: type, state: dict[str, Any]) -> AbstractSpiceRef:
+    ref = cls.__new__(cls)
+    ref.__dict__.update(state)
+    return ref
+
+
+def _reduce_spice_ref(ref: AbstractSpiceRef) -> tuple:
+    """Send a SPICE reference to a worker without its cached properties.
+
+    The cache registry of planetary_coverage holds a lambda, which cannot be
+    pickled; the worker computes the cached values again when needed.
+    """
+    state = {
+        key: value
+        for key, value in vars(ref).items()
+        if key not in ("clear_cache", "__cache_registry") and not key.endswith("_cached")
+    }
+    return _rebuild_spice_ref, (type(ref), state)
+
+
+def _register_spice_refs() -> None:
+    # the pickler looks reducers up by exact type
+    pending = [AbstractSpiceRef]
+    while pending:
+        cls = pending.pop()
+        ForkingPickler.register(cls, _reduce_spice_ref)
+        pending += cls.__subclasses__()
+
+
+_register_spice_refs()
+
+
+def loaded_kernels() -> list[str]:
+    """Return the kernels furnished in this process, in load order.
+
+    Kernels loaded through a meta-kernel are skipped: furnishing the
+    meta-kernel again loads them.
+    """
+    kernels = []
+    for i in range(spiceypy.ktotal("ALL")):
+        filename, _ktype, source, _handle = spiceypy.kdata(i, "ALL")
+        if not source:
+            kernels.append(filename)
+    return kernels
+
+
+def _furnish(kernels: list[str]) -> None:
+    """Worker initializer: load the parent kernel pool."""
+    for kernel in kernels:
+        spiceypy.furnsh(kernel)
+
+
+def is_chunkable(constraint: ConstraintBase) -> bool:
+    """Return ``False`` when the result of a chunk depends on the whole window.
+
+    Global minima/maxima are defined over the full confinement window and
+    cannot be found chunk by chunk.
+    """
+    from ..core.constraints import ConstraintBase
+    from ..ops.constraint_operations import MinMaxConstraint, WrappedConstraint
+
+    if isinstance(constraint, MinMaxConstraint):
+        return "global" not in constraint.minmax_type.value
+    if isinstance(constraint, WrappedConstraint):
+        return is_chunkable(constraint.parent)
+
+    return all(
+        is_chunkable(side)
+        for side in (getattr(constraint, "left", None), getattr(constraint, "right", None))
+        if isinstance(side, ConstraintBase)
+    )
+
+
+def clip_intervals(intervals: np.ndarray, start: float, end: float) -> np.ndarray:
+    """Clip an ``(N, 2)`` array of intervals to ``[start, end]``, dropping empty ones."""
+    clipped = np.clip(intervals, start, end)
+    keep = (clipped[:, 1] > clipped[:, 0]) | (
+        (intervals[:, 1] >= start) & (intervals[:, 0] <= end)
+    )
+    return clipped[keep]
+
+
+def split_window(
+    window: SpiceWindow, n_chunks: int, margin: float,
+) -> list[tuple[float, float, np.ndarray]]:
+    """Split *window* in *n_chunks* equal time spans.
+
+    Returns ``(core_start, core_end, padded_intervals)`` for each non-empty
+    chunk, where *padded_intervals* is the part of *window* within
+    ``[core_start - margin, core_end + margin]``.
+    """
+    intervals = window.to_et_array()
+    edges = np.linspace(window.start, window.end, n_chunks + 1)
+
+    chunks = []
+    for core_start, core_end in zip(edges[:-1], edges[1:], strict=True):
+        padded = clip_intervals(intervals, core_start - margin, core_end + margin)
+        if len(padded):
+            chunks.append((float(core_start), float(core_end), padded))
+    return chunks
+
+
+def _solve_chunk(
+    constraint: ConstraintBase,
+    intervals: np.ndarray,
+    step: float,
+    solver_config: dict,
+    config: Config,
+) -> np.ndarray:
+    """Worker task: solve *constraint* on *intervals* and return the result as ETs."""
+    from .constraint_solver import get_appropriate_solver
+
+    with config:
+        solver = get_appropriate_solver(constraint)
+        result = solver(constraint, step=step, **solver_config).solve(
+            SpiceWindow.from_et_array(intervals),
+        )
+    return result.to_et_array()
+
+
+def solve_on_workers(
+    constraints: list[ConstraintBase],
+    windows: list[np.ndarray],
+    *,
+    step: float,
+    solver_config: dict | None = None,
+    processes: int | None = None,
+) -> list[np.ndarray]:
+    """Solve each constraint over the matching ``(N, 2)`` ET array in a process pool.
+
+    Workers furnish the kernels loaded in this process and inherit the active
+    :class:`~spice_segmenter.support.config.Config` (without progress bars).
+    The pool has *processes* workers, by default one per task up to the
+    number of CPUs. Returns the results as ``(N, 2)`` ET arrays, in order.
+    """
+    from ..support.config import get_active_config
+
+    kernels = loaded_kernels()
+    # progress bars from several processes would garble the terminal
+    worker_config = get_active_config().override(show_progressbar=False)
+
+    log.debug(
+        "Solving {} tasks in worker processes, {} kernels furnished per worker",
+        len(constraints),
+        len(kernels),
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=processes or min(len(constraints), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_furnish,
+        initargs=(kernels,),
+    ) as pool:
+        futures = [
+            pool.submit(_solve_chunk, constraint, intervals, step, solver_config or {}, worker_config)
+            for constraint, intervals in zip(constraints, windows, strict=True)
+        ]
+        return [future.result() for future in futures]
+
+
+def solve_in_chunks(
+    constraint: ConstraintBase,
+    window: SpiceWindow,
+    n_chunks: int,
+    *,
+    step: float,
+    solver_config: dict | None = None,
+    processes: int | None = None,
+) -> SpiceWindow:
+    """Solve *constraint* over *window* split in *n_chunks* worker processes.
+
+    Each chunk is padded by one *step* on both sides so that events near the
+    chunk borders are searched with the same context as in a serial search.
+    """
+    chunks = split_window(window, n_chunks, margin=step)
+    log.debug("Solving {} in {} chunks", constraint, len(chunks))
+
+    results = solve_on_workers(
+        [constraint] * len(chunks),
+        [padded for _, _, padded in chunks],
+        step=step,
+        solver_config=solver_config,
+        processes=processes,
+    )
+
+    stitched = [
+        clip_intervals(found, core_start, core_end)
+        for (core_start, core_end, _), found in zip(chunks, results, strict=True)
+    ]
+    return SpiceWindow.from_et_array(np.concatenate(stitched) if stitched else np.empty((0, 2)))
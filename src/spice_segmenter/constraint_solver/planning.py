@@ -0,0 +1,220 @@
+"""Cost and selectivity estimates used to order the operands of compound constraints.
+
+The order in which the two sides of an AND/OR are solved does not change the
+result, but it changes the cost a lot: the first operand is searched over the
+whole window, the second one only over what is left of it.  The exception are
+operands whose result depends on the window they are searched over (global
+minima/maxima, see ``parallel.is_chunkable``): chains containing them are
+solved in the order they were written.  The estimates below are deliberately
+coarse; they only need to rank the operands.
+
+* *cost* is the estimated cost of searching one second of window, derived
+  from the ``relative_cost`` of the solver that would be selected, the search
+  step and whether the property has a dedicated vector function.  Properties
+  calibrated on the loaded kernels (``optimizers.calibrate``) are costed from
+  their measured evaluation time instead.
+* *selectivity* is the estimated fraction of the window where the constraint
+  holds.  Without sampling a neutral prior is used, so the ordering is driven
+  by cost alone; with ``Config.planning_samples`` set, the constraint is
+  evaluated on a coarse grid of that many points.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from loguru import logger as log
+
+from ..core.constraints import ConstraintBase, ConstraintTypes
+from ..support.config import get_active_config
+from .vector_search import sample_grid
+
+if TYPE_CHECKING:
+    from ..core.spice_window import SpiceWindow
+
+# Selectivity assumed for a leaf when it is not sampled.
+PRIOR_SELECTIVITY = 0.5
+
+# Extra cost of evaluating a property through ``np.vectorize(scalar_fn)``
+# instead of a dedicated vector function.
+SCALAR_FALLBACK_PENALTY = 5.0
+
+# Fraction of the pilot steps of ``AdaptiveStepSolver`` assumed close enough to
+# a threshold to be searched at the full step.
+ADAPTIVE_SEARCHED_FRACTION = 0.1
+
+
+def flatten_operands(constraint: ConstraintBase) -> list[ConstraintBase]:
+    """Return the operands of an associative chain of the same operator.
+
+    ``a & b & c`` is built as ``(a & b) & c``; this returns ``[a, b, c]``.
+    Sub-constraints that are inverted, use another operator, carry their own
+    ``time_step`` (which applies to all their operands) or depend on the
+    window they are searched over (global minima/maxima) are kept whole.
+    The inversion of *constraint* itself is not part of the chain and is left
+    to the caller.
+    """
+    from ..ops.constraint_operations import Inverted
+    from .parallel import is_chunkable
+
+    operands = []
+    for side in (constraint.left, constraint.right):
+        if (
+            isinstance(side, ConstraintBase)
+            and side.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT
+            and side.operator == constraint.operator
+            and not isinstance(side, Inverted)
+            and side.time_step is None
+            and is_chunkable(side)
+        ):
+            operands.extend(flatten_operands(side))
+        else:
+            operands.append(side)
+    return operands
+
+
+def _has_vector_support(constraint: ConstraintBase) -> bool:
+    from ..engines.evaluator import get_evaluator
+
+    return get_evaluator().has_vector_fn(constraint.left)
+
+
+def estimate_cost(constraint: ConstraintBase, step: float) -> float:
+    """Estimate the cost of solving *constraint* over one second of window."""
+    from ..ops.constraint_operations import Inverted, Pruned
+    from .constraint_solver import AdaptiveStepSolver, VectorizedScalarSolver, get_appropriate_solver
+
+    pruned = constraint.parent if isinstance(constraint, Inverted) else constraint
+    if isinstance(pruned, Pruned):
+        # the constraint itself is only searched where the condition holds
+        return estimate_cost(pruned.condition, step) + PRIOR_SELECTIVITY * estimate_cost(pruned.parent, step)
+
+    if constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        # in the worst case both operands are searched over the whole window
+        return estimate_cost(constraint.left, step) + estimate_cost(constraint.right, step)
+
+    solver = get_appropriate_solver(constraint)
+    if solver is AdaptiveStepSolver:
+        # pilot samples over the whole window, the usual search near the thresholds
+        pilot = VectorizedScalarSolver.relative_cost / (AdaptiveStepSolver.coarsening * step)
+        inner = AdaptiveStepSolver.inner_solver(constraint)
+        return pilot + ADAPTIVE_SEARCHED_FRACTION * _leaf_cost(constraint, inner, step)
+
+    return _leaf_cost(constraint, solver, constraint.time_step or step)
+
+
+def _leaf_cost(constraint: ConstraintBase, solver: type, step: float) -> float:
+    """Estimate the cost of solving the leaf *constraint* with *solver* over one second of window."""
+    from ..optimizers.calibration import active_cost_model
+    from .constraint_solver import CALLBACK_SOLVERS, VECTORIZED_SOLVERS
+
+    model = active_cost_model()
+    if model is not None and (solver in CALLBACK_SOLVERS or solver in VECTORIZED_SOLVERS):
+        # measured cost of the property evaluations of one step, in native steps
+        measured = model.evaluation_cost(constraint.left, vectorized=solver in VECTORIZED_SOLVERS)
+        if measured is not None:
+            return measured / step
+
+    cost = solver.relative_cost / step
+
+    if solver in VECTORIZED_SOLVERS and not _has_vector_support(constraint):
+        cost *= SCALAR_FALLBACK_PENALTY
+
+    return cost
+
+
+def _prior_selectivity(constraint: ConstraintBase) -> float:
+    from ..ops.constraint_operations import Inverted
+
+    if constraint.ctype != ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        return PRIOR_SELECTIVITY
+
+    left = _prior_selectivity(constraint.left)
+    right = _prior_selectivity(constraint.right)
+    if constraint.operator == "&":
+        selectivity = left * right
+    else:
+        selectivity = 1.0 - (1.0 - left) * (1.0 - right)
+
+    if isinstance(constraint, Inverted):
+        selectivity = 1.0 - selectivity
+    return selectivity
+
+
+def estimate_selectivity(
+    constraint: ConstraintBase,
+    window: SpiceWindow,
+    samples: int = 0,
+) -> float:
+    """Estimate the fraction of *window* where *constraint* holds.
+
+    With ``samples > 0`` the constraint is evaluated on a regular grid of
+    about that many points over *window*; otherwise a prior is returned.
+    The estimate never reaches 0 or 1: a coarse grid can miss short events.
+    """
+    if samples <= 0 or not len(window):
+        return _prior_selectivity(constraint)
+
+    intervals = window.to_et_array()
+    coverage = float(np.sum(intervals[:, 1] - intervals[:, 0]))
+    if coverage <= 0.0:
+        return _prior_selectivity(constraint)
+
+    times, _ = sample_grid(intervals, coverage / samples)
+    try:
+        hits = np.asarray(constraint(times), dtype=bool)
+    except Exception as exc:  # e.g. min/max constraints cannot be sampled pointwise
+        log.debug("Cannot sample {} ({}), using prior selectivity", constraint, exc)
+        return _prior_selectivity(constraint)
+
+    # Laplace smoothing keeps the estimate away from 0 and 1
+    return (float(np.sum(hits)) + 1.0) / (len(hits) + 2.0)
+
+
+def rank(cost: float, selectivity: float, operator: str) -> float:
+    """Rank of an operand in an AND/OR chain, lower runs first.
+
+    For AND the best first operand is cheap and rejects most of the window,
+    for OR it is cheap and accepts most of it (its complement is what is left
+    for the others).
+    """
+    removed = 1.0 - selectivity if operator == "&" else selectivity
+    return cost / max(removed, 1e-9)
+
+
+def order_operands(
+    operands: list[ConstraintBase],
+    operator: str,
+    window: SpiceWindow,
+    step: float,
+) -> list[ConstraintBase]:
+    """Return *operands* of an AND (``&``) or OR (``|``) sorted by increasing rank.
+
+    If one of them depends on the window it is searched over (global
+    minima/maxima), they are returned in the written order: the other
+    operands determine that window.
+    """
+    from .parallel import is_chunkable
+
+    if not all(is_chunkable(operand) for operand in operands):
+        log.debug("Keeping the written order of operands including a global minimum/maximum")
+        return list(operands)
+
+    samples = get_active_config().planning_samples
+
+    ranks = []
+    for operand in operands:
+        cost = estimate_cost(operand, step)
+        selectivity = estimate_selectivity(operand, window, samples)
+        ranks.append(rank(cost, selectivity, operator))
+        log.debug(
+            "Operand {}: cost {:.3g}, selectivity {:.3g}, rank {:.3g}",
+            operand,
+            cost,
+            selectivity,
+            ranks[-1],
+        )
+
+    order = sorted(range(len(operands)), key=lambda i: ranks[i])
+    return [operands[i] for i in order]
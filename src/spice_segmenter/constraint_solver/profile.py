@@ -0,0 +1,219 @@
+"""Execution profile of a solve.
+
+When profiling is enabled (``Config.profile_solves`` or
+``constraint.solve(window, profile=True)``) every solver run is recorded as a
+node of a tree mirroring the constraint tree: the solver picked by
+``get_appropriate_solver``, the step, the number of intervals going in and
+out, the capacity of the result cell, wall and CPU time, and counters of the
+user-function callbacks made by the SPICE GF routines.  The profile is
+attached to the returned window as ``result.profile`` and can be exported as
+JSON or as a Chrome trace (``chrome://tracing``, Perfetto).
+
+Chunks solved in worker processes are recorded as a single node of the
+parent, their callbacks are not counted.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+from attrs import define, field
+
+T = TypeVar("T")
+
+
+@define(repr=False, order=False, eq=False)
+class ProfileNode:
+    """One solver run: a node of the constraint tree."""
+
+    constraint: str
+    solver: str
+    step: float
+    window_in: int
+    window_out: int = 0
+    # size of the SPICE result cell, for the solvers that allocate one
+    capacity: int | None = None
+    start: float = 0.0  # seconds since the start of the profile
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    # callbacks (property evaluations from SPICE), derivative_callbacks
+    # (is_dec), vector_samples (points evaluated by the vectorized solvers)
+    counters: Counter[str] = field(factory=Counter)
+    # anything else worth knowing about the run, e.g. cache hits or chunks
+    notes: dict[str, Any] = field(factory=dict)
+    children: list[ProfileNode] = field(factory=list)
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, ProfileNode]]:
+        """Yield ``(depth, node)`` for this node and all its descendants."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "constraint": self.constraint,
+            "solver": self.solver,
+            "step": self.step,
+            "window_in": self.window_in,
+            "window_out": self.window_out,
+            "capacity": self.capacity,
+            "start": self.start,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "counters": dict(self.counters),
+            "notes": self.notes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def __repr__(self) -> str:
+        return f"<{self.solver} {self.wall_time:.3f} s: {self.constraint}>"
+
+
+@define(repr=False, order=False, eq=False)
+class SolveProfile:
+    """Tree of :class:`ProfileNode` recorded during one solve."""
+
+    roots: list[ProfileNode] = field(factory=list)
+    _origin: float = field(factory=time.perf_counter, init=False)
+
+    @property
+    def wall_time(self) -> float:
+        return sum(root.wall_time for root in self.roots)
+
+    def nodes(self) -> Iterator[tuple[int, ProfileNode]]:
+        """Yield ``(depth, node)`` for every node, depth first."""
+        for root in self.roots:
+            yield from root.walk()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"wall_time": self.wall_time, "nodes": [root.to_dict() for root in self.roots]}
+
+    def to_json(self, path: str | Path | None = None, indent: int | None = 2) -> str:
+        """Return the profile as JSON, and write it to *path* if given."""
+        text = json.dumps(self.to_dict(), indent=indent, default=str)
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+    def to_chrome_trace(self, path: str | Path | None = None) -> dict[str, Any]:
+        """Return the profile in the Chrome trace event format, and write it to *path* if given.
+
+        Every node is a complete ("X") event; nesting follows the constraint tree.
+        """
+        events = [
+            {
+                "name": f"{node.solver}: {node.constraint}",
+                "cat": node.solver,
+                "ph": "X",
+                "ts": node.start * 1e6,
+                "dur": node.wall_time * 1e6,
+                "pid": 0,
+                "tid": 0,
+                "args": {
+                    "depth": depth,
+                    "step": node.step,
+                    "window_in": node.window_in,
+                    "window_out": node.window_out,
+                    "capacity": node.capacity,
+                    "cpu_time": node.cpu_time,
+                    **node.counters,
+                    **node.notes,
+                },
+            }
+            for depth, node in self.nodes()
+        ]
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            Path(path).write_text(json.dumps(trace, default=str))
+        return trace
+
+    def __str__(self) -> str:
+        lines = []
+        for depth, node in self.nodes():
+            calls = ", ".join(f"{name}={n}" for name, n in sorted(node.counters.items()))
+            lines.append(
+                f"{'  ' * depth}{node.solver} [{node.wall_time:.3f} s wall, {node.cpu_time:.3f} s cpu, "
+                f"{node.window_in} -> {node.window_out} intervals{', ' + calls if calls else ''}] "
+                f"{node.constraint}",
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"<SolveProfile {len(list(self.nodes()))} nodes, {self.wall_time:.3f} s>"
+
+
+_profile_var: contextvars.ContextVar[SolveProfile | None] = contextvars.ContextVar(
+    "_profile_var",
+    default=None,
+)
+_node_var: contextvars.ContextVar[ProfileNode | None] = contextvars.ContextVar(
+    "_node_var",
+    default=None,
+)
+
+
+def active_profile() -> SolveProfile | None:
+    """Return the profile being recorded, if any."""
+    return _profile_var.get()
+
+
+def current_node() -> ProfileNode | None:
+    """Return the node of the solver running now, if a profile is being recorded."""
+    return _node_var.get()
+
+
+def count(counter: str, n: int = 1) -> None:
+    """Add *n* to *counter* of the running solver node. Cheap when not profiling."""
+    node = _node_var.get()
+    if node is not None:
+        node.counters[counter] += n
+
+
+@contextmanager
+def profiling() -> Iterator[SolveProfile]:
+    """Record every solver run in the block into a new :class:`SolveProfile`."""
+    profile = SolveProfile()
+    profile_token = _profile_var.set(profile)
+    node_token = _node_var.set(None)
+    try:
+        yield profile
+    finally:
+        _node_var.reset(node_token)
+        _profile_var.reset(profile_token)
+
+
+def run_profiled(solver: Any, window: Any, solve: Callable[[Any], T] | None = None) -> T:
+    """Run ``solve(window)`` (by default ``solver.solve``), recording it as a node of the active profile."""
+    solve = solve or solver.solve
+    profile = _profile_var.get()
+    if profile is None:
+        return solve(window)
+
+    node = ProfileNode(
+        constraint=str(solver.constraint),
+        solver=type(solver).__name__,
+        step=solver.step,
+        window_in=len(window),
+    )
+    parent = _node_var.get()
+    (parent.children if parent is not None else profile.roots).append(node)
+
+    token = _node_var.set(node)
+    wall, cpu = time.perf_counter(), time.process_time()
+    node.start = wall - profile._origin
+    try:
+        result = solve(window)
+    finally:
+        node.wall_time = time.perf_counter() - wall
+        node.cpu_time = time.process_time() - cpu
+        _node_var.reset(token)
+
+    node.window_out = len(result)
+    return result
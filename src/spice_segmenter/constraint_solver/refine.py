@@ -0,0 +1,88 @@
+"""Refine the interval edges of a coarse solve.
+
+A solve with a coarse ``Config.solver_tolerance`` (say one minute) puts each
+edge of the result within that tolerance of the true transition.  Refining
+solves the constraint again with the fine tolerance, but only on short
+neighbourhoods around those edges; the coarse result is kept everywhere else.
+The SPICE GF searches then only run over a few minutes per edge instead of
+over the whole window.
+
+Only the edges are refined: intervals missed by the coarse solve (e.g. shorter
+than its step) stay missed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from loguru import logger as log
+
+from ..core.spice_window import SpiceWindow
+from ..core.time_segments_collection import TimeSegmentsCollection
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+
+# largest default convergence tolerance of the solvers, for results solved
+# without Config.solver_tolerance
+DEFAULT_TOLERANCE = 1e-3  # seconds
+
+
+def edge_neighbourhoods(coarse: SpiceWindow, margin: float) -> SpiceWindow:
+    """Return the union of the ``[edge - margin, edge + margin]`` intervals around every edge of *coarse*."""
+    edges = coarse.to_et_array().ravel()
+    return SpiceWindow.from_et_array(np.column_stack([edges - margin, edges + margin]))
+
+
+def refine(
+    constraint: ConstraintBase,
+    result: TimeSegmentsCollection,
+    tol: float,
+    *,
+    window: TimeSegmentsCollection,
+    margin: float | None = None,
+    **kwargs,
+) -> TimeSegmentsCollection:
+    """Sharpen the edges of *result*, a coarse solve of *constraint* over *window*, to *tol* seconds.
+
+    *margin* is the half width, in seconds, of the neighbourhood searched
+    around each edge; it defaults to twice the tolerance *result* was solved
+    with.  The neighbourhoods are clipped to *window*, so that edges on its
+    bounds stay there.  Other keyword arguments are passed to
+    :class:`MasterSolver`.
+
+    Constraints that are not chunkable (global minima/maxima) are defined over
+    the whole window, not over the neighbourhoods, and raise ValueError.
+    """
+    from .constraint_solver import MasterSolver
+    from .parallel import is_chunkable
+
+    if not is_chunkable(constraint):
+        raise ValueError(f"{constraint} depends on the whole window, solve it with tol={tol} instead of refining")
+
+    coarse = result._to_spice_window()
+    if not len(coarse):
+        return TimeSegmentsCollection()
+
+    if margin is None:
+        coarse_tol = result.tolerance if result.tolerance is not None else DEFAULT_TOLERANCE
+        margin = 2.0 * coarse_tol
+    if margin <= 0:
+        raise ValueError(f"Refinement margin must be positive, got {margin!r}")
+
+    around = edge_neighbourhoods(coarse, margin).intersect(window._to_spice_window())
+
+    log.debug("Refining {} edges of {} to {} s, margin {} s", 2 * len(coarse), constraint, tol, margin)
+    fine = MasterSolver(constraint=constraint, tol=tol, **kwargs).solve(
+        TimeSegmentsCollection._from_spice_window(around),
+    )
+
+    # the coarse result holds away from the edges; pieces meeting at the
+    # border of a neighbourhood are merged back into one interval
+    refined = coarse.difference(around).union(fine._to_spice_window())
+
+    out = TimeSegmentsCollection._from_spice_window(refined)
+    out.tolerance = tol
+    out.profile = fine.profile
+    return out
@@ -0,0 +1,200 @@
+"""Share property samples between the leaves of one solve.
+
+In ``(d < 1e5 & phase < 60) | (d < 5e4 & visible)`` the same property is
+compared in several leaves, and each of them would search it on its own.
+When those leaves go through the vectorized solvers, they are all searched
+on one grid laid over the window of the whole constraint, and a grid point
+evaluated for one leaf is reused by the others on the same property; only
+the window ends and the refinement of each leaf's transitions evaluate the
+property again.  The number of grid evaluations then scales with the
+distinct properties of the tree, not with its leaves, and AND/OR operands
+still only evaluate the grid inside the window left by the previous ones.
+
+Properties are identified by their type, ``instance_id`` and field values,
+so two separately built ``Distance("JUICE", "GANYMEDE")`` are one property.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+import attrs
+import numpy as np
+from attrs import define, field
+from loguru import logger as log
+
+from ..core.constraints import ConstraintBase, ConstraintTypes
+from ..core.property import Property
+from ..core.spice_window import SpiceWindow
+from ..ops.constraint_operations import WrappedConstraint
+from .profile import count
+from .vector_search import sample_grid
+
+if TYPE_CHECKING:
+    from .constraint_solver import BaseSolver
+
+
+def property_key(prop: Property) -> tuple:
+    """Return the identity of *prop*: its type, ``instance_id`` and field values."""
+    values = []
+    if attrs.has(type(prop)):
+        for f in attrs.fields(type(prop)):
+            value = getattr(prop, f.name)
+            if isinstance(value, Property):
+                values.append(property_key(value))
+            elif isinstance(value, np.ndarray):
+                values.append(value.tobytes())
+            else:
+                values.append(repr(value))
+    return type(prop), prop.instance_id, tuple(values)
+
+
+def leaf_constraints(constraint: ConstraintBase) -> Iterable[ConstraintBase]:
+    """Yield the leaves of *constraint*: everything that is not an AND, OR or NOT."""
+    if isinstance(constraint, WrappedConstraint):
+        yield from leaf_constraints(constraint.parent)
+    elif constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT:
+        yield from leaf_constraints(constraint.left)
+        yield from leaf_constraints(constraint.right)
+    else:
+        yield constraint
+
+
+def _pointwise_sampled(solver: type) -> bool:
+    """Whether *solver* solves a pointwise condition from samples (not global extrema)."""
+    from .constraint_solver import VectorizedBooleanSolver, VectorizedRangeSolver, VectorizedScalarSolver
+
+    return solver in (VectorizedScalarSolver, VectorizedBooleanSolver, VectorizedRangeSolver)
+
+
+@define(repr=False, order=False, eq=False)
+class SharedSamples:
+    """Memo of the properties shared by several leaves, on the grid of the whole window.
+
+    Every leaf is searched on the grid points falling inside its own (possibly
+    narrowed) window, plus its end points.  Grid points are evaluated the first
+    time a leaf needs them and reused by the other leaves on the same property.
+    """
+
+    window: SpiceWindow
+    step: float
+    keys: set[tuple]
+    times: np.ndarray = field(init=False)
+    # raw values on the grid by property key, and which of them are evaluated
+    values: dict[tuple, np.ndarray] = field(init=False, factory=dict)
+    known: dict[tuple, np.ndarray] = field(init=False, factory=dict)
+
+    def __attrs_post_init__(self) -> None:
+        self.times, _ = sample_grid(self.window.to_et_array(), self.step)
+
+    def serves(self, solver: BaseSolver) -> bool:
+        """Whether the leaf of *solver* can be solved from the shared samples."""
+        return (
+            _pointwise_sampled(type(solver))
+            and solver.step == self.step
+            and property_key(solver.constraint.left) in self.keys
+        )
+
+    def _grid(self, window: SpiceWindow) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the times and offsets of the grid of *window*, and their index in the shared grid.
+
+        The end points of the intervals are not on the shared grid (index -1).
+        """
+        times, index, offsets = [], [], [0]
+        for start, end in window.to_et_array():
+            inside = np.arange(
+                np.searchsorted(self.times, start, side="right"),
+                np.searchsorted(self.times, end, side="left"),
+            )
+            times += [[start], self.times[inside], [end]]
+            index += [[-1], inside, [-1]]
+            offsets.append(offsets[-1] + len(inside) + 2)
+        return np.concatenate(times), np.concatenate(index).astype(int), np.array(offsets)
+
+    def sample(self, prop: Property, window: SpiceWindow) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(times, offsets, raw)``: *prop* sampled on the grid of *window*, reusing known values."""
+        from ..engines.evaluator import get_evaluator
+
+        key = property_key(prop)
+        times, index, offsets = self._grid(window)
+        on_grid = index >= 0
+        if key in self.known:
+            missing = ~on_grid | ~self.known[key][np.clip(index, 0, None)]
+        else:
+            missing = np.ones(len(times), dtype=bool)
+
+        new = np.asarray(get_evaluator().evaluate_vector_raw(prop, times[missing]))
+        count("vector_samples", len(new))
+        if reused := int((~missing).sum()):
+            count("shared_samples", reused)
+
+        if key not in self.values:
+            self.values[key] = np.empty(len(self.times), dtype=new.dtype)
+            self.known[key] = np.zeros(len(self.times), dtype=bool)
+        stored = missing & on_grid
+        self.values[key][index[stored]] = new[stored[missing]]
+        self.known[key][index[stored]] = True
+
+        raw = np.empty(len(times), dtype=self.values[key].dtype)
+        raw[missing] = new
+        raw[~missing] = self.values[key][index[~missing]]
+        return times, offsets, raw
+
+    def solve(self, solver: BaseSolver, window: SpiceWindow) -> SpiceWindow:
+        """Solve the leaf of *solver* over *window* from the shared samples."""
+        if not len(window):
+            return SpiceWindow()
+        times, offsets, raw = self.sample(solver.constraint.left, window)
+        return solver.solve_sampled(window, times, offsets, raw)
+
+
+_shared_var: ContextVar[SharedSamples | None] = ContextVar("shared_samples", default=None)
+
+
+def active_shared_samples() -> SharedSamples | None:
+    """Return the samples shared by the leaves of the running solve, if any."""
+    return _shared_var.get()
+
+
+def plan_shared_samples(constraint: ConstraintBase, window: SpiceWindow, step: float) -> SharedSamples | None:
+    """Return the samples to share between the leaves of *constraint*, or None if no property is shared.
+
+    Only the leaves that would be solved by sampling, on the grid of *step*,
+    take part: native SPICE searches and callback solvers choose their own
+    evaluation times.
+    """
+    from .constraint_solver import get_appropriate_solver
+
+    keys = Counter(
+        property_key(leaf.left)
+        for leaf in leaf_constraints(constraint)
+        if leaf.time_step in (None, step) and _pointwise_sampled(get_appropriate_solver(leaf))
+    )
+    shared = {key for key, n in keys.items() if n > 1}
+    if not shared:
+        return None
+
+    log.debug(
+        "Sharing the samples of {} properties between {} leaves",
+        len(shared),
+        sum(keys[key] for key in shared),
+    )
+    return SharedSamples(window, step, shared)
+
+
+@contextmanager
+def sharing(shared: SharedSamples | None) -> Iterator[SharedSamples | None]:
+    """Make *shared* the samples of the solves run in the block (no-op for None)."""
+    if shared is None:
+        yield None
+        return
+
+    token = _shared_var.set(shared)
+    try:
+        yield shared
+    finally:
+        _shared_var.reset(token)
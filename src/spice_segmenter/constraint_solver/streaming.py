@@ -0,0 +1,76 @@
+"""Streaming solve: yield the intervals chunk by chunk, in time order.
+
+The window is walked in consecutive time chunks.  Each chunk is padded by
+one solver step on both sides (as for parallel chunked solving), solved, and
+clipped back to its core span.  An interval reaching the end of a chunk may
+continue in the next one, so it is held back until the next chunk shows
+where it ends; every other interval is yielded as soon as its chunk is
+solved.  Only one chunk of results is in memory at a time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from loguru import logger as log
+
+from ..core.spice_window import SpiceWindow
+from ..core.time_segment import TimeSegment
+from ..core.time_segments_collection import TimeSegmentsCollection
+from .parallel import clip_intervals, is_chunkable, split_window
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+
+
+def iter_solve(
+    constraint: ConstraintBase,
+    window: TimeSegmentsCollection,
+    chunk: float | str | pd.Timedelta = "30 days",
+    **kwargs,
+) -> Iterator[TimeSegment]:
+    """Solve *constraint* over *window* one time chunk at a time, yielding the intervals in order.
+
+    *chunk* is the length of the chunks, in seconds or as a timedelta.  Other
+    keyword arguments are passed to :class:`MasterSolver`.
+    """
+    from .constraint_solver import MasterSolver
+
+    length = chunk if isinstance(chunk, float | int) else pd.Timedelta(chunk).total_seconds()
+    if length <= 0:
+        raise ValueError(f"Chunk length must be positive, got {chunk!r}")
+
+    sw = window._to_spice_window()
+    if not len(sw):
+        return
+
+    solver = MasterSolver(constraint=constraint, **kwargs)
+    if is_chunkable(constraint):
+        n_chunks = max(int(np.ceil((sw.end - sw.start) / length)), 1)
+    else:
+        log.warning("Constraint needs the whole window (global min/max), solving it in one chunk")
+        n_chunks = 1
+
+    pending: tuple[float, float] | None = None  # last interval, may continue in the next chunk
+    for i, (core_start, core_end, padded) in enumerate(split_window(sw, n_chunks, margin=solver.step)):
+        log.debug("Solving chunk {} of {}", i + 1, n_chunks)
+        result = solver.solve(TimeSegmentsCollection._from_spice_window(SpiceWindow.from_et_array(padded)))
+        found = clip_intervals(result._to_spice_window().to_et_array(), core_start, core_end)
+
+        for start, end in found:
+            if pending is not None:
+                if start <= pending[1]:
+                    pending = (pending[0], max(end, pending[1]))  # straddles the chunk border
+                    continue
+                yield TimeSegment.from_et(*pending)
+            pending = (start, end)
+
+        if pending is not None and pending[1] < core_end:
+            yield TimeSegment.from_et(*pending)
+            pending = None
+
+    if pending is not None:
+        yield TimeSegment.from_et(*pending)
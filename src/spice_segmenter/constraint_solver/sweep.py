@@ -0,0 +1,168 @@
+"""Solve one constraint template for many SPICE contexts.
+
+A template (a DSL expression, or a constraint converted back to one) is
+instantiated for every combination of observer / target / light-time
+correction.  The leaves of all the resulting constraints are deduplicated
+(a leaf that does not depend on the swept field is the same in every
+context), solved once each across a process pool, and every context is then
+assembled from its leaves with window operations.  A context with a global
+min/max is solved whole instead.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import pandas as pd
+from loguru import logger as log
+
+from ..core.constraints import ConstraintBase
+from ..core.spice_window import SpiceWindow
+from ..core.time_segments_collection import TimeSegmentsCollection
+from ..support.config import _default_window, get_active_config
+from .batch import combine_leaves
+from .cache import constraint_fingerprint
+from .constraint_solver import MasterSolver
+from .parallel import is_chunkable, solve_on_workers
+from .sharing import leaf_constraints
+
+CONTEXT_FIELDS = ("observer", "target", "light_time_correction")
+
+
+def _contexts(
+    contexts: Iterable[Mapping[str, Any]] | None,
+    axes: dict[str, Iterable[Any]],
+) -> list[dict[str, Any]]:
+    if contexts is not None and axes:
+        raise ValueError("Give either explicit contexts or per-field lists, not both")
+
+    if contexts is None:
+        names = list(axes)
+        contexts = [dict(zip(names, values, strict=True)) for values in itertools.product(*axes.values())]
+
+    contexts = [dict(context) for context in contexts]
+    for context in contexts:
+        unknown = set(context) - set(CONTEXT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown context fields {sorted(unknown)}, expected {CONTEXT_FIELDS}")
+    return contexts
+
+
+def sweep(
+    template: str | ConstraintBase,
+    window: TimeSegmentsCollection | None = None,
+    contexts: Iterable[Mapping[str, Any]] | None = None,
+    *,
+    overrides: dict[str, dict[str, Any]] | None = None,
+    step: float | None = None,
+    processes: int | None = None,
+    **axes: Iterable[Any],
+) -> pd.DataFrame:
+    """Solve *template* for every context and return all the intervals in one table.
+
+    Parameters
+    ----------
+    template : str or ConstraintBase
+        A DSL expression (see :func:`~spice_segmenter.io.dsl.parse`), or a
+        constraint whose observer/target/light-time correction are replaced
+        in every context.
+    window : TimeSegmentsCollection, optional
+        Search window. Defaults to the window of the active
+        :class:`~spice_segmenter.support.config.Config`.
+    contexts : iterable of dict, optional
+        Explicit list of :class:`~spice_segmenter.support.context.SpiceContext`
+        overrides, e.g. ``[{"target": "IO"}, {"target": "EUROPA"}]``.
+    overrides : dict, optional
+        Per-property constructor arguments, as for :func:`~spice_segmenter.io.dsl.parse`.
+    step : float, optional
+        Solver step in seconds. Defaults to ``Config.solver_step``.
+    processes : int, optional
+        Size of the worker pool. ``1`` solves in this process; ``None`` uses
+        one process per distinct leaf (or per constraint with a global
+        min/max), up to the number of CPUs.
+    **axes
+        Alternative to *contexts*: lists of values per context field, swept as
+        a cartesian product, e.g. ``target=["IO", "EUROPA"], observer=[...]``.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per interval, with the context fields followed by ``start``
+        and ``end`` columns.
+
+    Examples
+    --------
+    >>> sweep(
+    ...     "distance < '5000 km' and phase_angle < '30 deg'",
+    ...     window,
+    ...     target=["IO", "EUROPA", "GANYMEDE", "CALLISTO"],
+    ...     observer=["JUICE_JANUS", "JUICE_MAJIS"],
+    ... )
+    """
+    from ..io.dsl import constraint_to_context, constraint_to_expression, parse
+
+    config = get_active_config()
+    window = _default_window(window, "sweep()")
+    step = step or config.solver_step_seconds
+
+    if isinstance(template, ConstraintBase):
+        expression = constraint_to_expression(template)
+        base_context, base_overrides = constraint_to_context(template)
+    else:
+        expression, base_context, base_overrides = template, {}, {}
+    base_overrides = {**base_overrides, **(overrides or {})}
+
+    contexts = [{**base_context, **context} for context in _contexts(contexts, axes)]
+    constraints = [parse(expression, context, base_overrides) for context in contexts]
+
+    # identical leaves across contexts share the same fingerprint; a constraint
+    # with a global min/max is solved whole, its extremum being taken over the
+    # window left by the other operands
+    leaves: dict[str, ConstraintBase] = {}
+    leaf_keys: dict[int, str] = {}
+    for constraint in constraints:
+        for leaf in leaf_constraints(constraint) if is_chunkable(constraint) else [constraint]:
+            key = constraint_fingerprint(leaf) or f"id-{id(leaf)}"
+            leaves.setdefault(key, leaf)
+            leaf_keys[id(leaf)] = key
+
+    log.info("Sweeping {} contexts: {} distinct searches to run", len(contexts), len(leaves))
+
+    sw = window._to_spice_window()
+    if not leaves or not len(sw):
+        solved = {key: SpiceWindow() for key in leaves}
+    elif processes == 1 or len(leaves) == 1:
+        solved = {
+            key: MasterSolver(constraint=leaf, step=step).solve(window)._to_spice_window()
+            for key, leaf in leaves.items()
+        }
+    else:
+        intervals = sw.to_et_array()
+        results = solve_on_workers(
+            list(leaves.values()),
+            [intervals] * len(leaves),
+            step=step,
+            processes=processes,
+        )
+        solved = {key: SpiceWindow.from_et_array(found) for key, found in zip(leaves, results, strict=True)}
+
+    columns = sorted({name for context in contexts for name in context}, key=CONTEXT_FIELDS.index)
+    tables = []
+    for context, constraint in zip(contexts, constraints, strict=True):
+        if is_chunkable(constraint):
+            result = combine_leaves(constraint, sw, lambda leaf: solved[leaf_keys[id(leaf)]])
+        else:
+            result = solved[leaf_keys[id(constraint)]]
+        if not len(result):
+            continue
+
+        table = TimeSegmentsCollection._from_spice_window(result).to_pandas(round_to=None)
+        for name in reversed(columns):
+            table.insert(0, name, context.get(name))
+        tables.append(table)
+
+    if not tables:
+        return pd.DataFrame(columns=[*columns, "start", "end"])
+    return pd.concat(tables, ignore_index=True)
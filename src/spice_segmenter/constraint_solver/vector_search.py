@@ -0,0 +1,502 @@
+"""Grid-and-bracket search primitives working on whole arrays of ETs.
+
+These helpers replace the per-step Python callbacks of the SPICE GF routines
+with a handful of vector evaluations: the search function is sampled once on
+a regular grid covering every interval of the confinement window, transitions
+are located with NumPy, and all brackets are then refined together, one
+vector call per refinement level.
+
+All functions work on plain ``float64`` arrays of SPICE ETs so that they can
+be fed directly to the ``cyice._v`` functions registered in the engine.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+VectorFunction = Callable[[np.ndarray], np.ndarray]
+
+_INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0  # 1 / golden ratio
+_GOLDEN_STEP = 1.0 - _INV_PHI
+_SQRT_EPS = np.sqrt(np.finfo(np.float64).eps)
+
+
+def sample_grid(intervals: np.ndarray, step: float) -> tuple[np.ndarray, np.ndarray]:
+    """Build a regular sampling grid over each ``[start, end]`` interval.
+
+    Every interval gets its own grid that includes both end points, with a
+    spacing never larger than *step*.
+
+    Returns
+    -------
+    times:
+        All grid points, concatenated in time order.
+    offsets:
+        ``len(intervals) + 1`` indices so that ``times[offsets[i]:offsets[i + 1]]``
+        is the grid of the i-th interval.
+    """
+    grids = []
+    for start, end in intervals:
+        n = max(int(np.ceil((end - start) / step)), 1)
+        grids.append(np.linspace(start, end, n + 1))
+
+    if not grids:
+        return np.empty(0, dtype=np.float64), np.zeros(1, dtype=int)
+
+    offsets = np.concatenate([[0], np.cumsum([len(g) for g in grids])])
+    return np.concatenate(grids), offsets
+
+
+def state_changes(mask: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Return the indices *i* where ``mask[i] != mask[i + 1]`` within the same grid."""
+    change = np.flatnonzero(mask[:-1] != mask[1:])
+    return change[~np.isin(change + 1, offsets[1:-1])]
+
+
+def grid_steps(offsets: np.ndarray) -> np.ndarray:
+    """Return the indices *i* of the steps ``[times[i], times[i + 1]]`` within the same grid."""
+    steps = np.arange(max(int(offsets[-1]) - 1, 0))
+    return steps[~np.isin(steps + 1, offsets[1:-1])]
+
+
+def refined_maximum(
+    fn: VectorFunction,
+    times: np.ndarray,
+    offsets: np.ndarray,
+    values: np.ndarray,
+    tol: float,
+) -> float:
+    """Return the largest value of *fn* over the grids, from its *values* sampled on ``sample_grid``.
+
+    The local maxima of the samples are refined with :func:`brent`, so that a
+    peak falling between two samples is found as long as it shows as a local
+    maximum of the samples.  inf is returned if a sample is not finite.
+    """
+    if not len(values):
+        return -np.inf
+    if not np.all(np.isfinite(values)):
+        return np.inf
+    idx = local_extrema_brackets(values, offsets, maximum=True)
+    _, peaks = brent(fn, times[idx - 1], times[idx + 1], tol, maximize=True)
+    return float(max(values.max(), peaks.max(initial=-np.inf)))
+
+
+def uncertain_steps(
+    times: np.ndarray,
+    offsets: np.ndarray,
+    values: np.ndarray,
+    levels: np.ndarray,
+    rate: float,
+) -> np.ndarray:
+    """Return the indices *i* of the grid steps where f may reach one of *levels*.
+
+    With ``|df/dt| <= rate``, f stays within ``(f[i] + f[i + 1] -/+ rate * h) / 2``
+    over a step of length h.  A step where no level is in that range cannot
+    cross a level, even between the samples; the others are returned, as are
+    the steps with a non-finite sample.
+    """
+    steps = grid_steps(offsets)
+    centre = (values[steps] + values[steps + 1]) / 2.0
+    reach = np.maximum(rate * (times[steps + 1] - times[steps]), np.abs(values[steps + 1] - values[steps])) / 2.0
+
+    near = ~np.isfinite(centre)
+    for level in np.atleast_1d(levels):
+        near |= np.abs(centre - level) <= reach
+    return steps[near]
+
+
+def _relative_brackets(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    tol: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(origin, lo, hi, tol)`` for a search on times relative to *lo*.
+
+    The tolerance of each bracket is raised to the spacing of float64 values
+    at *hi*: the ETs cannot be resolved any finer, and a loop on a finer
+    tolerance would never end (about 1.2e-7 s at mission ETs).
+    """
+    origin = np.array(lo, dtype=np.float64)
+    hi = np.array(hi, dtype=np.float64)
+    tol = np.maximum(tol, np.spacing(np.abs(hi)))
+    return origin, np.zeros_like(origin), hi - origin, tol
+
+
+def bisect_transitions(
+    mask_fn: Callable[[np.ndarray], np.ndarray],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    lo_state: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    """Refine all ``[lo, hi]`` brackets of a boolean transition in lock-step.
+
+    *lo_state* is the value of ``mask_fn`` at *lo*; the state at *hi* is
+    assumed to be the opposite one.  At every level a single call to
+    *mask_fn* evaluates the mid points of all the brackets that are still
+    wider than *tol*.
+
+    The brackets are bisected on times relative to *lo*, down to *tol* or to
+    the spacing of float64 ETs at *hi* if larger, so that a *tol* finer than
+    the ETs can resolve still converges.
+
+    Returns the transition times (mid points of the converged brackets).
+    """
+    origin, lo, hi, tol = _relative_brackets(lo, hi, tol)
+    lo_state = np.asarray(lo_state, dtype=bool)
+
+    active = (hi - lo) > tol
+    while np.any(active):
+        mid = 0.5 * (lo[active] + hi[active])
+        same = np.asarray(mask_fn(origin[active] + mid), dtype=bool) == lo_state[active]
+
+        idx = np.flatnonzero(active)
+        lo[idx[same]] = mid[same]
+        hi[idx[~same]] = mid[~same]
+
+        active = (hi - lo) > tol
+
+    return origin + 0.5 * (lo + hi)
+
+
+def bisect_levels(
+    fn: VectorFunction,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    levels: np.ndarray,
+    lo_above: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    """Refine all ``[lo, hi]`` brackets where *fn* crosses its own level, in lock-step.
+
+    Same as :func:`bisect_transitions` with the state ``fn(t) > levels[i]``,
+    each bracket having its own level, so that crossings of several
+    thresholds by the same function are refined together.
+    """
+    origin, lo, hi, tol = _relative_brackets(lo, hi, tol)
+    levels = np.asarray(levels, dtype=np.float64)
+    lo_above = np.asarray(lo_above, dtype=bool)
+
+    active = (hi - lo) > tol
+    while np.any(active):
+        mid = 0.5 * (lo[active] + hi[active])
+        same = (np.asarray(fn(origin[active] + mid), dtype=np.float64) > levels[active]) == lo_above[active]
+
+        idx = np.flatnonzero(active)
+        lo[idx[same]] = mid[same]
+        hi[idx[~same]] = mid[~same]
+
+        active = (hi - lo) > tol
+
+    return origin + 0.5 * (lo + hi)
+
+
+def golden_section(
+    fn: VectorFunction,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    tol: float,
+    *,
+    maximize: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Locate the extremum of *fn* inside every ``[lo, hi]`` bracket at once.
+
+    Each bracket is assumed to contain a single extremum of the requested
+    kind.  Each iteration costs one vector call for all the brackets.  As in
+    :func:`bisect_transitions`, the search runs on times relative to *lo*
+    and stops at the spacing of float64 ETs if *tol* is finer.
+
+    Returns
+    -------
+    times, values:
+        Location of the extrema and the value of *fn* there.
+    """
+    sign = -1.0 if maximize else 1.0
+
+    origin, a, b, tol = _relative_brackets(lo, hi, tol)
+    if not len(a):
+        return origin, origin.copy()
+
+    def f(s: np.ndarray) -> np.ndarray:
+        return sign * np.asarray(fn(origin + s), dtype=np.float64)
+
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc = f(c)
+    fd = f(d)
+
+    while np.any((b - a) > tol):
+        left = fc < fd  # minimum lies in [a, d]
+
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+
+        # reuse the surviving interior point, compute only the new one
+        new_c = b - _INV_PHI * (b - a)
+        new_d = a + _INV_PHI * (b - a)
+        probe = np.where(left, new_c, new_d)
+        fprobe = f(probe)
+
+        c, d, fc, fd = (
+            np.where(left, new_c, d),
+            np.where(left, c, new_d),
+            np.where(left, fprobe, fd),
+            np.where(left, fc, fprobe),
+        )
+
+    times = origin + 0.5 * (a + b)
+    return times, np.asarray(fn(times), dtype=np.float64)
+
+
+def brent(
+    fn: VectorFunction,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    tol: float,
+    *,
+    maximize: bool = False,
+    max_iter: int = 100,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Locate the extremum of *fn* inside every ``[lo, hi]`` bracket at once, with Brent's method.
+
+    Parabolic interpolation through the three best points of each bracket,
+    with a golden-section step whenever the parabola cannot be trusted.  All
+    the brackets advance in lock-step, one vector call per iteration for
+    those not converged yet; smooth extrema converge in a few iterations
+    instead of the ~30 of :func:`golden_section`.
+
+    The search runs on times relative to *lo*, so that the relative precision
+    of large ETs does not swamp *tol*.
+
+    Returns
+    -------
+    times, values:
+        Location of the extrema and the value of *fn* there.
+    """
+    sign = -1.0 if maximize else 1.0
+    origin = np.array(lo, dtype=np.float64)
+    b = np.array(hi, dtype=np.float64) - origin
+    a = np.zeros_like(b)
+    if not len(a):
+        return origin, origin.copy()
+
+    def f(idx: np.ndarray, s: np.ndarray) -> np.ndarray:
+        return sign * np.asarray(fn(origin[idx] + s), dtype=np.float64)
+
+    x = w = v = a + _GOLDEN_STEP * (b - a)
+    fx = f(np.arange(len(a)), x)
+    fw, fv = fx.copy(), fx.copy()
+    w, v = w.copy(), v.copy()
+    d = np.zeros_like(a)  # last step
+    e = np.zeros_like(a)  # step before the last one
+
+    for _ in range(max_iter):
+        m = 0.5 * (a + b)
+        tol1 = _SQRT_EPS * np.abs(x) + tol / 3.0
+        active = np.abs(x - m) > 2.0 * tol1 - 0.5 * (b - a)
+        if not np.any(active):
+            break
+
+        i = np.flatnonzero(active)
+        ai, bi, xi, wi, vi, mi, t1 = a[i], b[i], x[i], w[i], v[i], m[i], tol1[i]
+        fxi, fwi, fvi, di, ei = fx[i], fw[i], fv[i], d[i], e[i]
+
+        # parabola through (x, fx), (w, fw), (v, fv)
+        r = (xi - wi) * (fxi - fvi)
+        q = (xi - vi) * (fxi - fwi)
+        p = (xi - vi) * q - (xi - wi) * r
+        q = 2.0 * (q - r)
+        p = np.where(q > 0.0, -p, p)
+        q = np.abs(q)
+
+        parabolic = (
+            (np.abs(ei) > t1)
+            & (np.abs(p) < np.abs(0.5 * q * ei))
+            & (p > q * (ai - xi))
+            & (p < q * (bi - xi))
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_para = np.where(parabolic, p / np.where(q == 0.0, 1.0, q), 0.0)
+        u_para = xi + d_para
+        # do not evaluate too close to the bracket ends
+        near_end = (u_para - ai < 2.0 * t1) | (bi - u_para < 2.0 * t1)
+        d_para = np.where(near_end, np.copysign(t1, mi - xi), d_para)
+
+        e_golden = np.where(xi >= mi, ai - xi, bi - xi)
+        e[i] = np.where(parabolic, di, e_golden)
+        di = np.where(parabolic, d_para, _GOLDEN_STEP * e_golden)
+        d[i] = di
+
+        u = xi + np.where(np.abs(di) >= t1, di, np.copysign(t1, di))
+        fu = f(i, u)
+
+        better = fu <= fxi
+        a[i] = np.where(better, np.where(u >= xi, xi, ai), np.where(u < xi, u, ai))
+        b[i] = np.where(better, np.where(u >= xi, bi, xi), np.where(u < xi, bi, u))
+
+        # keep x the best point, w the second best and v the previous w
+        second = ~better & ((fu <= fwi) | (wi == xi))
+        third = ~better & ~second & ((fu <= fvi) | (vi == xi) | (vi == wi))
+        v[i] = np.where(better | second, wi, np.where(third, u, vi))
+        fv[i] = np.where(better | second, fwi, np.where(third, fu, fvi))
+        w[i] = np.where(better, xi, np.where(second, u, wi))
+        fw[i] = np.where(better, fxi, np.where(second, fu, fwi))
+        x[i] = np.where(better, u, xi)
+        fx[i] = np.where(better, fu, fxi)
+
+    return origin + x, sign * fx
+
+
+def derivative_sign_changes(
+    derivative: np.ndarray,
+    offsets: np.ndarray,
+    *,
+    maximum: bool,
+) -> np.ndarray:
+    """Return the indices *i* where the sampled *derivative* changes sign within the same grid.
+
+    The extremum is then bracketed by samples ``i`` and ``i + 1``: from
+    positive to non-positive for a maximum, from negative to non-negative
+    for a minimum.
+    """
+    if maximum:
+        change = np.flatnonzero((derivative[:-1] > 0.0) & (derivative[1:] <= 0.0))
+    else:
+        change = np.flatnonzero((derivative[:-1] < 0.0) & (derivative[1:] >= 0.0))
+    return change[~np.isin(change + 1, offsets[1:-1])]
+
+
+def _grid_changes(above: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(level, i)`` for every ``above[level, i] != above[level, i + 1]`` within the same grid."""
+    level, i = np.nonzero(above[:, :-1] != above[:, 1:])
+    inside = ~np.isin(i + 1, offsets[1:-1])
+    return level[inside], i[inside]
+
+
+def level_crossings(
+    fn: VectorFunction,
+    times: np.ndarray,
+    offsets: np.ndarray,
+    values: np.ndarray,
+    levels: np.ndarray,
+    tol: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Locate the crossings of several *levels* by *fn*, sampled as *values* on *times*.
+
+    The crossings between two samples are bracketed per level; the local
+    extrema of the samples are refined once (with :func:`brent`) and tell
+    which levels are crossed by an excursion falling between two samples.
+    All the brackets are then bisected together.
+
+    Returns ``(above, crossings, crossing_levels)``: the ``(levels, samples)``
+    state ``values > level``, the crossing times and the index of the level
+    each of them belongs to.
+    """
+    above = values[None, :] > levels[:, None]
+
+    # crossings between consecutive samples
+    level, i = _grid_changes(above, offsets)
+    lo, hi, lo_above = [times[i]], [times[i + 1]], [above[level, i]]
+    bracket_levels = [level]
+
+    # crossings by excursions falling between samples: every local extremum of
+    # the samples is refined once, then checked against all the levels
+    for maximum in (True, False):
+        idx = local_extrema_brackets(values, offsets, maximum=maximum)
+        t_ext, v_ext = brent(fn, times[idx - 1], times[idx + 1], tol, maximize=maximum)
+
+        state = above[:, idx]
+        quiet = (above[:, idx - 1] == state) & (above[:, idx + 1] == state) & (state != maximum)
+        crossed = quiet & ((v_ext[None, :] > levels[:, None]) != state)
+        level, e = np.nonzero(crossed)
+
+        lo += [times[idx[e] - 1], t_ext[e]]
+        hi += [t_ext[e], times[idx[e] + 1]]
+        lo_above += [state[level, e], ~state[level, e]]
+        bracket_levels += [level, level]
+
+    bracket_levels = np.concatenate(bracket_levels)
+    crossings = bisect_levels(
+        fn,
+        np.concatenate(lo),
+        np.concatenate(hi),
+        levels[bracket_levels],
+        np.concatenate(lo_above),
+        tol,
+    )
+    return above, crossings, bracket_levels
+
+
+def local_extrema_brackets(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    *,
+    maximum: bool,
+) -> np.ndarray:
+    """Return the indices *i* of interior samples that are local extrema.
+
+    The extremum is then bracketed by samples ``i - 1`` and ``i + 1``; on a
+    plateau of equal samples only the first one is reported, so that the
+    extremum is not refined twice.  Samples at the boundary of each grid (as
+    described by *offsets*) are never reported, so brackets never span two
+    distinct window intervals.
+    """
+    if len(values) < 3:
+        return np.empty(0, dtype=int)
+
+    prev_v = values[:-2]
+    mid_v = values[1:-1]
+    next_v = values[2:]
+
+    # a plateau of equal samples is one extremum, reported at its first sample
+    if maximum:
+        is_ext = (mid_v > prev_v) & (mid_v >= next_v)
+    else:
+        is_ext = (mid_v < prev_v) & (mid_v <= next_v)
+
+    idx = np.flatnonzero(is_ext) + 1
+
+    # drop extrema whose bracket would cross a grid boundary
+    grid_id = np.searchsorted(offsets, idx, side="right") - 1
+    inside = (idx - 1 >= offsets[grid_id]) & (idx + 1 < offsets[grid_id + 1])
+    return idx[inside]
+
+
+def assemble_intervals(
+    times: np.ndarray,
+    offsets: np.ndarray,
+    mask: np.ndarray,
+    toggles: np.ndarray,
+) -> np.ndarray:
+    """Build the ``(N, 2)`` array of intervals where the searched state holds.
+
+    *mask* is the state sampled on *times*; *toggles* are the (sorted or not)
+    times at which the state flips.  Each grid starts with the sampled state
+    at its first point and is closed at its last point.
+    """
+    toggles = np.sort(np.asarray(toggles, dtype=np.float64))
+    out: list[tuple[float, float]] = []
+
+    for i in range(len(offsets) - 1):
+        first, last = offsets[i], offsets[i + 1] - 1
+        start, end = times[first], times[last]
+
+        lo = np.searchsorted(toggles, start, side="right")
+        hi = np.searchsorted(toggles, end, side="left")
+        flips = toggles[lo:hi]
+
+        state = bool(mask[first])
+        opened = start if state else None
+        for t in flips:
+            if state:
+                out.append((opened, t))
+            else:
+                opened = t
+            state = not state
+
+        if state:
+            out.append((opened, end))
+
+    return np.array(out, dtype=np.float64).reshape(-1, 2)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import operator as _op
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum, auto
 from functools import singledispatchmethod
 from typing import TYPE_CHECKING, Any, Union
@@ -21,7 +21,10 @@ from .property import Property, PropertyTypes
 from .time_segments_collection import TimeSegmentsCollection
 
 if TYPE_CHECKING:
+    from ..constraint_solver.explain import Explanation
     from ..ops.constraint_operations import Inverted
+    from ..support.search_reporter import SolveEvent
+    from .time_segment import TimeSegment
     from ..support.time_types import TIMES_TYPES
 
 
@@ -41,6 +44,7 @@ class ConstraintTypes(Enum):
     COMPARE_TO_CONSTANT = auto()
     COMPARE_TO_OTHER_CONSTRAINT = auto()
     MINMAX = auto()
+    RANGE = auto()
 
 
 @define(repr=False, order=False, eq=False)
@@ -127,6 +131,34 @@ class ConstraintBase(Property):
         optimize : bool, optional
             If True, apply constraint optimizations before solving.
             Default is False.
+        vectorized : bool, optional
+            If True, scalar and boolean constraints are solved on a vector-sampled
+            grid instead of through gfuds/gfudb callbacks; if False, the callback solvers
+            are forced. Default (None) follows ``Config.vectorized_solvers``.
+        chunks : int, optional
+            Split the window into this many time chunks solved in parallel worker
+            processes. Default (None) follows ``Config.solver_chunks``.
+        cache : bool, optional
+            Reuse (and store) the result from the solve cache. Default (None)
+            follows ``Config.cache_results``.
+        previous, previous_window : TimeSegmentsCollection, optional
+            Result of an earlier solve of this constraint and the window it was
+            solved on. Only the part of the window outside *previous_window* is
+            searched (padded by one step); the previous intervals are reused elsewhere.
+        profile : bool, optional
+            Record an execution profile of the solve (solver picked per node,
+            wall/CPU time, callback counts, window sizes), attached to the result
+            as ``result.profile``. Default (None) follows ``Config.profile_solves``.
+        tol : float, optional
+            Convergence tolerance of the interval edges, in seconds. A coarse
+            tolerance gives a fast first pass, see :meth:`refine`. Default (None)
+            follows ``Config.solver_tolerance``.
+        min_event_duration : float or str, optional
+            Shortest interval, or gap between intervals, that must be found,
+            in seconds or as a duration string. It is used as the step, and
+            distance constraints are only searched at that step where the
+            distance can reach its threshold. Default (None) follows
+            ``Config.min_event_duration``.
         **kwargs
             Additional keyword arguments passed to MasterSolver.
 
@@ -163,30 +195,159 @@ class ConstraintBase(Property):
         ...     window,
         ...     optimize=True,
         ... )  # enable optimizer
+        >>> constraint.solve(
+        ...     extended_window,
+        ...     previous=result,
+        ...     previous_window=window,
+        ... )  # only solve what was added to the window
+        >>> result = constraint.solve(window, profile=True)
+        >>> result.profile.to_chrome_trace("solve_trace.json")  # where did the time go
+        >>> coarse = constraint.solve(window, tol=60)  # edges to the minute
+        >>> flybys = constraint.solve(window, min_event_duration="10 min")  # no step to pick
         >>> with Config(
         ...     start="2033-01-01",
         ...     end="2033-12-31",
         ... ):
         ...     constraint.solve()  # uses default window from context
         """
-        from ..support.config import get_active_config
+        from ..support.config import _default_window
 
         if end is not None:
             # Two-positional-arg form: solve(start, end)
             return self._solve_dispatch(arg, end, **kwargs)
 
-        if arg is None:
-            cfg = get_active_config()
-            if cfg.start is None or cfg.end is None:
-                raise RuntimeError(
-                    "solve() called without a window and no default window is set. "
-                    "Either pass a window explicitly or activate a context:\n\n"
-                    "    with Config(start='2032-01-01', end='2035-01-01'):\n"
-                    "        constraint.solve()\n",
-                )
-            arg = TimeSegmentsCollection.from_start_end(cfg.start, cfg.end)
+        return self._solve_dispatch(_default_window(arg, "solve()"), **kwargs)
+
+    async def solve_async(
+        self,
+        window: TimeSegmentsCollection | None = None,
+        *,
+        on_event: Callable[[SolveEvent], Any] | None = None,
+        **kwargs,
+    ) -> TimeSegmentsCollection:
+        """
+        Solve the constraint in a worker process, without blocking the event loop.
+
+        Parameters
+        ----------
+        window : TimeSegmentsCollection, optional
+            Search window. Defaults to the window of the active
+            :class:`~spice_segmenter.support.config.Config`.
+        on_event : callable, optional
+            Function or coroutine function receiving
+            :class:`~spice_segmenter.support.search_reporter.SolveEvent` objects
+            (fraction done, intervals found so far) while the search runs.
+        optimize : bool, optional
+            If True, apply constraint optimizations before solving.
+        progress_chunks : int, optional
+            Number of consecutive time chunks the window is searched in (default 20).
+        grace : float, optional
+            Seconds left to the worker to bail out when the task is cancelled,
+            before it is terminated (default 5).
+        **kwargs
+            Additional keyword arguments passed to MasterSolver.
+
+        Examples
+        --------
+        >>> task = asyncio.create_task(
+        ...     constraint.solve_async(window, on_event=print)
+        ... )
+        >>> task.cancel()  # interrupts the running GF search
+        """
+        from ..constraint_solver.async_solve import solve_async
+        from ..support.config import _default_window
+
+        window = _default_window(window, "solve_async()")
+        return await solve_async(self._optimized(kwargs), window, on_event=on_event, **kwargs)
+
+    def iter_solve(
+        self,
+        window: TimeSegmentsCollection | None = None,
+        *,
+        chunk: float | str | pd.Timedelta = "30 days",
+        **kwargs,
+    ) -> Iterator[TimeSegment]:
+        """
+        Solve the constraint chunk by chunk, yielding the intervals in time order.
+
+        Each time chunk of the window is solved and its intervals are yielded
+        right away, so that downstream consumers can start before the whole
+        window is searched. Intervals straddling a chunk border are merged
+        before being yielded.
+
+        Parameters
+        ----------
+        window : TimeSegmentsCollection, optional
+            Search window. Defaults to the window of the active
+            :class:`~spice_segmenter.support.config.Config`.
+        chunk : float or str or pd.Timedelta, optional
+            Length of the chunks, in seconds or as a timedelta (default 30 days).
+        optimize : bool, optional
+            If True, apply constraint optimizations before solving.
+        **kwargs
+            Additional keyword arguments passed to MasterSolver.
+
+        Examples
+        --------
+        >>> for segment in constraint.iter_solve(window, chunk="7 days"):
+        ...     writer.writerow([segment.start, segment.end])
+        """
+        from ..constraint_solver.streaming import iter_solve
+        from ..support.config import _default_window
+
+        window = _default_window(window, "iter_solve()")
+        return iter_solve(self._optimized(kwargs), window, chunk, **kwargs)
 
-        return self._solve_dispatch(arg, **kwargs)
+    def refine(
+        self,
+        result: TimeSegmentsCollection,
+        tol: float = 1e-3,
+        *,
+        margin: float | None = None,
+        window: TimeSegmentsCollection | None = None,
+        **kwargs,
+    ) -> TimeSegmentsCollection:
+        """
+        Sharpen the edges of a coarse solve of this constraint.
+
+        The constraint is solved again with tolerance *tol*, but only in small
+        neighbourhoods around the edges of *result*; the coarse intervals are
+        kept everywhere else.
+
+        Parameters
+        ----------
+        result : TimeSegmentsCollection
+            Result of a solve of this constraint with a coarse tolerance.
+        tol : float, optional
+            Convergence tolerance of the refined edges, in seconds (default 1 ms).
+        margin : float, optional
+            Half width of the neighbourhood searched around each edge, in seconds.
+            Defaults to twice the tolerance *result* was solved with.
+        window : TimeSegmentsCollection, optional
+            Window of the coarse solve; edges on its bounds are not moved out of
+            it. Defaults to the window of the active
+            :class:`~spice_segmenter.support.config.Config`.
+        **kwargs
+            Additional keyword arguments passed to MasterSolver.
+
+        Examples
+        --------
+        >>> coarse = constraint.solve(window, tol=60)
+        >>> plan = constraint.refine(coarse, tol=1e-3, window=window)
+        """
+        from ..constraint_solver.refine import refine
+        from ..support.config import _default_window
+
+        return refine(self, result, tol, window=_default_window(window, "refine()"), margin=margin, **kwargs)
+
+    def _optimized(self, kwargs: dict) -> ConstraintBase:
+        """Pop the ``optimize`` flag from the solve *kwargs*; return the constraint to solve."""
+        if not kwargs.pop("optimize", False):
+            return self
+
+        from ..optimizers.constraint_optimizer import optimize_constraint
+
+        return optimize_constraint(self, verbose=True)
 
     @singledispatchmethod
     def _solve_dispatch(self, arg: Any, **kwargs) -> TimeSegmentsCollection:
@@ -208,15 +369,7 @@ class ConstraintBase(Property):
         """Solve with a pre-constructed TimeSegmentsCollection."""
         from ..constraint_solver.constraint_solver import MasterSolver
 
-        optimize = kwargs.pop("optimize", False)
-
-        constraint = self
-        if optimize:
-            from ..optimizers.constraint_optimizer import optimize_constraint
-
-            constraint = optimize_constraint(self, verbose=True)
-
-        solver = MasterSolver(constraint=constraint, **kwargs)
+        solver = MasterSolver(constraint=self._optimized(kwargs), **kwargs)
         return solver.solve(window)
 
     @_solve_dispatch.register(str)
@@ -288,6 +441,47 @@ class ConstraintBase(Property):
         for pre, _fill, node in RenderTree(self.tree()):
             print(f"{pre}{node.name}")
 
+    def explain(
+        self,
+        window: TimeSegmentsCollection | None = None,
+        *,
+        analyze: bool = False,
+        **kwargs,
+    ) -> Explanation:
+        """
+        Show how the constraint would be solved over *window*.
+
+        Every node of the returned plan shows the selected solver, the search
+        path (native SPICE GF routine, Python callbacks, vector sampling or
+        window operations), the effective step and where it comes from, whether
+        the property has a dedicated vector function and an estimated cost, in
+        native gfevnt steps over the window.
+
+        Parameters
+        ----------
+        window : TimeSegmentsCollection, optional
+            Search window. Defaults to the window of the active
+            :class:`~spice_segmenter.support.config.Config`.
+        analyze : bool, optional
+            Also solve the constraint and annotate every node with the measured
+            wall time, callback count and number of intervals found. The result
+            is available as ``explanation.result``.
+        optimize : bool, optional
+            If True, show the plan of the optimized constraint, as solved by
+            ``solve(optimize=True)``.
+        **kwargs
+            Additional keyword arguments passed to MasterSolver, as for :meth:`solve`.
+
+        Examples
+        --------
+        >>> print(constraint.explain(window))
+        >>> print(constraint.explain(window, analyze=True))  # which node ruins the build
+        """
+        from ..constraint_solver.explain import explain
+        from ..support.config import _default_window
+
+        return explain(self, _default_window(window, "explain()"), analyze=analyze, **kwargs)
+
 
 @define(repr=False, order=False, eq=False)
 class Constraint(ConstraintBase):
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from .constraints import Constraint, left_types
 
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from enum import Enum, auto
 
 import numpy as np
@@ -254,13 +254,22 @@ class Property(ABC):
         # Uses evaluate_scalar_raw so SPICE GF callbacks always receive values
         # in the compute_unit (native unit of the registered function), not the
         # user-facing unit.  Solvers convert the refval to compute_unit themselves.
+        from ..constraint_solver.profile import count
         from ..engines.evaluator import get_evaluator
         ev = get_evaluator()
-        return spiceypy.utils.callbacks.SpiceUDFUNS(
-            lambda t: float(ev.evaluate_scalar_raw(self, float(t))),
-        )
+
+        def as_function(t: float) -> float:
+            count("callbacks")
+            return float(ev.evaluate_scalar_raw(self, float(t)))
+
+        return spiceypy.utils.callbacks.SpiceUDFUNS(as_function)
 
     def is_decreasing(self, time: TIMES_TYPES) -> bool:
+        from ..engines.evaluator import get_evaluator
+
+        ev = get_evaluator()
+        if ev.has_derivative(self):
+            return ev.evaluate_derivative_raw(self, float(time)) < 0.0
         return spiceypy.uddc(self.compute_as_spice_function(), time, self.dt)  # type: ignore
 
     def is_decreasing_as_spice_function(self) -> UDFUNB:
@@ -375,6 +384,7 @@ class Property(ABC):
         window: TimeSegmentsCollection = None,
         *,
         evaluate: bool = True,
+        vectorized: bool | None = None,
     ) -> TimeSegment:  # type: ignore[name-defined]  # noqa: F821
         """Find the global minimum of this property within *window*.
 
@@ -385,6 +395,10 @@ class Property(ABC):
         evaluate:
             If ``True`` (default) the property is evaluated at the result time
             and stored in :attr:`~TimeSegment.value`.
+        vectorized:
+            If ``True``, sample the property with vector calls and refine all
+            the extrema together (batched Brent search) instead of driving
+            ``gfuds``.  Default (``None``) follows ``Config.vectorized_solvers``.
 
         Returns
         -------
@@ -396,22 +410,24 @@ class Property(ABC):
         >>> ca = Distance("JUICE_JANUS", "GANYMEDE").find_minimum(window)
         >>> ca.time, ca.value   # timestamp and distance in km
         """
-        return self._find_extremum("GLOBAL_MINIMUM", window, evaluate=evaluate)
+        return self._find_extremum("GLOBAL_MINIMUM", window, evaluate=evaluate, vectorized=vectorized)
 
     def find_maximum(
         self,
         window: TimeSegmentsCollection = None,
         *,
         evaluate: bool = True,
+        vectorized: bool | None = None,
     ) -> TimeSegment:
         """Find the global maximum of this property within *window*."""
-        return self._find_extremum("GLOBAL_MAXIMUM", window, evaluate=evaluate)
+        return self._find_extremum("GLOBAL_MAXIMUM", window, evaluate=evaluate, vectorized=vectorized)
 
     def find_local_minima(
         self,
         window: TimeSegmentsCollection = None,
         *,
         evaluate: bool = True,
+        vectorized: bool | None = None,
     ) -> TimeSegmentsCollection:
         """Find all local minima of this property within *window*.
 
@@ -423,16 +439,68 @@ class Property(ABC):
         >>> minima = Distance("JUICE_JANUS", "GANYMEDE").find_local_minima(window)
         >>> minima.point_events    # list of point segments
         """
-        return self._find_extrema("LOCAL_MINIMUM", window, evaluate=evaluate)
+        return self._find_extrema("LOCAL_MINIMUM", window, evaluate=evaluate, vectorized=vectorized)
 
     def find_local_maxima(
         self,
         window: TimeSegmentsCollection = None,
         *,
         evaluate: bool = True,
+        vectorized: bool | None = None,
     ) -> TimeSegmentsCollection:
         """Find all local maxima of this property within *window*."""
-        return self._find_extrema("LOCAL_MAXIMUM", window, evaluate=evaluate)
+        return self._find_extrema("LOCAL_MAXIMUM", window, evaluate=evaluate, vectorized=vectorized)
+
+    def level_sets(
+        self,
+        thresholds: Iterable[left_types],
+        window: TimeSegmentsCollection = None,  # type: ignore[name-defined]  # noqa: F821
+        *,
+        operator: str = "<",
+        step: float | None = None,
+        tol: float | None = None,
+    ) -> dict[left_types, TimeSegmentsCollection]:  # type: ignore[name-defined]  # noqa: F821
+        """Solve this property against several thresholds with a single search.
+
+        Equivalent to ``(self < threshold).solve(window)`` for every threshold,
+        but the property is sampled once and all the crossings are refined
+        together, so the cost is about that of one search instead of one per
+        threshold.
+
+        Parameters
+        ----------
+        thresholds:
+            Values to compare against, as numbers in the unit of the property
+            or as quantities.
+        window:
+            Search window as a :class:`~spice_segmenter.core.TimeSegmentsCollection`.
+            Defaults to the window of the active
+            :class:`~spice_segmenter.support.config.Config`.
+        operator:
+            ``"<"`` (default), ``">"`` or ``"="`` (crossing times as point segments).
+        step:
+            Sampling step in seconds. Defaults to ``Config.solver_step``.
+        tol:
+            Convergence tolerance of the crossings, in seconds. Defaults to
+            ``Config.solver_tolerance`` (1 ms when unset).
+
+        Returns
+        -------
+        dict
+            One :class:`~spice_segmenter.core.TimeSegmentsCollection` per
+            threshold, keyed by the thresholds as given.
+
+        Examples
+        --------
+        >>> d = Distance("JUICE", "GANYMEDE")
+        >>> below = d.level_sets([50_000, 100_000, 200_000, 500_000, 1_000_000], window)
+        >>> below[100_000]
+        """
+        from ..constraint_solver.level_sets import solve_level_sets
+        from ..support.config import _default_window
+
+        window = _default_window(window, f"{self.__class__.__name__}.level_sets()")
+        return solve_level_sets(self, thresholds, window, operator=operator, step=step, tol=tol)
 
     def _find_extremum(
         self,
@@ -440,9 +508,10 @@ class Property(ABC):
         window: TimeSegmentsCollection = None,
         *,
         evaluate: bool,
+        vectorized: bool | None = None,
     ) -> TimeSegment:
         """Solve a global min/max condition and return a single point segment."""
-        results = self._find_extrema(condition, window, evaluate=evaluate)
+        results = self._find_extrema(condition, window, evaluate=evaluate, vectorized=vectorized)
         pts = results.point_events
         if not pts:
             raise ValueError(
@@ -461,6 +530,7 @@ class Property(ABC):
         window: TimeSegmentsCollection = None,
         *,
         evaluate: bool,
+        vectorized: bool | None = None,
     ) -> TimeSegmentsCollection:
         """Solve a MinMaxConstraint and return a TimeSegmentsCollection of point segments."""
         from ..ops.constraint_operations import MinMaxConstraint
@@ -483,20 +553,24 @@ class Property(ABC):
 
         cond = MinMaxConditionTypes[condition]
         constraint = MinMaxConstraint(self, cond)
-        raw: TimeSegmentsCollection = constraint.solve(window)
-
-        # Annotate each point segment with property metadata + evaluated value
-        annotated = []
-        for seg in raw:
-            val = float(self(seg.start)) if evaluate else None
-            annotated.append(
-                TimeSegment.at_time(
-                    seg.start,
-                    label=condition.lower().replace("_", " "),
-                    value=val,
-                    property_name=self.name,
-                ),
+        raw: TimeSegmentsCollection = constraint.solve(window, vectorized=vectorized)
+
+        # Annotate each point segment with property metadata + the value,
+        # evaluated at all the extrema with a single vector call
+        values = [None] * len(raw)
+        if evaluate and len(raw):
+            times_et = raw._to_spice_window().to_et_array()[:, 0]
+            values = [float(v) for v in np.asarray(self(times_et), dtype=np.float64)]
+
+        annotated = [
+            TimeSegment.at_time(
+                seg.start,
+                label=condition.lower().replace("_", " "),
+                value=val,
+                property_name=self.name,
             )
+            for seg, val in zip(raw, values, strict=True)
+        ]
         return TimeSegmentsCollection(segments=annotated)
 
     @classmethod
@@ -542,13 +616,17 @@ class BooleanProperty(Property):
         return False
 
     def compute_as_spice_function(self, invert: bool = False) -> UDFUNB:
+        from ..constraint_solver.profile import count
+
         if invert:
             def as_function(udfun, time: TIMES_TYPES) -> bool:
+                count("callbacks")
                 return not self.__call__(time)
 
         else:
 
             def as_function(udfun, time: TIMES_TYPES) -> bool:
+                count("callbacks")
                 return self.__call__(time)
 
         return spiceypy.utils.callbacks.SpiceUDFUNB(as_function)
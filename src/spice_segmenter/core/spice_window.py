@@ -85,6 +85,23 @@ class SpiceWindow:
         window.add_interval(start, end)
         return window
 
+    @classmethod
+    def from_et_array(cls, intervals: np.ndarray) -> SpiceWindow:
+        """Create a SpiceWindow from an ``(N, 2)`` array of ``[start, end]`` ETs"""
+        intervals = np.asarray(intervals, dtype=np.float64).reshape(-1, 2)
+        window = cls(size=max(2 * len(intervals), 10000))
+        for start, end in intervals:
+            spiceypy.wninsd(float(start), float(end), window.spice_window)
+        return window
+
+    def to_et_array(self) -> np.ndarray:
+        """Return the intervals as an ``(N, 2)`` float64 array of ``[start, end]`` ETs"""
+        n = len(self)
+        out = np.empty((n, 2), dtype=np.float64)
+        for i in range(n):
+            out[i] = spiceypy.wnfetd(self.spice_window, i)
+        return out
+
     def to_start_end(self):
         return pd.Timestamp(utc(self.start)), pd.Timestamp(utc(self.end))
 
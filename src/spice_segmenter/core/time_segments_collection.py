@@ -51,6 +51,11 @@ class TimeSegmentsCollection(SegmentsCollectionMixin[TimeSegment]):
     """
 
     _segments_: list[TimeSegment] = field(factory=list, alias="segments")
+    # execution profile of the solve that produced this window, when requested
+    profile: SolveProfile | None = field(default=None, init=False)  # type: ignore[name-defined]  # noqa: F821
+    # Config.solver_tolerance the window was solved with (None: solver defaults),
+    # used by ``constraint.refine`` to size the neighbourhoods of the edges
+    tolerance: float | None = field(default=None, init=False)
 
     # ------------------------------------------------------------------
     # Internal SPICE bridge (not part of the public API)
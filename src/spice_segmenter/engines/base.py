@@ -28,6 +28,8 @@ class ComputationEngine(Protocol):
         *,
         scalar_fn: Callable | None = None,
         vector_fn: Callable | None = None,
+        derivative_fn: Callable | None = None,
+        derivative_vector_fn: Callable | None = None,
         priority: int = 0,
     ) -> None:
         """Register compute functions for *property_class*.
@@ -38,6 +40,10 @@ class ComputationEngine(Protocol):
             property_class: The exact Property subclass to register for.
             scalar_fn: ``fn(prop, time_et: float) -> Any`` for single times.
             vector_fn: ``fn(prop, times_et: ndarray) -> ndarray`` for arrays.
+            derivative_fn: ``fn(prop, time_et: float) -> float``, exact time
+                derivative of the compute function (compute unit per second).
+            derivative_vector_fn: ``fn(prop, times_et: ndarray) -> ndarray``,
+                vectorised variant of *derivative_fn*.
             priority: Higher values are tried first when multiple functions
                 are registered for the same class (e.g. by different backends).
         """
@@ -63,6 +69,30 @@ class ComputationEngine(Protocol):
         """
         ...
 
+    def evaluate_derivative(self, prop: Any, time_et: float) -> float:
+        """Evaluate the time derivative of *prop* at a single SPICE ET.
+
+        Raises:
+            KeyError: If no derivative function is registered for ``type(prop)``.
+        """
+        ...
+
+    def evaluate_derivative_vector(self, prop: Any, times_et: np.ndarray) -> np.ndarray:
+        """Evaluate the time derivative of *prop* at an array of SPICE ETs.
+
+        Raises:
+            KeyError: If no derivative function is registered for ``type(prop)``.
+        """
+        ...
+
+    def has_derivative(self, property_class: type) -> bool:
+        """Return ``True`` if an exact time derivative is registered for *property_class*."""
+        ...
+
     def can_evaluate(self, property_class: type) -> bool:
         """Return ``True`` if *property_class* (or a base) has a scalar fn."""
         ...
+
+    def has_vector_fn(self, property_class: type) -> bool:
+        """Return ``True`` if *property_class* (or a base) has a dedicated vector fn."""
+        ...
@@ -169,6 +169,26 @@ class Evaluator:
         desired = getattr(prop, "unit", None)
         return _apply_unit_conversion(raw, compute_unit, desired)
 
+    def has_vector_fn(self, prop: Property) -> bool:
+        """Return ``True`` if a dedicated vector function is registered for *prop*."""
+        return self._engine.has_vector_fn(type(prop))
+
+    def has_derivative(self, prop: Property) -> bool:
+        """Return ``True`` if an exact time derivative is registered for *prop*."""
+        return self._engine.has_derivative(type(prop))
+
+    def evaluate_derivative_raw(self, prop: Property, time_et: float) -> float:
+        """Evaluate the time derivative of *prop* at a single ET, in *compute_unit* per second.
+
+        Raises:
+            KeyError: when no derivative is registered (see :meth:`has_derivative`).
+        """
+        return self._engine.evaluate_derivative(prop, time_et)
+
+    def evaluate_derivative_vector_raw(self, prop: Property, times_et: np.ndarray) -> np.ndarray:
+        """Evaluate the time derivative of *prop* at an array of ETs, in *compute_unit* per second."""
+        return self._engine.evaluate_derivative_vector(prop, times_et)
+
     # ------------------------------------------------------------------
     # SPICE GF callback wrappers (used by constraint_solver)
     # ------------------------------------------------------------------
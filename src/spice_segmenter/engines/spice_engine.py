@@ -25,6 +25,8 @@ class SpiceEngine:
         engine.register(Distance, scalar_fn=distance_scalar, vector_fn=distance_vector,
                         compute_unit="km")
         engine.register(PhaseAngle, scalar_fn=phase_angle_scalar, compute_unit="rad")
+        engine.register(Distance, derivative_fn=distance_rate_scalar,
+                        derivative_vector_fn=distance_rate_vector)
 
     Registration is order-independent; entries are sorted by *priority* (highest
     first) so that a higher-priority override can replace the default.
@@ -34,6 +36,9 @@ class SpiceEngine:
         # dict[type, list[tuple[int, Callable]]] — sorted descending by priority
         self._scalar_fns: dict[type, list[tuple[int, Callable]]] = {}
         self._vector_fns: dict[type, list[tuple[int, Callable]]] = {}
+        # time derivatives of the compute fns, in compute unit per second
+        self._derivative_fns: dict[type, list[tuple[int, Callable]]] = {}
+        self._derivative_vector_fns: dict[type, list[tuple[int, Callable]]] = {}
         # dict[type, pint.Unit | tuple[pint.Unit, ...]] — unit the registered fn returns
         self._compute_units: dict[type, pint.Unit | tuple] = {}
 
@@ -48,6 +53,8 @@ class SpiceEngine:
         compute_unit: pint.Unit | str | tuple | None = None,
         scalar_fn: Callable | None = None,
         vector_fn: Callable | None = None,
+        derivative_fn: Callable | None = None,
+        derivative_vector_fn: Callable | None = None,
         priority: int = 0,
     ) -> None:
         """Register scalar and/or vector compute functions for *property_class*.
@@ -59,11 +66,17 @@ class SpiceEngine:
 
         At least one of *scalar_fn* / *vector_fn* must be supplied.  Both may
         be provided when a C-level vectorised variant exists.
+
+        *derivative_fn* / *derivative_vector_fn* optionally give the exact time
+        derivative of the compute function (same signatures, result in compute
+        unit per second).  Solvers use it to decide monotonicity instead of
+        finite differences.  A derivative can be registered on its own for a
+        class whose compute functions are already registered.
         """
-        if scalar_fn is None and vector_fn is None:
+        if scalar_fn is None and vector_fn is None and derivative_fn is None and derivative_vector_fn is None:
             raise ValueError(
                 f"register({property_class.__name__}): "
-                "at least one of scalar_fn or vector_fn must be provided.",
+                "at least one of scalar_fn, vector_fn or a derivative fn must be provided.",
             )
 
         # Only store compute_unit if explicitly provided
@@ -87,6 +100,14 @@ class SpiceEngine:
             bucket = self._vector_fns.setdefault(property_class, [])
             bucket.append((priority, vector_fn))
             bucket.sort(key=lambda x: x[0], reverse=True)
+        if derivative_fn is not None:
+            bucket = self._derivative_fns.setdefault(property_class, [])
+            bucket.append((priority, derivative_fn))
+            bucket.sort(key=lambda x: x[0], reverse=True)
+        if derivative_vector_fn is not None:
+            bucket = self._derivative_vector_fns.setdefault(property_class, [])
+            bucket.append((priority, derivative_vector_fn))
+            bucket.sort(key=lambda x: x[0], reverse=True)
 
     def get_compute_unit(self, prop_type: type) -> pint.Unit | tuple | None:
         """Return the compute unit for *prop_type* via MRO walk, or ``None``."""
@@ -113,6 +134,20 @@ class SpiceEngine:
                 return self._vector_fns[cls][0][1]
         return None
 
+    def _lookup_derivative(self, prop_type: type, fns: dict[type, list[tuple[int, Callable]]]) -> Callable | None:
+        """Return the derivative fn for *prop_type*, registered with its compute fn.
+
+        The MRO walk stops at the first class defining compute functions: a
+        subclass computing a different quantity must not inherit the
+        derivative of its parent.
+        """
+        for cls in prop_type.__mro__:
+            if cls in fns:
+                return fns[cls][0][1]
+            if cls in self._scalar_fns or cls in self._vector_fns:
+                return None
+        return None
+
     # ------------------------------------------------------------------
     # Evaluation
     # ------------------------------------------------------------------
@@ -151,9 +186,54 @@ class SpiceEngine:
             lambda t: scalar_fn(prop, t), signature=sig,
         )(times_et)
 
+    def evaluate_derivative(self, prop: Any, time_et: float) -> float:
+        """Evaluate the time derivative of *prop* at a single SPICE ET.
+
+        Falls back to the vector derivative fn over a one-element array.
+
+        Raises:
+            KeyError: when no derivative fn is registered for ``type(prop)``.
+        """
+        fn = self._lookup_derivative(type(prop), self._derivative_fns)
+        if fn is not None:
+            return fn(prop, time_et)
+
+        vector_fn = self._lookup_derivative(type(prop), self._derivative_vector_fns)
+        if vector_fn is None:
+            raise KeyError(type(prop))
+        return float(vector_fn(prop, np.array([time_et]))[0])
+
+    def evaluate_derivative_vector(self, prop: Any, times_et: np.ndarray) -> np.ndarray:
+        """Evaluate the time derivative of *prop* at an array of SPICE ETs.
+
+        Falls back to ``np.vectorize`` over the scalar derivative fn.
+
+        Raises:
+            KeyError: when no derivative fn is registered for ``type(prop)``.
+        """
+        vector_fn = self._lookup_derivative(type(prop), self._derivative_vector_fns)
+        if vector_fn is not None:
+            return vector_fn(prop, times_et)
+
+        scalar_fn = self._lookup_derivative(type(prop), self._derivative_fns)
+        if scalar_fn is None:
+            raise KeyError(type(prop))
+        return np.vectorize(lambda t: scalar_fn(prop, t))(times_et)
+
+    def has_derivative(self, property_class: type) -> bool:
+        """Return ``True`` if an exact time derivative is registered for *property_class*."""
+        return (
+            self._lookup_derivative(property_class, self._derivative_fns) is not None
+            or self._lookup_derivative(property_class, self._derivative_vector_fns) is not None
+        )
+
     def can_evaluate(self, property_class: type) -> bool:
         """Return ``True`` if *property_class* (or any MRO base) has a scalar fn."""
         for cls in property_class.__mro__:
             if cls in self._scalar_fns:
                 return True
         return False
+
+    def has_vector_fn(self, property_class: type) -> bool:
+        """Return ``True`` if *property_class* (or any MRO base) has a dedicated vector fn."""
+        return self._lookup_vector(property_class) is not None
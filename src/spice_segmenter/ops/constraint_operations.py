@@ -6,7 +6,7 @@ from anytree import Node
 from attrs import define, field
 from loguru import logger as log
 
-from ..core.constraints import ConstraintBase, ConstraintTypes
+from ..core.constraints import Constraint, ConstraintBase, ConstraintTypes
 from ..core.property import Property
 from ..properties.observation_properties import (
     MinMaxConditionTypes,
@@ -68,6 +68,24 @@ class Inverted(WrappedConstraint):
         return ~self.parent(time)
 
 
+@define(repr=False, order=False, eq=False)
+class Pruned(WrappedConstraint):
+    """A constraint searched only where a cheaper necessary *condition* holds.
+
+    The *condition* must hold wherever the wrapped constraint does, so that
+    the result is the same as solving the constraint alone; it is built by the
+    optimizer (see ``optimizers.pruning``), not by hand.
+    """
+
+    condition: ConstraintBase = field(kw_only=True)
+
+    def __repr__(self) -> str:
+        return f"{self.parent!r} WHERE {self.condition!r}"
+
+    def tree(self) -> Node:
+        return Node("pruned", children=[self.condition.tree(), self.parent.tree()])
+
+
 @define(repr=False, order=False, eq=False)
 class MinMaxConstraint(ConstraintBase):
     wrapped_property: Property
@@ -121,4 +139,64 @@ class MinMaxConstraint(ConstraintBase):
 
     @property
     def unit(self) -> Any | Iterable:
-        return pint.Unit.dimensionless
+        return pint.Unit("")  # a constraint has no unit, as it returns bools
+
+
+@define(repr=False, order=False, eq=False)
+class RangeConstraint(ConstraintBase):
+    """``lower < property < upper``, searched as a single leaf.
+
+    Both level crossings are found in one search instead of two; it is built
+    by the optimizer from ``(property > lower) & (property < upper)`` (see
+    ``optimizers.ranges``).
+    """
+
+    wrapped_property: Property
+    lower: Property
+    upper: Property
+
+    def __repr__(self) -> str:
+        return f"({self.lower} < {self.wrapped_property} < {self.upper})"
+
+    @property
+    def parts(self) -> tuple[Constraint, Constraint]:
+        """The two comparisons, ``property > lower`` and ``property < upper``."""
+        return (
+            Constraint(self.wrapped_property, self.lower, ">"),
+            Constraint(self.wrapped_property, self.upper, "<"),
+        )
+
+    def __call__(self, time: TIMES_TYPES) -> bool:
+        above, below = self.parts
+        return above(time) & below(time)
+
+    def config(self, config: dict) -> None:
+        self.wrapped_property.config(config)
+        config["operator"] = self.operator
+        config["lower"], config["upper"] = {}, {}
+        self.lower.config(config["lower"])
+        self.upper.config(config["upper"])
+
+    @property
+    def ctype(self) -> ConstraintTypes:
+        return ConstraintTypes.RANGE
+
+    @property
+    def left(self) -> Property | ConstraintBase:
+        return self.wrapped_property
+
+    @property
+    def right(self) -> Property:
+        raise AttributeError("RangeConstraints have two bounds, see lower and upper")
+
+    @property
+    def operator(self) -> str:
+        return "range"
+
+    @property
+    def name(self) -> str:
+        return f"{self}"
+
+    @property
+    def unit(self) -> Any | Iterable:
+        return pint.Unit("")  # a constraint has no unit, as it returns bools
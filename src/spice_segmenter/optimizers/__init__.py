@@ -1,15 +1,21 @@
 """Constraint optimization strategies."""
 
+from .calibration import CostModel, calibrate, get_cost_model
 from .constraint_optimizer import (
     ConstraintOptimizer,
     PropertyTransformer,
     get_optimizer,
     optimize_constraint,
 )
+from .pruning import NecessaryCondition
 
 __all__ = [
     "ConstraintOptimizer",
+    "CostModel",
+    "NecessaryCondition",
     "PropertyTransformer",
+    "calibrate",
+    "get_cost_model",
     "get_optimizer",
     "optimize_constraint",
 ]
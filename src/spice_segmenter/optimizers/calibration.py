@@ -0,0 +1,287 @@
+"""
+Calibrated cost model
+
+The planning module ranks operands with fixed ``relative_cost`` values per
+solver, blind to what the property computes: a boresight intercept driven by
+CK attitude is costed like an SPK-only distance.  :func:`calibrate` runs a
+short benchmark on the loaded kernels and measures, for each property:
+
+- the time of one scalar evaluation, as done by the callback solvers;
+- the time per sample of one vector evaluation, as done by the vectorized
+  solvers;
+
+and, as the unit of all costs, the time of one step of a native gfevnt
+DISTANCE search.  The resulting :class:`CostModel` is kept per kernel
+fingerprint (see ``cache.kernel_fingerprint``), and stored in
+``Config.cache_dir`` when it is set, so that it is reused by later sessions
+with the same kernels.
+
+While ``Config.calibrated_costs`` is on, ``planning.estimate_cost`` uses the
+measured costs for the calibrated properties (operand ordering and
+``explain``), and the optimizer only applies the rewrites and prunings that
+lower the estimated cost.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from attrs import define, field
+from loguru import logger as log
+
+from ..support.config import _default_window, get_active_config
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+    from ..core.property import Property
+    from ..core.time_segments_collection import TimeSegmentsCollection
+
+# Property evaluations per step of the callback solvers: gfuds evaluates the
+# property and its derivative (two more evaluations with uddc) at every step.
+CALLBACK_EVALUATIONS_PER_STEP = 3.0
+
+# models by kernel fingerprint
+_models: dict[str, CostModel] = {}
+
+
+def property_id(prop: Property) -> str:
+    """Return an identifier of *prop* that is stable across sessions."""
+    from ..constraint_solver.cache import _sha256
+    from ..constraint_solver.sharing import property_key
+
+    return f"{type(prop).__qualname__}:{_sha256(repr(property_key(prop)))[:16]}"
+
+
+@define(repr=False, order=False, eq=False)
+class CostModel:
+    """Measured evaluation costs of properties, for one set of loaded kernels."""
+
+    fingerprint: str
+    # seconds per step of a native gfevnt search: the unit of the costs
+    native_step: float
+    # seconds per scalar evaluation and per vector sample, by property_id
+    scalar: dict[str, float] = field(factory=dict)
+    vector: dict[str, float] = field(factory=dict)
+
+    def _measured(self, table: dict[str, float], prop: Property) -> float | None:
+        """Return the measured time of *prop*, or the mean over its class, or None."""
+        key = property_id(prop)
+        if key in table:
+            return table[key]
+        prefix = f"{type(prop).__qualname__}:"
+        same_class = [value for name, value in table.items() if name.startswith(prefix)]
+        return float(np.mean(same_class)) if same_class else None
+
+    def evaluation_cost(self, prop: Property, vectorized: bool) -> float | None:
+        """Return the cost of evaluating *prop* once, in native gfevnt steps, or None if not calibrated.
+
+        For the callback solvers (*vectorized* False) the cost covers the
+        evaluations of one search step, for the vectorized solvers one sample.
+        """
+        if vectorized:
+            seconds = self._measured(self.vector, prop)
+        else:
+            seconds = self._measured(self.scalar, prop)
+            seconds = None if seconds is None else seconds * CALLBACK_EVALUATIONS_PER_STEP
+        return None if seconds is None else seconds / self.native_step
+
+    def update(self, other: CostModel) -> None:
+        """Add the measurements of *other*, taken on the same kernels."""
+        self.native_step = other.native_step
+        self.scalar.update(other.scalar)
+        self.vector.update(other.vector)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "native_step": self.native_step,
+            "scalar": self.scalar,
+            "vector": self.vector,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CostModel:
+        return cls(data["fingerprint"], data["native_step"], dict(data["scalar"]), dict(data["vector"]))
+
+    def __repr__(self) -> str:
+        return (
+            f"<CostModel {self.fingerprint[:12]}: {len(self.scalar)} properties, "
+            f"native step {self.native_step * 1e6:.1f} us>"
+        )
+
+
+def _model_path(fingerprint: str) -> Path | None:
+    directory = get_active_config().cache_dir
+    if not directory:
+        return None
+    return Path(directory).expanduser() / "cost_models" / f"{fingerprint}.json"
+
+
+def get_cost_model() -> CostModel | None:
+    """Return the cost model calibrated for the loaded kernels, or None."""
+    from ..constraint_solver.cache import kernel_fingerprint
+
+    fingerprint = kernel_fingerprint()
+    if fingerprint not in _models:
+        path = _model_path(fingerprint)
+        if path is None or not path.exists():
+            return None
+        _models[fingerprint] = CostModel.from_dict(json.loads(path.read_text()))
+        log.debug("Loaded cost model from {}", path)
+    return _models[fingerprint]
+
+
+def active_cost_model() -> CostModel | None:
+    """Return the cost model to use for planning: None if ``Config.calibrated_costs`` is off."""
+    config = get_active_config()
+    if not config.calibrated_costs:
+        return None
+    if not _models and not config.cache_dir:
+        # nothing calibrated in this session and nothing stored
+        return None
+    return get_cost_model()
+
+
+def _properties(items: Iterable[Property | ConstraintBase]) -> list[Property]:
+    """Return the distinct properties of *items*, with the properties compared by their constraints."""
+    from ..constraint_solver.sharing import leaf_constraints, property_key
+    from ..core.constraints import ConstraintBase
+
+    found: dict[tuple, Property] = {}
+    for item in items:
+        leaves = leaf_constraints(item) if isinstance(item, ConstraintBase) else ()
+        for prop in [leaf.left for leaf in leaves] or [item]:
+            found.setdefault(property_key(prop), prop)
+    return list(found.values())
+
+
+def _time_native_step(prop: Property, start: float, end: float, samples: int) -> float:
+    """Return the seconds per step of a native DISTANCE search between the bodies of *prop*.
+
+    The search is timed with 10 and 100 steps per sample, so that the fixed
+    cost of setting it up cancels out.
+    """
+    from ..constraint_solver.constraint_solver import SpiceEventSolver
+    from ..core.spice_window import SpiceWindow
+    from ..properties.observation_properties import Distance
+
+    distance = Distance(prop.observer.name, prop.target.name, light_time_correction="NONE") > "0 km"
+    window = SpiceWindow()
+    window.add_interval(start, end)
+
+    timings = []
+    for steps in (10 * samples, 100 * samples):
+        solver = SpiceEventSolver(distance, step=(end - start) / steps)
+        tic = time.perf_counter()
+        solver.solve(window)
+        timings.append(time.perf_counter() - tic)
+    return max(timings[1] - timings[0], 1e-9) / (90 * samples)
+
+
+def _time_evaluations(prop: Property, times: np.ndarray, calls: int) -> tuple[float | None, float | None]:
+    """Return the seconds per scalar evaluation and per vector sample of *prop* (None if it fails)."""
+    from ..engines.evaluator import get_evaluator
+
+    evaluator = get_evaluator()
+    scalar = vector = None
+    try:
+        evaluator.evaluate_scalar_raw(prop, float(times[0]))  # warm up
+        at = times[:: max(len(times) // calls, 1)][:calls]
+        tic = time.perf_counter()
+        for t in at:
+            evaluator.evaluate_scalar_raw(prop, float(t))
+        scalar = (time.perf_counter() - tic) / len(at)
+    except Exception as e:
+        log.warning(f"Cannot time the scalar evaluation of {prop}: {e}")
+
+    try:
+        tic = time.perf_counter()
+        evaluator.evaluate_vector_raw(prop, times)
+        vector = (time.perf_counter() - tic) / len(times)
+    except Exception as e:
+        log.warning(f"Cannot time the vector evaluation of {prop}: {e}")
+
+    return scalar, vector
+
+
+def calibrate(
+    *items: Property | ConstraintBase,
+    window: TimeSegmentsCollection | None = None,
+    samples: int = 500,
+    calls: int = 100,
+    persist: bool = True,
+) -> CostModel:
+    """Measure the evaluation costs of properties on the loaded kernels.
+
+    Parameters
+    ----------
+    items : Property or ConstraintBase
+        Properties to calibrate; for constraints, the properties they compare.
+    window : TimeSegmentsCollection, optional
+        Times at which the properties are evaluated; defaults to the
+        ``Config.start``/``Config.end`` window.
+    samples : int
+        Number of samples of the vector evaluations and steps of the native
+        reference search, spread over *window*.
+    calls : int
+        Number of scalar evaluations per property.
+    persist : bool
+        Store the model in ``Config.cache_dir``, when it is set.
+
+    Returns
+    -------
+    CostModel
+        The model for the loaded kernels, with the new measurements added to
+        those of previous calibrations.
+
+    Examples
+    --------
+    >>> calibrate(BoresightLatitude("JUICE_JANUS", "GANYMEDE") > 0, Distance("JUICE", "GANYMEDE"))
+    """
+    from ..constraint_solver.cache import kernel_fingerprint
+    from ..constraint_solver.vector_search import sample_grid
+
+    window = _default_window(window, "calibrate()")
+
+    properties = _properties(items)
+    bodies = [prop for prop in properties if hasattr(prop, "observer") and hasattr(prop, "target")]
+    if not bodies:
+        raise ValueError("calibrate() needs at least one property with an observer and a target")
+
+    intervals = window._to_spice_window().to_et_array()
+    start, end = float(intervals[0, 0]), float(intervals[-1, 1])
+    coverage = float(np.sum(intervals[:, 1] - intervals[:, 0]))
+    times, _ = sample_grid(intervals, coverage / samples)
+
+    fingerprint = kernel_fingerprint()
+    model = CostModel(fingerprint, _time_native_step(bodies[0], start, end, samples))
+    for prop in properties:
+        scalar, vector = _time_evaluations(prop, times, calls)
+        if scalar is not None:
+            model.scalar[property_id(prop)] = scalar
+        if vector is not None:
+            model.vector[property_id(prop)] = vector
+        log.info(
+            "Calibrated {}: {} us per call, {} us per sample",
+            prop,
+            "-" if scalar is None else f"{scalar * 1e6:.1f}",
+            "-" if vector is None else f"{vector * 1e6:.1f}",
+        )
+
+    if (known := get_cost_model()) is not None:
+        known.update(model)
+        model = known
+    _models[fingerprint] = model
+
+    path = _model_path(fingerprint)
+    if persist and path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(model.to_dict(), indent=2))
+        log.info("Stored cost model in {}", path)
+
+    return model
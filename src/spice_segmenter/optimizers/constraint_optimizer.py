@@ -4,6 +4,25 @@ Constraint Optimization Module
 Provides systematic transformation of slow properties to faster equivalents.
 For example: TargetSizeOnSensor > 5px → Distance < threshold_km
 
+Properties that are a native gfevnt quantity in disguise (altitude, sub-observer
+coordinates, target RA/Dec) are rewritten to it (see :mod:`.native`), so that
+their search runs entirely in SPICE.
+
+Leaves that cannot be replaced are pruned instead when a cheap necessary
+condition is known (see :mod:`.pruning`): the condition is solved first and
+the leaf only searched where it holds.
+
+The boolean structure of the tree is simplified first (see :mod:`.simplify`):
+double negations, repeated or absorbed operands, constant operands and
+thresholds dominated by another on the same property are removed, and
+negations are pushed down to the leaves.
+
+Lower and upper bounds on the same property in an AND chain are fused into a
+single range leaf (see :mod:`.ranges`), searched in one pass.
+
+With a calibrated cost model for the loaded kernels (see :mod:`.calibration`)
+rewrites and prunings are only applied when they lower the estimated cost.
+
 This module is entirely optional and non-invasive. Use by calling:
     optimized_constraint = optimize_constraint(constraint)
 """
@@ -19,6 +38,7 @@ from loguru import logger as log
 if TYPE_CHECKING:
     from ..core.constraints import ConstraintBase
     from ..core.property import Property
+    from .pruning import NecessaryCondition
 
 
 class PropertyTransformer(ABC):
@@ -186,21 +206,41 @@ class ConstraintOptimizer:
         optimized = optimizer.optimize(constraint)
     """
 
-    def __init__(self, transformers: list[PropertyTransformer] | None = None):
+    def __init__(
+        self,
+        transformers: list[PropertyTransformer] | None = None,
+        necessary_conditions: list[NecessaryCondition] | None = None,
+        simplify: bool = True,
+    ):
         """Initialize with default or custom transformers.
         
         Args:
             transformers: List of PropertyTransformer instances. 
                          If None, uses all built-in transformers.
+            necessary_conditions: List of NecessaryCondition instances, used to
+                         prune the window of the leaves no transformer replaced.
+                         If None, uses all built-in ones; [] disables pruning.
+            simplify: Simplify the boolean structure of the tree first (see
+                         :mod:`.simplify`).
         """
+        from .native import default_native_rewrites
+        from .pruning import default_necessary_conditions
+
         if transformers is None:
             self.transformers = [
                 TargetSizeOnSensorToDistance(),
                 AngularSizeToDistance(),
+                *default_native_rewrites(),
             ]
         else:
             self.transformers = transformers
 
+        if necessary_conditions is None:
+            self.necessary_conditions = default_necessary_conditions()
+        else:
+            self.necessary_conditions = necessary_conditions
+
+        self.simplify = simplify
         self.transformations_applied: list[tuple[str, str, str]] = []
 
     def optimize(self, constraint: ConstraintBase) -> ConstraintBase:
@@ -214,12 +254,53 @@ class ConstraintOptimizer:
         """
 
         self.transformations_applied.clear()
+        if self.simplify:
+            constraint = self._simplify(constraint)
         return self._optimize_recursive(constraint)
 
+    def _simplify(self, constraint: ConstraintBase) -> ConstraintBase:
+        """Return the simplified boolean structure of *constraint*, or *constraint* if unchanged."""
+        from .simplify import simplify
+
+        simplified = simplify(constraint)
+        if isinstance(simplified, bool):
+            # no node holds everywhere or nowhere: solve it as it is
+            log.warning(f"Constraint {constraint} is always {simplified}")
+            return constraint
+        if str(simplified) == str(constraint):
+            return constraint
+
+        self.transformations_applied.append((str(constraint), "Simplify", str(simplified)))
+        log.info(f"Applied simplification:\n  Before: {constraint}\n  After: {simplified}")
+        return simplified
+
+    @staticmethod
+    def _lowers_cost(before: ConstraintBase, after: ConstraintBase) -> bool:
+        """Whether *after* is cheaper to solve than the leaf *before*.
+
+        Decided with the calibrated costs of the loaded kernels (see
+        :mod:`.calibration`); without a calibration of the property of
+        *before*, the rewrites are assumed to pay off.
+        """
+        from ..constraint_solver.planning import estimate_cost
+        from ..support.config import get_active_config
+        from .calibration import active_cost_model
+
+        model = active_cost_model()
+        if model is None or model.evaluation_cost(before.left, vectorized=False) is None:
+            return True
+
+        step = get_active_config().solver_step_seconds
+        cost_before, cost_after = estimate_cost(before, step), estimate_cost(after, step)
+        log.debug(f"Estimated cost {cost_before:.3g} before, {cost_after:.3g} after")
+        return cost_after < cost_before
+
     def _optimize_recursive(self, constraint: ConstraintBase) -> ConstraintBase:
         """Recursively optimize constraint tree."""
         from ..core.constraints import Constraint, ConstraintBase
-        from ..ops.constraint_operations import Inverted, WrappedConstraint
+        from ..ops.constraint_operations import Inverted, Pruned, RangeConstraint, WrappedConstraint
+        from .pruning import prune
+        from .ranges import fuse_ranges
 
         if isinstance(constraint, Constraint):
             # Try to transform this constraint
@@ -229,6 +310,10 @@ class ConstraintOptimizer:
                 try:
                     if transformer.can_transform(left, operator, right):
                         new_left, new_op, new_right = transformer.transform(left, operator, right)
+                        optimized = Constraint(left=new_left, operator=new_op, right=new_right)
+                        if not self._lowers_cost(constraint, optimized):
+                            log.info(f"Skipped transformation {transformer.name()}: not cheaper for {constraint}")
+                            continue
 
                         self.transformations_applied.append((
                             str(constraint),
@@ -242,13 +327,25 @@ class ConstraintOptimizer:
                             f"  After: ({new_left} {new_op} {new_right})",
                         )
 
-                        # Create optimized constraint
-                        return Constraint(left=new_left, operator=new_op, right=new_right)
+                        return optimized
 
                 except Exception as e:
                     log.debug(f"Transformer {transformer.name()} failed: {e}")
                     continue
 
+            # No transformation matched: search the leaf only where a cheaper
+            # necessary condition holds
+            pruned = None if isinstance(left, ConstraintBase) else prune(constraint, self.necessary_conditions)
+            if pruned and self._lowers_cost(constraint, pruned[0]):
+                optimized, name = pruned
+                self.transformations_applied.append((str(constraint), name, str(optimized)))
+                log.info(
+                    f"Applied pruning: {name}\n"
+                    f"  Before: {constraint}\n"
+                    f"  After: {optimized}",
+                )
+                return optimized
+
             # No transformation matched, but recursively optimize left and right
             # Only if they are also Constraints (not Properties)
             new_left = self._optimize_recursive(left) if isinstance(left, ConstraintBase) else left
@@ -256,7 +353,15 @@ class ConstraintOptimizer:
 
             # If either side changed, create new constraint
             if new_left is not left or new_right is not right:
-                return Constraint(left=new_left, operator=operator, right=new_right)
+                constraint = Constraint(left=new_left, operator=operator, right=new_right)
+
+            # Search two-sided bounds on the same property in a single pass
+            if operator in ("&", "|") and isinstance(left, ConstraintBase) and constraint.time_step is None:
+                if fused := fuse_ranges(constraint):
+                    constraint, ranges = fused
+                    for pair, band in ranges:
+                        self.transformations_applied.append((pair, "Bounds→Range", band))
+                        log.info(f"Applied range fusion:\n  Before: {pair}\n  After: {band}")
 
         # Handle Inverted constraints (negations with ~)
         elif isinstance(constraint, Inverted):
@@ -267,6 +372,14 @@ class ConstraintOptimizer:
             if optimized_parent is not parent:
                 return Inverted(optimized_parent)
 
+        # Already pruned: the leaf was optimized when the condition was derived
+        elif isinstance(constraint, Pruned):
+            pass
+
+        # Already fused: the bounds are constants
+        elif isinstance(constraint, RangeConstraint):
+            pass
+
         # Handle other wrapped constraints
         elif isinstance(constraint, WrappedConstraint):
             parent = constraint.parent
@@ -0,0 +1,204 @@
+"""
+Rewrites onto native gfevnt quantities
+
+``SpiceEventSolver`` searches DISTANCE, PHASE ANGLE, ANGULAR SEPARATION and
+COORDINATE quantities entirely in C, while any other scalar property is
+searched by ``GenericScalarSolver`` calling Python at every step.  Many
+registered properties are an increasing affine function of a native quantity
+(the approximated altitude is the distance minus the target radius) or are
+one of its coordinates computed in Python (the sub-observer latitude is the
+LATITUDINAL LATITUDE of the SUB-OBSERVER POINT).  The transformers of this
+module rewrite comparisons of such properties to the native quantity; the
+threshold is converted to the unit of the native quantity and, as the maps
+are increasing, the operator is kept.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pint
+
+from .constraint_optimizer import PropertyTransformer
+
+if TYPE_CHECKING:
+    from ..core.property import Property
+
+# operators kept by an increasing map
+_OPERATORS = ("<", ">", "=")
+
+
+def _threshold(left: Property, right: Any, unit: pint.Unit) -> float:
+    """Return the constant *right* compared to *left*, in *unit*.
+
+    A dimensionless constant is taken in the unit of *left* (compared by name:
+    pint holds radians equal to the dimensionless unit).
+    """
+    from ..ops.constant_values import ScalarConstant
+
+    if not isinstance(right, ScalarConstant):
+        raise ValueError(f"Right side must be a constant, not {right!r}")
+
+    runit = right.unit
+    if str(runit) == "dimensionless":
+        runit = left.unit
+    return float(pint.Quantity(right.value, runit).to(unit).magnitude)
+
+
+def _constant(value: float, unit: pint.Unit) -> Property:
+    from ..ops.constant_values import Constant
+
+    return Constant.from_value(pint.Quantity(value, unit))
+
+
+class ApproximatedAltitudeToDistance(PropertyTransformer):
+    """ApproximatedAltitude < h → Distance < h + R."""
+
+    def can_transform(self, left: Property, operator: str, right: Any) -> bool:
+        from ..properties.observation_properties import ApproximatedAltitude
+
+        return isinstance(left, ApproximatedAltitude) and operator in _OPERATORS
+
+    def transform(self, left: Property, operator: str, right: Any) -> tuple[Property, str, Any]:
+        from ..properties.observation_properties import Distance
+
+        km = pint.Unit("km")
+        distance = _threshold(left, right, km) + left.target.radius
+        new_left = Distance(left.observer, left.target, light_time_correction=left.light_time_correction)
+        return new_left, operator, _constant(distance, km)
+
+    def name(self) -> str:
+        return "ApproximatedAltitude→Distance"
+
+
+class DistanceInTargetBodyRadiiToDistance(PropertyTransformer):
+    """DistanceInTargetBodyRadii < n → Distance < n * R."""
+
+    def can_transform(self, left: Property, operator: str, right: Any) -> bool:
+        from ..properties.observation_properties import DistanceInTargetBodyRadii
+
+        return isinstance(left, DistanceInTargetBodyRadii) and operator in _OPERATORS
+
+    def transform(self, left: Property, operator: str, right: Any) -> tuple[Property, str, Any]:
+        from ..properties.observation_properties import Distance
+
+        km = pint.Unit("km")
+        distance = _threshold(left, right, pint.Unit("dimensionless")) * left.target.radius
+        new_left = Distance(left.observer, left.target, light_time_correction=left.light_time_correction)
+        return new_left, operator, _constant(distance, km)
+
+    def name(self) -> str:
+        return "DistanceInTargetBodyRadii→Distance"
+
+
+class SubObserverCoordinateToNative(PropertyTransformer):
+    """Sub-observer point coordinates → COORDINATE search of the SUB-OBSERVER POINT.
+
+    Covers the latitudinal, geodetic and rectangular scalar properties
+    (``SubObserverLatitude``, ``SubObserverGeoLatitude``, ``SubObserverX``, …)
+    and the components selected from their vector properties.  Only the
+    ellipsoid methods are searched natively.
+    """
+
+    @staticmethod
+    def _coordinates() -> dict[type, tuple[str, tuple[str, ...]]]:
+        """Return {property class: (coordinate system, coordinates)}; scalars have one coordinate."""
+        from ..properties import geometry_properties as geometry
+
+        return {
+            geometry.SubObserverLatitudinal: ("latitudinal", ("radius", "longitude", "latitude")),
+            geometry.SubObserverRadius: ("latitudinal", ("radius",)),
+            geometry.SubObserverLongitude: ("latitudinal", ("longitude",)),
+            geometry.SubObserverLatitude: ("latitudinal", ("latitude",)),
+            geometry.SubObserverGeodetic: ("geodetic", ("longitude", "latitude", "altitude")),
+            geometry.SubObserverGeoLongitude: ("geodetic", ("longitude",)),
+            geometry.SubObserverGeoLatitude: ("geodetic", ("latitude",)),
+            geometry.SubObserverAltitude: ("geodetic", ("altitude",)),
+            geometry.SubObserverRectangular: ("rectangular", ("x", "y", "z")),
+            geometry.SubObserverX: ("rectangular", ("x",)),
+            geometry.SubObserverY: ("rectangular", ("y",)),
+            geometry.SubObserverZ: ("rectangular", ("z",)),
+        }
+
+    def _match(self, left: Property) -> tuple[Property, str, str] | None:
+        """Return ``(sub-observer property, coordinate system, coordinate)``, or None."""
+        from ..properties.component_selector import ComponentSelector
+        from ..properties.coordinates import SubObserverPointMethods
+
+        prop, index = (left.vector, left.component) if isinstance(left, ComponentSelector) else (left, 0)
+        system, coordinates = self._coordinates().get(type(prop), (None, ()))
+        if system is None or index >= len(coordinates):
+            return None
+        if isinstance(left, ComponentSelector) == (len(coordinates) == 1):
+            return None  # a vector property compared as a whole
+        if str(prop.method).upper() not in SubObserverPointMethods.GF_METHODS:
+            return None
+        return prop, system, coordinates[index]
+
+    def can_transform(self, left: Property, operator: str, right: Any) -> bool:
+        return operator in _OPERATORS and self._match(left) is not None
+
+    def transform(self, left: Property, operator: str, right: Any) -> tuple[Property, str, Any]:
+        from ..properties.coordinates import SubObserverPoint
+
+        prop, system, coordinate = self._match(left)
+        point = SubObserverPoint(
+            prop.observer.name,
+            prop.target.name,
+            frame=prop.target.frame.name,
+            abcorr=prop.light_time_correction,
+            method=str(prop.method).upper(),
+        )
+        coordinates = {
+            "latitudinal": point.as_latitudinal,
+            "geodetic": point.as_geodetic,
+            "rectangular": point,
+        }[system]
+        new_left = getattr(coordinates, coordinate)
+        value = _threshold(left, right, new_left.unit)
+        return new_left, operator, _constant(value, new_left.unit)
+
+    def name(self) -> str:
+        return "SubObserverCoordinate→SubObserverPoint"
+
+
+class TargetRaDecToNative(PropertyTransformer):
+    """TargetRA / TargetDec → RA/DEC COORDINATE search of the target POSITION in J2000."""
+
+    def _match(self, left: Property) -> tuple[Property, str] | None:
+        """Return ``(target ra/dec property, coordinate)``, or None."""
+        from ..properties.component_selector import ComponentSelector
+        from ..properties.geometry_properties import TargetDec, TargetRA, TargetRaDec
+
+        if isinstance(left, TargetRA):
+            return left, "right_ascension"
+        if isinstance(left, TargetDec):
+            return left, "declination"
+        if isinstance(left, ComponentSelector) and isinstance(left.vector, TargetRaDec):
+            return left.vector, ("right_ascension", "declination")[left.component]
+        return None
+
+    def can_transform(self, left: Property, operator: str, right: Any) -> bool:
+        return operator in _OPERATORS and self._match(left) is not None
+
+    def transform(self, left: Property, operator: str, right: Any) -> tuple[Property, str, Any]:
+        from ..properties.coordinates import Vector
+
+        prop, coordinate = self._match(left)
+        position = Vector(prop.observer.name, prop.target.name, frame="J2000", abcorr=prop.light_time_correction)
+        new_left = getattr(position.as_radec, coordinate)
+        value = _threshold(left, right, new_left.unit)
+        return new_left, operator, _constant(value, new_left.unit)
+
+    def name(self) -> str:
+        return "TargetRaDec→Position"
+
+
+def default_native_rewrites() -> list[PropertyTransformer]:
+    """Return the built-in rewrites onto native gfevnt quantities."""
+    return [
+        ApproximatedAltitudeToDistance(),
+        DistanceInTargetBodyRadiiToDistance(),
+        SubObserverCoordinateToNative(),
+        TargetRaDecToNative(),
+    ]
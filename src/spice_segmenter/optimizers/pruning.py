@@ -0,0 +1,211 @@
+"""
+Necessary-condition pruning
+
+Some leaves are expensive to search (FOV and boresight intercept geometry
+driven by CK attitude, illumination of a computed surface point) but imply a
+condition that a native gfevnt search checks quickly: the target must be
+close to the boresight to be seen or hit by it, the sub-observer point can
+only be lit when the phase angle is not much above 90 degrees.
+
+The optimizer wraps such leaves as ``Pruned(leaf, condition=...)``: the
+condition is solved first and the leaf is then searched only where it holds.
+The conditions are relaxed by a safety margin so that they strictly contain
+the leaf, and the result is the same as solving the leaf alone.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import numpy as np
+import spiceypy
+from loguru import logger as log
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+    from ..core.property import Property
+
+# Relative and absolute (rad) margins added to the bounds of the conditions,
+# covering aberration corrections and the convergence of the searches.
+RELATIVE_MARGIN = 0.01
+ANGULAR_MARGIN = np.radians(0.5)
+
+
+class NecessaryCondition(ABC):
+    """Base class for the derivation of a cheap necessary condition of a leaf.
+
+    The derived condition must hold wherever the leaf does.
+    """
+
+    @abstractmethod
+    def can_derive(self, left: Property, operator: str, right: Property) -> bool:
+        """Check if a condition can be derived for the given constraint pattern."""
+
+    @abstractmethod
+    def derive(self, left: Property, operator: str, right: Property) -> ConstraintBase | None:
+        """Return the necessary condition, or None if it would not prune anything."""
+
+    @abstractmethod
+    def name(self) -> str:
+        """Name of this derivation for logging."""
+
+
+def _boresight_cone(observer, target, abcorr: str, fov: bool, beta: float) -> ConstraintBase | None:
+    """Return a condition holding whenever *target* touches the boresight (or the FOV, with *fov*).
+
+    Seen from the observer, the target centre is then within the FOV
+    half-angle plus the angular radius ``asin(R / d)`` of the boresight.
+    Either that radius is below *beta*, and the centre is within
+    ``half-angle + beta`` of the boresight, or the observer is closer than
+    ``R / sin(beta)``.  The off-boresight angle is searched as the colatitude
+    in the FOV frame, so the tilt of the boresight from its Z axis is added.
+    """
+    from ..properties.coordinates import Vector
+    from ..properties.observation_properties import Distance
+
+    _shape, frame, boresight, _n, bounds = spiceypy.getfov(observer.code, 64)
+    half_angle = max(spiceypy.vsep(boresight, bound) for bound in bounds) if fov else 0.0
+    tilt = spiceypy.vsep(boresight, [0.0, 0.0, 1.0])
+
+    cone = (tilt + half_angle + beta) * (1.0 + RELATIVE_MARGIN) + ANGULAR_MARGIN
+    if cone >= np.pi:
+        return None  # the whole sky
+
+    radius = float(np.max(target.radii))
+    vector = Vector(observer.name, target.name, frame=frame, abcorr=abcorr)
+    off_axis = vector.as_spherical.colatitude < f"{cone} rad"
+    close = Distance(observer.name, target.name, light_time_correction=abcorr) < (
+        f"{radius / np.sin(beta) * (1.0 + RELATIVE_MARGIN)} km"
+    )
+    return off_axis | close
+
+
+class FovVisibilityToBoresightCone(NecessaryCondition):
+    """BodyFOVVisibility == True → target centre near the boresight, or target close.
+
+    Avoids running gftfov over the parts of the window where the target is far
+    off the FOV.
+    """
+
+    # angular radius of the target above which only the distance is checked
+    beta: float = np.radians(5.0)
+
+    def can_derive(self, left: Property, operator: str, right: Property) -> bool:
+        from ..properties.visibility_properties import BodyFOVVisibility
+
+        return isinstance(left, BodyFOVVisibility) and operator in ("=", "==") and bool(right.value)
+
+    def derive(self, left: Property, operator: str, right: Property) -> ConstraintBase | None:
+        return _boresight_cone(left.observer, left.target, left.light_time_correction, fov=True, beta=self.beta)
+
+    def name(self) -> str:
+        return "FOVVisibility→BoresightCone"
+
+
+class BoresightInterceptToBoresightCone(NecessaryCondition):
+    """Comparison of a boresight intercept coordinate → boresight on the target disk.
+
+    The intercept coordinates are NaN when the boresight misses the target,
+    and a comparison with NaN never holds.
+    """
+
+    beta: float = np.radians(5.0)
+
+    @staticmethod
+    def _intercept(left: Property) -> Property | None:
+        from ..properties import geometry_properties as geometry
+        from ..properties.component_selector import ComponentSelector
+
+        if isinstance(left, ComponentSelector):
+            left = left.vector
+        intercepts = (
+            geometry.BoresightIntersectionLatitudinal,
+            geometry.BoresightLatitude,
+            geometry.BoresightLongitude,
+            geometry.BoresightRadius,
+            geometry.BoresightIntersectionGeodetic,
+            geometry.BoresightGeoLatitude,
+            geometry.BoresightGeoLongitude,
+            geometry.BoresightAltitude,
+            geometry.BoresightIntersectionRectangular,
+            geometry.BoresightX,
+            geometry.BoresightY,
+            geometry.BoresightZ,
+        )
+        return left if isinstance(left, intercepts) else None
+
+    def can_derive(self, left: Property, operator: str, right: Property) -> bool:
+        return operator in ("<", ">", "=") and self._intercept(left) is not None
+
+    def derive(self, left: Property, operator: str, right: Property) -> ConstraintBase | None:
+        intercept = self._intercept(left)
+        return _boresight_cone(
+            intercept.observer,
+            intercept.target,
+            intercept.light_time_correction,
+            fov=False,
+            beta=self.beta,
+        )
+
+    def name(self) -> str:
+        return "BoresightIntercept→BoresightCone"
+
+
+class DaylightToPhaseAngle(NecessaryCondition):
+    """SubObserverIsInDaylight == True/False → phase angle below/above 90 deg plus a bound.
+
+    At the sub-observer point the incidence angle differs from the phase
+    angle at the target centre by at most the angle between the surface
+    normal and the radius, bounded by the flattening of the body.
+    """
+
+    def can_derive(self, left: Property, operator: str, right: Property) -> bool:
+        from ..properties.observation_properties import SubObserverIsInDaylight
+
+        return isinstance(left, SubObserverIsInDaylight) and operator in ("=", "==")
+
+    def derive(self, left: Property, operator: str, right: Property) -> ConstraintBase | None:
+        from ..properties.observation_properties import PhaseAngle
+
+        radii = np.asarray(left.target.radii, dtype=float)
+        k = (radii.max() / radii.min()) ** 2
+        # largest angle between the normal and the radius on the ellipsoid
+        deviation = np.arctan((k - 1.0) / (2.0 * np.sqrt(k)))
+        bound = 2.0 * deviation + ANGULAR_MARGIN
+
+        phase = PhaseAngle(left.observer.name, left.target.name, light_time_correction=left.light_time_correction)
+        if bool(right.value):
+            return phase < f"{np.pi / 2 + bound} rad"
+        return phase > f"{np.pi / 2 - bound} rad"
+
+    def name(self) -> str:
+        return "Daylight→PhaseAngle"
+
+
+def default_necessary_conditions() -> list[NecessaryCondition]:
+    """Return the built-in necessary-condition derivations."""
+    return [
+        FovVisibilityToBoresightCone(),
+        BoresightInterceptToBoresightCone(),
+        DaylightToPhaseAngle(),
+    ]
+
+
+def prune(constraint: ConstraintBase, conditions: list[NecessaryCondition]) -> tuple[ConstraintBase, str] | None:
+    """Return ``(Pruned(constraint, condition=...), name)`` for the first derivation that applies, or None."""
+    from ..ops.constraint_operations import Pruned
+
+    left, operator, right = constraint.left, constraint.operator, constraint.right
+    for derivation in conditions:
+        try:
+            if not derivation.can_derive(left, operator, right):
+                continue
+            condition = derivation.derive(left, operator, right)
+        except Exception as e:  # e.g. no FOV definition loaded for the instrument
+            log.debug(f"Necessary condition {derivation.name()} failed: {e}")
+            continue
+
+        if condition is not None:
+            return Pruned(constraint, condition=condition), derivation.name()
+    return None
@@ -0,0 +1,103 @@
+"""
+Fusion of two-sided bounds
+
+``(p > lower) & (p < upper)`` is solved as two leaves, each scanning the
+whole window for the crossings of its own threshold, and the two windows are
+intersected.  The optimizer fuses such pairs of an AND chain into a single
+:class:`RangeConstraint` leaf, whose solvers find the crossings of both
+bounds in one search (one stream of callbacks, or one vector sampling).
+Negated pairs of an OR chain, ``NOT (p > lower) | NOT (p < upper)`` as left
+by the simplifier, are fused into ``NOT (lower < p < upper)``.
+
+Leaves already searched natively by gfevnt are left alone: two searches in C
+are cheaper than one calling Python.  So are the chains with a global
+minimum/maximum, which is taken over the window left by the operands written
+before it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+
+
+def _bound(leaf: ConstraintBase) -> tuple | None:
+    """Return the key of the property of *leaf* if it can be half of a range, else None."""
+    from ..constraint_solver.constraint_solver import SpiceEventSolver
+    from ..constraint_solver.sharing import property_key
+    from ..core.constraints import Constraint, ConstraintTypes
+    from ..core.property import PropertyTypes
+    from ..ops.constant_values import ScalarConstant
+
+    if (
+        type(leaf) is not Constraint
+        or leaf.ctype != ConstraintTypes.COMPARE_TO_CONSTANT
+        or leaf.operator not in ("<", ">")
+        or not isinstance(leaf.right, ScalarConstant)
+        or leaf.left.type != PropertyTypes.SCALAR
+        or leaf.time_step is not None
+        or SpiceEventSolver.can_solve(leaf)
+    ):
+        return None
+    return property_key(leaf.left)
+
+
+def fuse_ranges(constraint: ConstraintBase) -> tuple[ConstraintBase, list[tuple[str, str]]] | None:
+    """Fuse the ``>``/``<`` pairs on the same property of the AND (or OR) chain *constraint*.
+
+    Returns ``(fused constraint, [(pair, range), ...])``, or None if nothing
+    was fused.
+    """
+    from ..constraint_solver.parallel import is_chunkable
+    from ..constraint_solver.planning import flatten_operands
+    from ..core.constraints import Constraint
+    from ..ops.constraint_operations import Inverted, RangeConstraint
+
+    # in an OR chain, the pairs are the negated bounds
+    negated = constraint.operator == "|"
+    operands = flatten_operands(constraint)
+    if not all(is_chunkable(operand) for operand in operands):
+        # moving the second bound would change the window of a global min/max
+        return None
+    bounds_of = [
+        (operand.parent if isinstance(operand, Inverted) else None) if negated else operand for operand in operands
+    ]
+    # first unpaired lower (>) and upper (<) bound of each property
+    pending: dict[tuple, dict[str, int]] = {}
+    pairs: list[tuple[int, int]] = []
+    for i, leaf in enumerate(bounds_of):
+        if leaf is None:
+            continue
+        key = _bound(leaf)
+        if key is None:
+            continue
+        bounds = pending.setdefault(key, {})
+        other = "<" if leaf.operator == ">" else ">"
+        if other in bounds:
+            pairs.append((bounds.pop(other), i))
+        elif leaf.operator not in bounds:
+            bounds[leaf.operator] = i
+
+    if not pairs:
+        return None
+
+    fused, applied = {}, []
+    for first, second in pairs:
+        above, below = bounds_of[first], bounds_of[second]
+        if above.operator == "<":
+            above, below = below, above
+        band = RangeConstraint(above.left, above.right, below.right)
+        if negated:
+            band = Inverted(band)
+        fused[first] = band
+        applied.append((f"{operands[first]} {constraint.operator} {operands[second]}", str(band)))
+
+    paired = {i for pair in pairs for i in pair}
+    kept = [fused.get(i, operand) for i, operand in enumerate(operands) if i in fused or i not in paired]
+
+    result = kept[0]
+    for operand in kept[1:]:
+        result = Constraint(result, operand, constraint.operator)
+    return result, applied
@@ -0,0 +1,250 @@
+"""
+Boolean simplification of constraint trees
+
+Constraints built by hand or loaded from catalogs often carry redundant
+structure, and every redundant node costs a search and window operations in
+``SpiceWindowSolver``.  :func:`simplify` normalizes a tree with:
+
+- double negation and De Morgan: NOT is pushed down to the leaves, where the
+  solvers invert by a complement of the window (``NOT (b == True)`` becomes
+  ``b == False``), and chains of the same operator are flattened;
+- constants: ``x & True`` is ``x``, ``x | True`` is ``True``, ...;
+- idempotence: ``x & x`` is ``x``;
+- absorption: ``x & (x | y)`` is ``x`` and ``x | (x & y)`` is ``x``;
+- threshold dominance on the same property: ``d < 1e5 & d < 5e4`` is
+  ``d < 5e4`` and ``d < 1e5 | d < 5e4`` is ``d < 1e5``.
+
+Leaves are compared structurally, on their property (see
+``sharing.property_key``), operator and constant; leaves and compound nodes
+with their own ``time_step`` are kept as they are, and so are the nodes
+containing a global minimum/maximum, which is taken over the window left by
+the operands written before it (see ``parallel.is_chunkable``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pint
+
+if TYPE_CHECKING:
+    from ..core.constraints import ConstraintBase
+
+_DUAL = {"&": "|", "|": "&"}
+
+
+def _is_chain(constraint: ConstraintBase) -> bool:
+    from ..core.constraints import Constraint, ConstraintTypes
+
+    return (
+        type(constraint) is Constraint
+        and constraint.ctype == ConstraintTypes.COMPARE_TO_OTHER_CONSTRAINT
+        and constraint.operator in _DUAL
+    )
+
+
+def _bool_operand(constraint: ConstraintBase) -> bool | None:
+    """Return the value of a constant operand (``x & True`` is built with a BoolConstant), else None."""
+    from ..ops.constant_values import BoolConstant
+
+    return bool(constraint.value) if isinstance(constraint, BoolConstant) else None
+
+
+def _chain_operands(constraint: ConstraintBase) -> list:
+    """Return the operands of *constraint*, including constant operands, which are not constraints."""
+    from ..core.constraints import Constraint
+
+    if type(constraint) is not Constraint or constraint.operator not in _DUAL:
+        return []
+    return [constraint.left, constraint.right]
+
+
+def _is_compound(constraint: ConstraintBase) -> bool:
+    """AND/OR node, possibly with a constant operand."""
+    from ..core.constraints import ConstraintBase
+
+    operands = _chain_operands(constraint)
+    return bool(operands) and all(
+        isinstance(side, ConstraintBase) or _bool_operand(side) is not None for side in operands
+    ) and any(isinstance(side, ConstraintBase) for side in operands)
+
+
+def structural_key(constraint: ConstraintBase) -> tuple:
+    """Return a key equal for constraints that are the same condition."""
+    from ..constraint_solver.sharing import property_key
+    from ..core.constraints import Constraint
+    from ..ops.constant_values import ScalarConstant
+    from ..ops.constraint_operations import Inverted
+
+    if isinstance(constraint, Inverted):
+        return ("not", structural_key(constraint.parent))
+    if _is_compound(constraint) and constraint.time_step is None:
+        return (constraint.operator, frozenset(structural_key(side) for side in _chain_operands(constraint)))
+    if _bool_operand(constraint) is not None:
+        return ("constant", _bool_operand(constraint))
+    if type(constraint) is Constraint and not _is_compound(constraint):
+        right = constraint.right
+        if isinstance(right, ScalarConstant) or _bool_operand(right) is not None:
+            right_key = (repr(right.value), str(right.unit) if isinstance(right, ScalarConstant) else None)
+        else:
+            right_key = property_key(right)
+        return ("leaf", property_key(constraint.left), constraint.operator, right_key, constraint.time_step)
+    return ("id", id(constraint))
+
+
+def _threshold(leaf: ConstraintBase) -> pint.Quantity | None:
+    """Return the constant threshold of a ``<``/``>`` leaf, in the unit of its property, or None."""
+    from ..core.constraints import Constraint
+    from ..ops.constant_values import ScalarConstant
+
+    if (
+        type(leaf) is not Constraint
+        or leaf.operator not in ("<", ">")
+        or not isinstance(leaf.right, ScalarConstant)
+        or leaf.time_step is not None
+    ):
+        return None
+    unit = leaf.right.unit
+    if str(unit) == "dimensionless":  # by name: pint holds radians equal to the dimensionless unit
+        unit = leaf.left.unit
+    try:
+        return pint.Quantity(float(leaf.right.value), unit).to(leaf.left.unit)
+    except (pint.errors.PintError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _dominate(operands: list[ConstraintBase], operator: str) -> list[ConstraintBase]:
+    """Keep one threshold per property and direction: the tightest for AND, the loosest for OR.
+
+    ``NOT (p > t)`` is an upper bound like ``p < t``, but is only compared to
+    other negated leaves (it holds at ``p == t``).
+    """
+    from ..constraint_solver.sharing import property_key
+    from ..ops.constraint_operations import Inverted
+
+    best: dict[tuple, tuple[int, pint.Quantity]] = {}
+    dropped = set()
+    for i, leaf in enumerate(operands):
+        negated = isinstance(leaf, Inverted)
+        bound = leaf.parent if negated else leaf
+        value = _threshold(bound)
+        if value is None:
+            continue
+        upper = (bound.operator == "<") != negated
+        key = (property_key(bound.left), upper, negated)
+        if key not in best:
+            best[key] = (i, value)
+            continue
+        j, kept = best[key]
+        # for AND keep the smallest upper and largest lower bound, the opposite for OR
+        smaller = value.magnitude < kept.magnitude
+        if smaller == (upper == (operator == "&")):
+            best[key] = (i, value)
+            dropped.add(j)
+        else:
+            dropped.add(i)
+    return [leaf for i, leaf in enumerate(operands) if i not in dropped]
+
+
+def _absorb(operands: list[ConstraintBase], operator: str) -> list[ConstraintBase]:
+    """Drop the dual nodes containing another operand: ``x & (x | y)`` is ``x``."""
+    keys = {structural_key(operand) for operand in operands}
+    kept = []
+    for operand in operands:
+        if _is_chain(operand) and operand.operator == _DUAL[operator] and operand.time_step is None:
+            inner = {structural_key(side) for side in _flatten(operand)}
+            if inner & keys:
+                continue
+        kept.append(operand)
+    return kept
+
+
+def _flatten(constraint: ConstraintBase) -> list:
+    """Return the operands of the chain of *constraint*'s operator, constants included."""
+    operands = []
+    for side in _chain_operands(constraint):
+        if _is_compound(side) and side.operator == constraint.operator and side.time_step is None:
+            operands.extend(_flatten(side))
+        else:
+            operands.append(side)
+    return operands
+
+
+def _build(operands: list[ConstraintBase], operator: str) -> ConstraintBase:
+    from ..core.constraints import Constraint
+
+    result = operands[0]
+    for operand in operands[1:]:
+        result = Constraint(result, operand, operator)
+    return result
+
+
+def _simplify_chain(operands: list, operator: str) -> ConstraintBase | bool:
+    """Simplify the already simplified *operands* of an AND/OR chain."""
+    # the absorbing element of the operator: False for AND, True for OR
+    absorbing = operator == "|"
+    flat, seen = [], set()
+    for operand in operands:
+        if isinstance(operand, bool) or _bool_operand(operand) is not None:
+            value = operand if isinstance(operand, bool) else _bool_operand(operand)
+            if value == absorbing:
+                return absorbing
+            continue  # neutral element
+        same = _is_chain(operand) and operand.operator == operator and operand.time_step is None
+        parts = _flatten(operand) if same else [operand]
+        for part in parts:
+            key = structural_key(part)
+            if key not in seen:
+                seen.add(key)
+                flat.append(part)
+
+    flat = _absorb(_dominate(flat, operator), operator)
+    if not flat:
+        return not absorbing
+    return _build(flat, operator)
+
+
+def _negate(constraint: ConstraintBase) -> ConstraintBase | bool:
+    """Return the simplified negation of *constraint*."""
+    from ..constraint_solver.parallel import is_chunkable
+    from ..core.constraints import Constraint
+    from ..ops.constant_values import BoolConstant
+    from ..ops.constraint_operations import Inverted
+
+    if isinstance(constraint, Inverted):
+        return simplify(constraint.parent)
+    if _bool_operand(constraint) is not None:
+        return not _bool_operand(constraint)
+    if not is_chunkable(constraint):
+        return Inverted(constraint)
+    if _is_compound(constraint) and constraint.time_step is None:
+        operands = [_negate(side) for side in _chain_operands(constraint)]
+        return _simplify_chain(operands, _DUAL[constraint.operator])
+    if (
+        type(constraint) is Constraint
+        and constraint.operator in ("=", "==")
+        and _bool_operand(constraint.right) is not None
+        and constraint.time_step is None
+    ):
+        # boolean property: compare to the other value instead of inverting
+        return Constraint(constraint.left, BoolConstant(not _bool_operand(constraint.right)), constraint.operator)
+
+    inner = simplify(constraint)
+    if isinstance(inner, bool):
+        return not inner
+    return Inverted(inner)
+
+
+def simplify(constraint: ConstraintBase) -> ConstraintBase | bool:
+    """Return the simplified *constraint*, or a bool if it holds everywhere (True) or nowhere (False)."""
+    from ..constraint_solver.parallel import is_chunkable
+    from ..ops.constraint_operations import Inverted
+
+    if isinstance(constraint, Inverted):
+        return _negate(constraint.parent)
+    if _bool_operand(constraint) is not None:
+        return _bool_operand(constraint)
+    if not _is_compound(constraint) or constraint.time_step is not None or not is_chunkable(constraint):
+        return constraint
+
+    return _simplify_chain([simplify(side) for side in _flatten(constraint)], constraint.operator)
@@ -74,6 +74,7 @@ from .observation_properties import (
 from .occultation_types import Occultation, OccultationTypes
 from .reflector_properties import JupiterShineIdealCondition
 from .surface_properties import SurfaceIlluminationAngles
+from .surrogate import ChebyshevSurrogate
 from .visibility_properties import AngularSeparation, BodyFOVVisibility
 
 __all__ = [
@@ -152,4 +153,6 @@ __all__ = [
     # Specialized
     "JupiterShineIdealCondition",
     "SurfaceIlluminationAngles",
+    # Surrogates
+    "ChebyshevSurrogate",
 ]
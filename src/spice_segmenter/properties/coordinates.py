@@ -110,6 +110,12 @@ class SubObserverPointMethods:
     NEAREST = "NEAR POINT/ELLIPSOID"
     INTERCEPT = "INTERCEPT/ELLIPSOID"
 
+    # the same methods as named by the GF coordinate searches (gfevnt METHOD)
+    GF_METHODS: ClassVar[dict[str, str]] = {
+        NEAREST: "NEAR POINT: ELLIPSOID",
+        INTERCEPT: "INTERCEPT: ELLIPSOID",
+    }
+
 
 @define(repr=False, order=False, eq=False)
 class SubObserverPoint(Vector):
@@ -378,6 +384,18 @@ class RaDecCoordinates(Property):
     def unit(self) -> pint.Unit:
         return pint.Unit("km"), pint.Unit("rad"), pint.Unit("rad")
 
+    @property
+    def range(self) -> Property:
+        return ComponentSelector(self, 0, "range")
+
+    @property
+    def right_ascension(self) -> Property:
+        return ComponentSelector(self, 1, "right_ascension")
+
+    @property
+    def declination(self) -> Property:
+        return ComponentSelector(self, 2, "declination")
+
     def config(self, config: dict) -> None:
         self.vector.config(config)
         config["coordinate_type"] = self.name
@@ -0,0 +1,282 @@
+"""Piecewise Chebyshev surrogate of a scalar property.
+
+Smooth properties (``Distance``, ``PhaseAngle``, ``SubObserverLatitude``...)
+are approximated over a window by Chebyshev series on consecutive time
+segments.  The segments are subdivided adaptively until the error measured
+on check points falls below the requested bound; every round of the fit
+evaluates all the pending segments with one vector call.
+
+The surrogate is a :class:`~spice_segmenter.core.Property`: it can be
+plotted, evaluated or used in constraints like the property it replaces,
+without any SPICE call.  Level crossings and extrema are also available
+directly, as roots of the polynomials.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+import pint
+from attrs import define
+from loguru import logger as log
+from numpy.polynomial import chebyshev
+
+from ..core.property import Property, PropertyTypes
+from ..core.spice_window import SpiceWindow
+from ..core.time_segments_collection import TimeSegmentsCollection
+
+
+def _chebval_rows(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Evaluate the series ``coefficients[i]`` at ``x[i]`` for every row *i* (Clenshaw)."""
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+    for j in range(coefficients.shape[1] - 1, 0, -1):
+        b1, b2 = 2.0 * x * b1 - b2 + coefficients[:, j], b1
+    return x * b1 - b2 + coefficients[:, 0]
+
+
+def _real_roots(coefficients: np.ndarray, slack: float = 1e-6) -> np.ndarray:
+    """Return the real roots in ``[-1, 1]`` of the Chebyshev series *coefficients*."""
+    scale = np.max(np.abs(coefficients))
+    if not np.isfinite(scale) or scale == 0.0:
+        return np.empty(0)
+    trimmed = chebyshev.chebtrim(coefficients, tol=1e-14 * scale)
+    if len(trimmed) < 2:
+        return np.empty(0)
+
+    roots = chebyshev.chebroots(trimmed)
+    real = roots.real[(np.abs(roots.imag) <= 1e-8) & (np.abs(roots.real) <= 1.0 + slack)]
+    return np.clip(real, -1.0, 1.0)
+
+
+@define(repr=False, order=False, eq=False)
+class ChebyshevSurrogate(Property):
+    """Piecewise Chebyshev approximation of a scalar property over a window.
+
+    Build it with :meth:`fit`.  Values are in the unit of the source property
+    and ``NaN`` outside the fitted window.
+    """
+
+    # a fit of another property, not a standalone computable property
+    _skip_auto_compute: ClassVar[bool] = True
+
+    source: Property
+    # segment bounds (ET) and Chebyshev coefficients of each segment, on [-1, 1]
+    starts: np.ndarray
+    ends: np.ndarray
+    coefficients: np.ndarray  # (segments, degree + 1)
+    # largest error measured on each segment, in the unit of the source
+    errors: np.ndarray
+
+    @property
+    def name(self) -> str:
+        return f"{self.source.name}_surrogate"
+
+    @property
+    def unit(self) -> pint.Unit:
+        return self.source.unit
+
+    @property
+    def type(self) -> PropertyTypes:
+        return PropertyTypes.SCALAR
+
+    @property
+    def max_error(self) -> float:
+        """Largest error of the fit, in the unit of the source property.
+
+        Measured against the property on the interleaved Chebyshev extrema of
+        every segment, and never smaller than the tail of its coefficients.
+        """
+        return float(np.max(self.errors)) if len(self.errors) else 0.0
+
+    @property
+    def degree(self) -> int:
+        return self.coefficients.shape[1] - 1
+
+    def __repr__(self) -> str:
+        return f"ChebyshevSurrogate({self.source!r}, {len(self.starts)} segments, max error {self.max_error:.3g})"
+
+    @classmethod
+    def fit(
+        cls,
+        prop: Property,
+        window: TimeSegmentsCollection,
+        *,
+        tol: float | str | pint.Quantity,
+        degree: int = 16,
+        segment: float | str | pd.Timedelta = "1 day",
+        min_segment: float = 60.0,
+    ) -> ChebyshevSurrogate:
+        """Fit *prop* over *window* to within *tol*.
+
+        Parameters
+        ----------
+        prop:
+            Scalar property to approximate.
+        window:
+            Window the surrogate is valid on.
+        tol:
+            Error bound, as a number in the unit of *prop* or as a quantity.
+        degree:
+            Degree of the Chebyshev series of every segment.
+        segment:
+            Initial length of the segments, in seconds or as a timedelta; they
+            are halved until the error bound is met.
+        min_segment:
+            Segments are not split below this length (seconds), e.g. across a
+            discontinuity; the error bound may then not be met, see
+            :attr:`max_error`.
+
+        Examples
+        --------
+        >>> d = ChebyshevSurrogate.fit(Distance("JUICE", "GANYMEDE"), window, tol="10 m")
+        >>> d.max_error
+        >>> (d < 5000).solve(window)          # no SPICE call
+        >>> d.crossings(5000)                 # polynomial roots
+        """
+        from ..engines.evaluator import get_evaluator
+
+        if prop.type != PropertyTypes.SCALAR:
+            raise ValueError(f"Only scalar properties can be fitted, {prop!r} is {prop.type}")
+        if isinstance(tol, str | pint.Quantity):
+            tol = pint.Quantity(tol).to(prop.unit).magnitude
+        length = segment if isinstance(segment, float | int) else pd.Timedelta(segment).total_seconds()
+
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))  # first kind
+        checks = np.cos(np.pi * np.arange(degree + 2) / (degree + 1))  # extrema, interleaved
+        x = np.concatenate([nodes, checks])
+
+        a, b = [], []
+        for start, end in window._to_spice_window().to_et_array():
+            n = max(int(np.ceil((end - start) / length)), 1)
+            edges = np.linspace(start, end, n + 1)
+            a.append(edges[:-1])
+            b.append(edges[1:])
+        a, b = np.concatenate(a), np.concatenate(b)
+
+        evaluator = get_evaluator()
+        done: list[tuple[np.ndarray, ...]] = []
+        rounds = 0
+        while len(a):
+            rounds += 1
+            mid, half = 0.5 * (a + b), 0.5 * (b - a)
+            times = (mid[:, None] + half[:, None] * x[None, :]).ravel()
+            values = np.asarray(evaluator.evaluate_vector(prop, times), dtype=np.float64).reshape(len(a), -1)
+
+            coefficients = chebyshev.chebfit(nodes, values[:, : degree + 1].T, degree).T
+            fitted = chebyshev.chebval(checks, coefficients.T)
+            errors = np.max(np.abs(fitted - values[:, degree + 1 :]), axis=1)
+            errors = np.maximum(errors, np.abs(coefficients[:, -2:]).sum(axis=1))
+            errors[~np.isfinite(errors)] = np.inf
+
+            accept = (errors <= tol) | (b - a <= min_segment)
+            done.append((a[accept], b[accept], coefficients[accept], errors[accept]))
+
+            a, b = a[~accept], b[~accept]
+            mid = 0.5 * (a + b)
+            a, b = np.concatenate([a, mid]), np.concatenate([mid, b])
+
+        starts, ends, coefficients, errors = (np.concatenate(parts) for parts in zip(*done, strict=True))
+        order = np.argsort(starts)
+        surrogate = cls(
+            source=prop,
+            starts=starts[order],
+            ends=ends[order],
+            coefficients=coefficients[order],
+            errors=errors[order],
+        )
+
+        log.debug("Fitted {} in {} rounds: {!r}", prop, rounds, surrogate)
+        if surrogate.max_error > tol:
+            log.warning(
+                "{}: error {:.3g} above {:.3g} on segments of {} s or less",
+                prop,
+                surrogate.max_error,
+                tol,
+                min_segment,
+            )
+        return surrogate
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def _call_vector(self, times_et: np.ndarray) -> np.ndarray:
+        times = np.asarray(times_et, dtype=np.float64)
+        k = np.searchsorted(self.starts, times, side="right") - 1
+        inside = (k >= 0) & (times <= self.ends[np.clip(k, 0, None)])
+
+        out = np.full(times.shape, np.nan)
+        k = k[inside]
+        x = (2.0 * times[inside] - self.starts[k] - self.ends[k]) / (self.ends[k] - self.starts[k])
+        out[inside] = _chebval_rows(self.coefficients[k], x)
+        return out
+
+    def _call_scalar(self, time_et: float) -> float:
+        return float(self._call_vector(np.array([time_et]))[0])
+
+    # ------------------------------------------------------------------
+    # Root finding
+    # ------------------------------------------------------------------
+
+    def _roots(self, coefficients: np.ndarray) -> np.ndarray:
+        """Return the sorted times where the series *coefficients* (one per segment) vanish."""
+        found = [
+            self.starts[i] + 0.5 * (x + 1.0) * (self.ends[i] - self.starts[i])
+            for i in range(len(self.starts))
+            if len(x := _real_roots(coefficients[i]))
+        ]
+        if not found:
+            return np.empty(0)
+
+        roots = np.sort(np.concatenate(found))
+        # a root on the joint of two segments is found by both
+        keep = np.concatenate([[True], np.diff(roots) > 1e-6 * np.max(self.ends - self.starts)])
+        return roots[keep]
+
+    def crossings(self, level: float) -> np.ndarray:
+        """Return the times (ET) where the surrogate equals *level*."""
+        shifted = self.coefficients.copy()
+        shifted[:, 0] -= level
+        return self._roots(shifted)
+
+    def extrema(self, *, maximum: bool) -> np.ndarray:
+        """Return the times (ET) of the local maxima (or minima) of the surrogate."""
+        derivative = chebyshev.chebder(self.coefficients, axis=1)
+        times = self._roots(derivative)
+        if not len(times):
+            return times
+
+        curvature = self._derivative_at(chebyshev.chebder(derivative, axis=1), times)
+        return times[curvature < 0.0] if maximum else times[curvature > 0.0]
+
+    def _derivative_at(self, coefficients: np.ndarray, times: np.ndarray) -> np.ndarray:
+        k = np.clip(np.searchsorted(self.starts, times, side="right") - 1, 0, len(self.starts) - 1)
+        x = np.clip((2.0 * times - self.starts[k] - self.ends[k]) / (self.ends[k] - self.starts[k]), -1.0, 1.0)
+        padded = np.zeros_like(self.coefficients)
+        padded[:, : coefficients.shape[1]] = coefficients
+        return _chebval_rows(padded[k], x)
+
+    def where(self, operator: str, level: float) -> TimeSegmentsCollection:
+        """Return the window where ``surrogate <operator> level``, from the crossings of *level*.
+
+        *operator* is ``"<"``, ``">"`` or ``"="`` (crossing times as point segments).
+        """
+        from ..constraint_solver.vector_search import assemble_intervals
+
+        crossings = self.crossings(level)
+        if operator == "=":
+            intervals = np.column_stack([crossings, crossings])
+        elif operator in ("<", ">"):
+            domain = SpiceWindow.from_et_array(np.column_stack([self.starts, self.ends])).to_et_array()
+            times = domain.ravel()
+            offsets = np.arange(0, len(times) + 1, 2)
+            values = self._call_vector(times)
+            mask = values < level if operator == "<" else values > level
+            intervals = assemble_intervals(times, offsets, mask, crossings)
+        else:
+            raise ValueError(f"Unsupported operator {operator!r}, expected '<', '>' or '='")
+
+        return TimeSegmentsCollection._from_spice_window(SpiceWindow.from_et_array(intervals))
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import contextvars
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from attrs import define, field
+from attrs import converters, define, field
+
+if TYPE_CHECKING:
+    from ..core.time_segments_collection import TimeSegmentsCollection
 
 
 def to_timedelta(value) -> pd.Timedelta:
@@ -38,6 +42,14 @@ class Config:
     solver_step: pd.Timedelta = field(
         default=pd.Timedelta(minutes=5), converter=to_timedelta,
     )
+    # Shortest interval, or gap between intervals, that a search must not miss.
+    # When set, it replaces solver_step as the search step, and the scalar
+    # constraints of distances against constants are only searched at that step
+    # where the distance can reach its threshold at the relative speed (see
+    # ``AdaptiveStepSolver``); the other constraints are searched at that step.
+    min_event_duration: pd.Timedelta | None = field(
+        default=None, converter=converters.optional(to_timedelta),
+    )
     start: str | pd.Timestamp | None = field(default=None)
     end: str | pd.Timestamp | None = field(default=None)
     # When True (default), array inputs are routed to _call_vector on properties
@@ -45,6 +57,44 @@ class Config:
     # force the baseline np.vectorize(_call_scalar) path for all properties —
     # useful for benchmarking, debugging, or environments where cyice is missing.
     use_vectorized_calls: bool = field(default=True)
+    # Convergence tolerance of the event times, in seconds.  None keeps the
+    # solver defaults (1 ms for gfevnt/gfocce and the vectorized solvers, the
+    # SPICE default of 1 us for gfuds/gfudb/gftfov).  A coarse tolerance (e.g.
+    # 60 s) gives a fast first pass that ``constraint.refine`` can sharpen.
+    solver_tolerance: float | None = field(default=None)
+    # When True, scalar and boolean constraints are solved by sampling the
+    # property on a grid with one vector call and refining only the bracketed
+    # transitions, instead of driving gfuds/gfudb with per-step Python callbacks.
+    vectorized_solvers: bool = field(default=False)
+    # Number of time chunks the confinement window is split into; each chunk is
+    # solved in its own worker process.  1 (default) solves in this process.
+    solver_chunks: int = field(default=1)
+    # Size of the worker pool used for chunked solving; None uses one process
+    # per chunk, up to the number of CPUs.
+    solver_processes: int | None = field(default=None)
+    # When True (default), leaves of an AND/OR tree comparing the same property
+    # (same type, instance_id and fields) and solved by the vectorized solvers
+    # are solved from one sampling of the property instead of one each.
+    share_samples: bool = field(default=True)
+    # When True (default), the operands of AND/OR constraints are solved
+    # cheapest and most selective first instead of in the order they were written.
+    reorder_operands: bool = field(default=True)
+    # Number of points used to sample each operand when estimating its
+    # selectivity for the ordering above.  0 disables sampling (cost only).
+    planning_samples: int = field(default=0)
+    # When True (default), the property costs measured by
+    # ``optimizers.calibrate()`` for the loaded kernels replace the fixed solver
+    # costs in the planning estimates, and the optimizer only keeps the
+    # rewrites that lower them.  Without a calibration nothing changes.
+    calibrated_costs: bool = field(default=True)
+    # When True, solved windows are cached, keyed on the constraint, window,
+    # solver settings and loaded kernels.  Results are kept in memory and, if
+    # cache_dir is set, also stored on disk to be reused across sessions.
+    cache_results: bool = field(default=False)
+    cache_dir: str | None = field(default=None)
+    # When True, every solve records an execution profile (solver per node,
+    # timings, callback counts), attached to the result as ``result.profile``.
+    profile_solves: bool = field(default=False)
 
     _token: contextvars.Token | None = field(
         default=None, init=False, repr=False,
@@ -52,7 +102,9 @@ class Config:
 
     @property
     def solver_step_seconds(self) -> float:
-        """Return *solver_step* as total seconds (float)."""
+        """Return the search step as total seconds (float): *min_event_duration* if set, else *solver_step*."""
+        if self.min_event_duration is not None:
+            return self.min_event_duration.total_seconds()
         return self.solver_step.total_seconds()
 
     def __enter__(self) -> Config:
@@ -104,3 +156,25 @@ def get_active_config() -> Config:
     outside any block it returns the module-level ``config`` singleton.
     """
     return _config_var.get(config)
+
+
+def _default_window(window: TimeSegmentsCollection | None, caller: str) -> TimeSegmentsCollection:
+    """Return *window*, or the window of the active :class:`Config` if it is None.
+
+    Raises RuntimeError, naming *caller* (e.g. ``"solve()"``), when neither is set.
+    """
+    if window is not None:
+        return window
+
+    cfg = get_active_config()
+    if cfg.start is None or cfg.end is None:
+        raise RuntimeError(
+            f"{caller} called without a window and no default window is set. "
+            "Either pass a window explicitly or activate a context:\n\n"
+            "    with Config(start='2032-01-01', end='2035-01-01'):\n"
+            "        ...\n",
+        )
+
+    from ..core.time_segments_collection import TimeSegmentsCollection
+
+    return TimeSegmentsCollection.from_start_end(cfg.start, cfg.end)
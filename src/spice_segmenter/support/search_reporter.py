@@ -1,5 +1,7 @@
+import contextvars
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 
 import spiceypy
 import spiceypy.utils.callbacks
@@ -70,6 +72,10 @@ class SearchReporter:
     def end_search_spice(self) -> UDREPF:
         return spiceypy.utils.callbacks.SpiceUDREPF(self.end_search)
 
+    @property
+    def bail_function_spice(self) -> spiceypy.utils.callbacks.UDBAIL:
+        return spiceypy.utils.callbacks.SpiceUDBAIL(spiceypy.gfbail)
+
 
 @define(repr=False, order=False, eq=False)
 class NoSearchReporter:
@@ -109,10 +115,106 @@ class NoSearchReporter:
     def end_search_spice(self) -> UDREPF:
         return spiceypy.utils.callbacks.SpiceUDREPF(self.end_search)
 
+    @property
+    def bail_function_spice(self) -> spiceypy.utils.callbacks.UDBAIL:
+        return spiceypy.utils.callbacks.SpiceUDBAIL(spiceypy.gfbail)
+
+
+@define(repr=False, order=False, eq=False)
+class SolveEvent:
+    """Structured progress of a solve, see ``ConstraintBase.solve_async``."""
+
+    kind: str  # "started", "progress", "finished" or "cancelled"
+    fraction: float = 0.0  # of the whole search, 0 to 1
+    intervals_found: int = 0  # in the part of the window searched so far
+    search: str = ""  # description of the running GF search pass, if any
+    elapsed: float = 0.0  # seconds since the start of the solve
 
-def get_default_reporter_class() -> SearchReporter | NoSearchReporter:
+    def __repr__(self) -> str:
+        return (
+            f"SolveEvent({self.kind}, {self.fraction:.1%}, "
+            f"{self.intervals_found} intervals, {self.elapsed:.1f} s)"
+        )
+
+
+@define(repr=False, order=False, eq=False)
+class EventReporter:
+    """Reports the progress of the GF searches to a callback instead of a progress bar.
+
+    *on_progress* receives the fraction done of the current search pass and
+    its description; *should_bail* is polled by the GF routines through
+    ``udbail`` and interrupts the search when it returns True.
+    """
+
+    on_progress: Callable[[float, str], None]
+    should_bail: Callable[[], bool] = field(default=lambda: False)
+    description: str = ""
+
+    def reset(self) -> None:
+        self.description = ""
+
+    @property
+    def update_function(self) -> Callable[[float, float, float], None]:
+        def update_progress_report(istart: float, iend: float, et: float) -> None:
+            self.on_progress((et - istart) / (iend - istart), self.description)
+
+        return update_progress_report
+
+    @property
+    def update_function_spice(self) -> UDREPU:
+        return spiceypy.utils.callbacks.SpiceUDREPU(self.update_function)
+
+    @property
+    def init_search(self) -> Callable[[SpiceCell, str, str], None]:
+        def init_search(cell: SpiceCell, pre: str, suf: str) -> None:
+            self.description = pre.strip()
+            self.on_progress(0.0, self.description)
+
+        return init_search
+
+    @property
+    def init_search_spice(self) -> UDREPI:
+        return spiceypy.utils.callbacks.SpiceUDREPI(self.init_search)
+
+    @property
+    def end_search(self) -> Callable[[], None]:
+        def end_search() -> None:
+            self.on_progress(1.0, self.description)
+
+        return end_search
+
+    @property
+    def end_search_spice(self) -> UDREPF:
+        return spiceypy.utils.callbacks.SpiceUDREPF(self.end_search)
+
+    @property
+    def bail_function_spice(self) -> spiceypy.utils.callbacks.UDBAIL:
+        return spiceypy.utils.callbacks.SpiceUDBAIL(lambda: bool(self.should_bail()))
+
+
+_reporter_factory_var: contextvars.ContextVar[Callable[[], object] | None] = contextvars.ContextVar(
+    "_reporter_factory_var",
+    default=None,
+)
+
+
+@contextmanager
+def reporting_to(factory: Callable[[], object]) -> Iterator[None]:
+    """Make the solvers created in this block use reporters built by *factory*."""
+    token = _reporter_factory_var.set(factory)
+    try:
+        yield
+    finally:
+        _reporter_factory_var.reset(token)
+
+
+def get_default_reporter_class() -> SearchReporter | NoSearchReporter | EventReporter:
     from spice_segmenter.support.config import get_active_config
 
+    factory = _reporter_factory_var.get()
+    if factory is not None:
+        return factory()
+
     if get_active_config().show_progressbar:
         return SearchReporter()
     return NoSearchReporter()
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, get_type_hints
 
+import numpy as np
 import pint
 from cattrs.preconf.json import make_converter
 from cattrs.strategies import configure_tagged_union, include_subclasses
@@ -96,6 +97,10 @@ def create_property_converter(
         converter.register_unstructure_hook(pint.Quantity, lambda x: str(x))
         converter.register_unstructure_hook(pint.Unit, lambda x: str(x))
 
+    # numpy arrays (e.g. the coefficients of a ChebyshevSurrogate) as nested lists
+    converter.register_unstructure_hook(np.ndarray, lambda x: x.tolist())
+    converter.register_structure_hook(np.ndarray, lambda x, _: np.asarray(x, dtype=np.float64))
+
     # Create a custom union strategy that uses "type" as the discriminator
     def custom_union_strategy(union, converter_arg):
         """Strategy that uses 'type' field as discriminator with class name as value"""
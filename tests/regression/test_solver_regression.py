@@ -181,6 +181,31 @@ def test_solver(label, constraint_factory, step_s, regression_baseline):
     )
 
 
+@pytest.mark.parametrize(
+    "label,constraint_factory,step_s",
+    SOLVER_CASES,
+    ids=[c[0] for c in SOLVER_CASES],
+)
+def test_solver_vectorized(label, constraint_factory, step_s, regression_baseline, request):
+    """Same cases solved with the vectorized solvers must match the gfuds baselines."""
+    if request.config.getoption("--update-regression"):
+        pytest.skip("baselines are generated by the SPICE callback solvers only")
+
+    saved_step = config.solver_step
+    config.solver_step = step_s
+    try:
+        constraint = constraint_factory()
+        window = constraint.solve(SEARCH_WINDOW, vectorized=True)
+    finally:
+        config.solver_step = saved_step
+
+    regression_baseline(
+        f"solvers/{label}.yaml",
+        _flatten(_window_to_dict(window)),
+        tolerances={"n_intervals": 1e-9, "total_duration_s": 1e-4},
+    )
+
+
 def _flatten(d: dict, prefix: str = "") -> dict:
     """Flatten nested dict/list to dot-path keys for the baseline fixture."""
     out: dict[str, Any] = {}
@@ -8,6 +8,9 @@ For every property class explicitly registered in the SPICE engine:
   - ``test_vector_compute[name]``: only for classes that have a dedicated
     vector function registered; the vector function executes and its result
     is numerically equivalent to the scalar result at the same epoch.
+  - ``test_derivative[name]``: only for classes that have a derivative
+    registered; it agrees with a central finite difference of the scalar
+    function, and its vector variant agrees with the scalar one.
 """
 
 from __future__ import annotations
@@ -74,6 +77,7 @@ def _build_cases(fns_dict: dict) -> list[pytest.param]:
 
 _SCALAR_CASES = _build_cases(_engine._scalar_fns)
 _VECTOR_CASES = _build_cases(_engine._vector_fns)
+_DERIVATIVE_CASES = _build_cases(_engine._derivative_fns)
 
 
 # ---------------------------------------------------------------------------
@@ -132,3 +136,33 @@ def test_vector_compute(prop) -> None:
         pytest.skip(f"SPICE evaluation skipped: {exc}")
 
     _assert_scalar_vector_agree(scalar_val, vector_val)
+
+
+@pytest.mark.parametrize("prop", _DERIVATIVE_CASES)
+def test_derivative(prop) -> None:
+    """Registered derivative agrees with finite differences of the scalar function."""
+    dt = 1.0
+    try:
+        derivative = _engine.evaluate_derivative(prop, _ET)
+        vector_val = _engine.evaluate_derivative_vector(prop, np.array([_ET]))
+        before = _engine.evaluate_scalar(prop, _ET - dt)
+        after = _engine.evaluate_scalar(prop, _ET + dt)
+    except Exception as exc:
+        pytest.skip(f"SPICE evaluation skipped: {exc}")
+
+    np.testing.assert_allclose(derivative, (after - before) / (2 * dt), rtol=1e-4, atol=1e-12)
+    _assert_scalar_vector_agree(derivative, vector_val)
+
+
+def test_derivative_from_vector_fn_only() -> None:
+    """A derivative registered as a vector fn only is also evaluated at single epochs."""
+    from spice_segmenter.engines.spice_engine import SpiceEngine
+
+    class Ramp:
+        pass
+
+    engine = SpiceEngine()
+    engine.register(Ramp, scalar_fn=lambda prop, t: 2.0 * t, derivative_vector_fn=lambda prop, t: np.full(len(t), 2.0))
+
+    assert engine.has_derivative(Ramp)
+    assert engine.evaluate_derivative(Ramp(), _ET) == 2.0
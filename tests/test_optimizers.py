@@ -1,16 +1,32 @@
 """Tests for constraint optimization."""
 
 from spice_segmenter import (
+    ApproximatedAltitude,
+    BodyFOVVisibility,
     ConstraintOptimizer,
     Distance,
+    SubObserverIsInDaylight,
+    SubObserverLatitude,
+    TargetDec,
     TargetSizeOnSensor,
     TimeSegmentsCollection,
     config,
     optimize_constraint,
 )
+from spice_segmenter.constraint_solver.constraint_solver import (
+    PrunedSolver,
+    RangeSolver,
+    SpiceEventSolver,
+    get_appropriate_solver,
+)
+from spice_segmenter.constraint_solver.planning import estimate_cost
+from spice_segmenter.ops.constraint_operations import MinMaxConstraint, Pruned, RangeConstraint
+from spice_segmenter.optimizers import calibration, calibrate, get_cost_model
 from spice_segmenter.optimizers.constraint_optimizer import (
     TargetSizeOnSensorToDistance,
 )
+from spice_segmenter.optimizers.ranges import fuse_ranges
+from spice_segmenter.optimizers.simplify import simplify
 
 from . import tour_config as tc
 
@@ -112,3 +128,118 @@ def test_optimizer_preserves_constraint_structure():
     val_opt = c_opt(t)
 
     assert val_orig == val_opt
+
+
+def test_pruning_keeps_result():
+    """Leaves with a necessary condition are solved only where it holds, with the same result."""
+    optimizer = ConstraintOptimizer(transformers=[])
+    for c in (
+        BodyFOVVisibility("JUICE_JANUS", tc.target) == True,  # noqa: E712
+        SubObserverIsInDaylight("JUICE_JANUS", tc.target) == True,  # noqa: E712
+    ):
+        pruned = optimizer.optimize(c)
+        assert isinstance(pruned, Pruned)
+        assert get_appropriate_solver(pruned) is PrunedSolver
+
+        expected = c.solve(w)._to_spice_window().to_et_array()
+        got = pruned.solve(w)._to_spice_window().to_et_array()
+        assert got.shape == expected.shape
+        if len(got):
+            assert abs(got - expected).max() < 1.0  # seconds
+
+    # pruning is disabled with an empty list, and not applied twice
+    assert ConstraintOptimizer(necessary_conditions=[]).optimize(c) is c
+    assert optimizer.optimize(pruned) is pruned
+
+
+def test_native_rewrites_keep_result():
+    """Properties with a native gfevnt equivalent are searched by SpiceEventSolver, with the same result."""
+    optimizer = ConstraintOptimizer(necessary_conditions=[])
+    for c in (
+        ApproximatedAltitude(tc.spacecraft, tc.target) < "5000 km",
+        SubObserverLatitude(tc.spacecraft, tc.target) > "10 deg",
+        TargetDec(tc.spacecraft, tc.target) > "5 deg",
+    ):
+        native = optimizer.optimize(c)
+        assert get_appropriate_solver(native) is SpiceEventSolver
+
+        expected = c.solve(w)._to_spice_window().to_et_array()
+        got = native.solve(w)._to_spice_window().to_et_array()
+        assert got.shape == expected.shape
+        if len(got):
+            assert abs(got - expected).max() < 1.0  # seconds
+
+
+def test_range_fusion_keeps_result():
+    """Lower and upper bounds on the same property are searched as one range leaf, with the same result."""
+    optimizer = ConstraintOptimizer(transformers=[], necessary_conditions=[])
+    latitude = SubObserverLatitude(tc.spacecraft, tc.target)
+    c = (latitude > "-30 deg") & (Distance(tc.spacecraft, tc.target) < "50000 km") & (latitude < "30 deg")
+
+    fused = optimizer.optimize(c)
+    ranges = [leaf for leaf in (fused.left, fused.right) if isinstance(leaf, RangeConstraint)]
+    assert len(ranges) == 1
+    assert get_appropriate_solver(ranges[0]) is RangeSolver
+
+    expected = c.solve(w)._to_spice_window().to_et_array()
+    for vectorized in (False, True):
+        got = fused.solve(w, vectorized=vectorized)._to_spice_window().to_et_array()
+        assert got.shape == expected.shape
+        if len(got):
+            assert abs(got - expected).max() < 1.0  # seconds
+
+    # the global maximum is taken over the window left by the lower bound: no fusion
+    highest = MinMaxConstraint(Distance(tc.spacecraft, tc.target), "global_maximum")
+    assert fuse_ranges((latitude > "-30 deg") & highest & (latitude < "30 deg")) is None
+
+
+def test_simplify_boolean_structure():
+    """Redundant nodes are removed and negations pushed down to the leaves, with the same result."""
+    distance = Distance(tc.spacecraft, tc.target)
+    latitude = SubObserverLatitude(tc.spacecraft, tc.target)
+    near, north = distance < "50000 km", latitude > "10 deg"
+
+    assert str(simplify(~~near)) == str(near)
+    assert str(simplify(near & (distance < "100000 km") & near)) == str(near)
+    assert str(simplify(north | (north & near))) == str(north)
+    assert str(simplify(~(near | north))) == str(~near & ~north)
+    assert str(simplify((near | False) & True)) == str(near)
+    assert simplify(near & False) is False
+    # the window of a global maximum depends on the operands before it
+    highest = MinMaxConstraint(distance, "global_maximum")
+    chain = near & highest & near
+    assert simplify(chain) is chain
+    assert str(simplify(~(near & highest))) == str(~(near & highest))
+
+    c = ~(north | (latitude > "20 deg") | ~near)
+    simplified = ConstraintOptimizer(transformers=[], necessary_conditions=[]).optimize(c)
+    assert str(simplified) == str(~north & near)
+
+    expected = c.solve(w)._to_spice_window().to_et_array()
+    got = simplified.solve(w)._to_spice_window().to_et_array()
+    assert got.shape == expected.shape
+    if len(got):
+        assert abs(got - expected).max() < 1.0  # seconds
+
+
+def test_calibrated_costs(tmp_path, monkeypatch):
+    """Calibrated properties are costed from their measured evaluation time, stored per kernel set."""
+    monkeypatch.setattr(calibration, "_models", {})
+    c = SubObserverLatitude(tc.spacecraft, tc.target) > "10 deg"
+    step = 3600.0
+    uncalibrated = estimate_cost(c, step)
+
+    with config.override(cache_dir=str(tmp_path)):
+        model = calibrate(c, window=TimeSegmentsCollection.from_start_end("2032-01-01", "2032-01-10"), samples=50)
+        assert get_cost_model() is model
+        assert len(list((tmp_path / "cost_models").glob("*.json"))) == 1
+
+        measured = model.evaluation_cost(c.left, vectorized=False)
+        assert measured > 0
+        assert estimate_cost(c, step) == measured / step
+        with config.override(calibrated_costs=False):
+            assert estimate_cost(c, step) == uncalibrated
+
+        # reloaded from the cache directory
+        monkeypatch.setattr(calibration, "_models", {})
+        assert get_cost_model().scalar == model.scalar
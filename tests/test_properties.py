@@ -4,12 +4,14 @@ from pytest import approx
 
 from spice_segmenter.core.constraints import Constraint
 from spice_segmenter.core.property import Property
+from spice_segmenter.core.time_segments_collection import TimeSegmentsCollection
 from spice_segmenter.ops import Inverted
 from spice_segmenter.ops.constant_values import Constant
 from spice_segmenter.properties.observation_properties import (
     Distance,
     PhaseAngle,
 )
+from spice_segmenter.properties.surrogate import ChebyshevSurrogate
 from spice_segmenter.support.time_types import TIMES_TYPES
 
 from . import tour_config as tc
@@ -196,3 +198,24 @@ def test_property_repr() -> None:
     assert len(phase_str) > 0
     assert "Distance" in d_str or "distance" in d_str.lower()
     assert "Phase" in phase_str or "phase" in phase_str.lower()
+
+
+def test_chebyshev_surrogate() -> None:
+    d = Distance(tc.spacecraft, tc.target)
+    window = TimeSegmentsCollection.from_start_end(t1, t1 + np.timedelta64(10, "D"))
+    surrogate = ChebyshevSurrogate.fit(d, window, tol="10 m")
+
+    assert surrogate.max_error <= 0.01
+    assert surrogate.unit == d.unit
+
+    times = np.linspace(*window._to_spice_window().to_et_array()[0], 1001)
+    assert np.abs(surrogate(times) - d(times)).max() <= 0.01
+
+    # crossings of the median distance: the surrogate changes side there
+    level = float(np.median(d(times)))
+    crossings = surrogate.crossings(level)
+    assert len(crossings)
+    assert surrogate(crossings) == approx(level, abs=1e-6)
+
+    below = surrogate.where("<", level)
+    assert len(below) == len((d < level).solve(window, vectorized=True))
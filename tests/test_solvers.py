@@ -1,3 +1,9 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import spiceypy
 from planetary_coverage.spice import SpiceBody
 
 from spice_segmenter import (
@@ -10,14 +16,30 @@ from spice_segmenter.constraint_solver import (
     GenericScalarSolver,
     get_appropriate_solver,
 )
+from spice_segmenter.constraint_solver.batch import solve_many
+from spice_segmenter.constraint_solver.cache import cache_key, get_solve_cache, kernel_fingerprint
 from spice_segmenter.constraint_solver.constraint_solver import (
+    AdaptiveStepSolver,
+    BooleanPropertySolver,
+    FovVisibilitySolver,
     SpiceEventSolver,
     SpiceOccultationSolver,
     SpiceWindowSolver,
+    VectorizedBooleanSolver,
+    VectorizedExtremaSolver,
+    VectorizedScalarSolver,
 )
+from spice_segmenter.constraint_solver.planning import flatten_operands, order_operands
+from spice_segmenter.constraint_solver.sharing import SharedSamples, property_key
+from spice_segmenter.constraint_solver.sweep import sweep
 from spice_segmenter.core.constraints import ConstraintBase
+from spice_segmenter.core.spice_window import SpiceWindow
+from spice_segmenter.engines.evaluator import get_evaluator
+from spice_segmenter.ops.constraint_operations import MinMaxConstraint
 from spice_segmenter.properties.coordinates import Vector
-from spice_segmenter.properties.observation_properties import AngularSize, Distance
+from spice_segmenter.properties.observation_properties import AngularSize, Distance, MinMaxConditionTypes
+from spice_segmenter.properties.ring_properties import RingAnsaePhaseGreaterThan
+from spice_segmenter.properties.visibility_properties import BodyFOVVisibility
 
 log_enable("DEBUG")
 
@@ -37,11 +59,27 @@ p_occ = Occultation("JUICE_JANUS", "CALLISTO", "JUPITER")
 
 c_occ = p_occ == OccultationTypes.ANNULAR
 
-from spice_segmenter import config
+from spice_segmenter import Config, config
 
 config.solver_step = 48 * 60 * 60  # 48 hours to make it faster
 
 
+def _et_array(result) -> np.ndarray:
+    if hasattr(result, "_to_spice_window"):
+        result = result._to_spice_window()
+    if hasattr(result, "to_et_array"):
+        result = result.to_et_array()
+    return np.asarray(result).reshape(-1, 2)
+
+
+def assert_same_windows(got, expected, tol: float) -> None:
+    """Assert that two results (collections, windows or ET arrays) have the same intervals, to *tol* seconds."""
+    got, expected = _et_array(got), _et_array(expected)
+    assert got.shape == expected.shape
+    if len(got):
+        assert abs(got - expected).max() < tol
+
+
 def _test_solve_with_generic_scalar_solver(constraint: ConstraintBase) -> None:
     solver = GenericScalarSolver(constraint=constraint)
     got = solver.solve(w._to_spice_window())
@@ -58,6 +96,54 @@ def test_generic_scalar_solver() -> None:
     _test_solve_with_generic_scalar_solver(c_gt)
 
 
+def _gapped_window() -> SpiceWindow:
+    sw = SpiceWindow.from_start_end("2032-01-01T00:00:00", "2032-04-01T00:00:00")
+    sw.add_interval("2032-07-01T00:00:00", "2033-01-01T00:00:00")
+    return sw
+
+
+def test_inverted_leaves_are_inverted() -> None:
+    # these solvers used to return the result of the wrapped constraint for NOT
+    sw = _gapped_window()
+    c_ring = RingAnsaePhaseGreaterThan(170) == True  # noqa: E712
+    for solver, constraint in (
+        (GenericScalarSolver, c_less),
+        (BooleanPropertySolver, c_ring),
+    ):
+        expected = sw.difference(solver(constraint=constraint).solve(sw))
+        got = solver(constraint=~constraint).solve(sw)
+
+        assert_same_windows(got, expected, 1.0)
+
+
+def test_fov_visibility_false_is_inverted() -> None:
+    sw = _gapped_window()
+    c_fov = BodyFOVVisibility("JUICE_JANUS", "CALLISTO") == True  # noqa: E712
+    expected = sw.difference(FovVisibilitySolver(constraint=c_fov).solve(sw))
+
+    c_out = BodyFOVVisibility("JUICE_JANUS", "CALLISTO") == False  # noqa: E712
+    assert_same_windows(FovVisibilitySolver(constraint=c_out).solve(sw), expected, 1.0)
+    assert_same_windows(FovVisibilitySolver(constraint=~c_fov).solve(sw), expected, 1.0)
+    # NOT (== False) is back to the target in the FOV
+    assert_same_windows(
+        FovVisibilitySolver(constraint=~c_out).solve(sw),
+        FovVisibilitySolver(constraint=c_fov).solve(sw),
+        1.0,
+    )
+
+
+def test_inversion_stays_within_window() -> None:
+    # inverting over the hull of the window used to fill its gaps
+    sw = _gapped_window()
+    for constraint in (c_d, c_d & c_lat, c_occ):
+        solver = get_appropriate_solver(~constraint)
+        expected = sw.difference(get_appropriate_solver(constraint)(constraint=constraint).solve(sw))
+        got = solver(constraint=~constraint).solve(sw)
+
+        assert_same_windows(got, expected, 1.0)
+        assert not len(got.difference(sw))
+
+
 def test_solver_selection() -> None:
     # an angular size constraint should go to the generic scalar solver, for now.
     # this will be improved when a simplification of the constraint to the ones directly
@@ -84,3 +170,393 @@ def test_solver_selection() -> None:
     assert(solver == SpiceOccultationSolver)
 
 
+def test_vectorized_scalar_solver_matches_gfuds() -> None:
+    sw = w._to_spice_window()
+    for constraint in (c_less, c_gt):
+        expected = GenericScalarSolver(constraint=constraint).solve(sw)
+        got = VectorizedScalarSolver(constraint=constraint).solve(sw)
+
+        assert_same_windows(got, expected, 1.0)
+
+
+def test_vectorized_solver_selection() -> None:
+    with Config(vectorized_solvers=True):
+        assert get_appropriate_solver(c_less) == VectorizedScalarSolver
+        # native gfevnt quantities keep their SPICE solver
+        assert get_appropriate_solver(c_d) == SpiceEventSolver
+
+    assert get_appropriate_solver(c_less) == GenericScalarSolver
+
+
+def test_vectorized_extrema_match_gfuds() -> None:
+    prop = AngularSize("JUICE_JANUS", "CALLISTO")
+    for find in (prop.find_local_minima, prop.find_local_maxima):
+        expected = find(w, vectorized=False)
+        got = find(w, vectorized=True)
+
+        assert_same_windows(got, expected, 1.0)
+        for a, b in zip(got, expected):
+            assert abs(a.value - b.value) < 1e-6
+
+    with Config(vectorized_solvers=True):
+        assert get_appropriate_solver(MinMaxConstraint(prop, MinMaxConditionTypes.LOCAL_MINIMUM)) == VectorizedExtremaSolver
+
+
+def test_vectorized_boolean_solver_matches_gfocce() -> None:
+    sw = w._to_spice_window()
+    c_any = p_occ == OccultationTypes.ANY
+
+    expected = SpiceOccultationSolver(constraint=c_any, step=3 * 3600).solve(sw)
+    got = VectorizedBooleanSolver(constraint=c_any, step=3 * 3600).solve(sw)
+
+    assert_same_windows(got, expected, 1.0)
+
+
+def test_vectorized_boolean_solver_selection() -> None:
+    c_ring = RingAnsaePhaseGreaterThan(170) == True  # noqa: E712
+
+    with Config(vectorized_solvers=True):
+        assert get_appropriate_solver(c_ring) == VectorizedBooleanSolver
+        # gfocce runs entirely in C and keeps precedence
+        assert get_appropriate_solver(c_occ) == SpiceOccultationSolver
+
+
+def test_vectorized_per_solve() -> None:
+    expected = c_less.solve(w)
+    got = c_less.solve(w, vectorized=True)
+
+    assert len(got) == len(expected)
+
+
+def test_chunked_solve_matches_serial() -> None:
+    for constraint in (c_d, c_less):
+        expected = constraint.solve(w)
+        assert_same_windows(constraint.solve(w, chunks=4), expected, 1.0)
+
+        # fewer workers than chunks: the pool runs the chunks in turn
+        with config.override(solver_processes=2):
+            assert_same_windows(constraint.solve(w, chunks=4), expected, 1.0)
+
+
+def test_operand_ordering() -> None:
+    sw = w._to_spice_window()
+
+    # the gfevnt distance search is cheaper than the gfuds angular size one
+    for operator in ("&", "|"):
+        assert order_operands([c_less, c_d], operator, sw, 3600.0)[0] is c_d
+
+    with config.override(planning_samples=50):
+        assert order_operands([c_less, c_d], "&", sw, 3600.0)[0] is c_d
+
+
+def test_operand_ordering_keeps_global_extrema_in_place() -> None:
+    sw = w._to_spice_window()
+    c_max = MinMaxConstraint(AngularSize("JUICE_JANUS", "CALLISTO"), MinMaxConditionTypes.GLOBAL_MAXIMUM)
+
+    # the global maximum is taken over the window left by the operands written before it
+    assert order_operands([c_max, c_d], "&", sw, 3600.0) == [c_max, c_d]
+    chain = c_less & (c_max & c_d)
+    assert flatten_operands(chain) == [c_less, chain.right]
+
+    c = c_max & c_d
+    with config.override(reorder_operands=False):
+        expected = c.solve(w)
+    assert_same_windows(c.solve(w), expected, 1e-2)
+
+
+def test_operand_ordering_keeps_result() -> None:
+    for constraint in (c_less & c_d, c_less | c_d):
+        with config.override(reorder_operands=False):
+            expected = constraint.solve(w)
+        assert_same_windows(constraint.solve(w), expected, 1.0)
+
+
+def test_flatten_operands() -> None:
+    # compare by identity: == on constraints builds a new constraint
+    for chain in (c_d & c_lat & c_less, ~(c_d | c_lat | c_less)):
+        operands = flatten_operands(chain)
+        assert len(operands) == 3
+        assert all(a is b for a, b in zip(operands, (c_d, c_lat, c_less)))
+
+    # other operators and inverted sub-chains are kept whole
+    mixed = (c_d | c_lat) & ~(c_lat & c_less) & c_gt
+    assert len(flatten_operands(mixed)) == 3
+
+
+def test_nary_chain_matches_pairwise() -> None:
+    sw = w._to_spice_window()
+    solved = [c.solve(w)._to_spice_window() for c in (c_d, c_lat, c_less)]
+
+    expected_and = solved[0].intersect(solved[1]).intersect(solved[2])
+    got_and = (c_d & c_lat & c_less).solve(w)._to_spice_window()
+    assert len(got_and) == len(expected_and)
+
+    expected_or = solved[0].union(solved[1]).union(solved[2]).intersect(sw)
+    got_or = (c_d | c_lat | c_less).solve(w)._to_spice_window()
+    assert len(got_or) == len(expected_or)
+
+
+def test_solve_cache(tmp_path) -> None:
+    with config.override(cache_results=True, cache_dir=str(tmp_path)):
+        cache = get_solve_cache()
+        expected = c_less.solve(w)
+        assert cache.misses == 1
+
+        got = c_less.solve(w)
+        assert cache.hits == 1
+        assert got._to_spice_window() == expected._to_spice_window()
+
+        # the result survives the in-memory LRU
+        cache.clear()
+        assert c_less.solve(w)._to_spice_window() == expected._to_spice_window()
+        assert cache.hits == 1
+
+        # a different step is a different entry
+        c_less.solve(w, step=3600.0)
+        assert cache.misses == 1
+
+
+def test_cache_key() -> None:
+    intervals = w._to_spice_window().to_et_array()
+    key = cache_key(c_less, intervals, {"step": 60.0})
+
+    same = AngularSize("JUICE_JANUS", "CALLISTO").as_unit("deg") < 2
+    assert key == cache_key(same, intervals, {"step": 60.0})
+    assert key != cache_key(c_gt, intervals, {"step": 60.0})
+    assert key != cache_key(c_less, intervals + 1.0, {"step": 60.0})
+
+
+def test_kernel_fingerprint_follows_text_kernel_edits(tmp_path) -> None:
+    kernel = tmp_path / "edited.tpc"
+    kernel.write_text("KPL/PCK\n\\begindata\nBODY999_RADII = ( 1 1 1 )\n\\begintext\n")
+    spiceypy.furnsh(str(kernel))
+    before = kernel_fingerprint()
+    spiceypy.unload(str(kernel))
+
+    # same path, same handle (0 for every text kernel), new content
+    kernel.write_text("KPL/PCK\n\\begindata\nBODY999_RADII = ( 20 20 20 )\n\\begintext\n")
+    spiceypy.furnsh(str(kernel))
+    try:
+        assert kernel_fingerprint() != before
+    finally:
+        spiceypy.unload(str(kernel))
+
+
+def test_incremental_solve() -> None:
+    first = TimeSegmentsCollection.from_start_end("2032-01-01T00:00:00", "2032-07-01T00:00:00")
+    previous = c_less.solve(first)
+
+    expected = c_less.solve(w)
+    got = c_less.solve(w, previous=previous, previous_window=first)
+
+    assert_same_windows(got, expected, 1.0)
+
+
+def test_solve_many() -> None:
+    constraints = {"less": c_less, "gt": c_gt, "both": c_less & c_lat, "not": ~c_less}
+    results = solve_many(constraints, w)
+
+    assert set(results) == set(constraints)
+    for name, constraint in constraints.items():
+        assert_same_windows(results[name], constraint.solve(w, vectorized=True), 1.0)
+
+    # sequences give the results in order, even for constraints sharing a repr
+    c_lt = Distance("JUICE_JANUS", "CALLISTO", light_time_correction="LT+S") < "5000 km"
+    assert repr(c_lt) == repr(c_d)
+    results = solve_many([c_d, c_lt], w)
+    assert len(results) == 2
+    assert_same_windows(results[1], c_lt.solve(w), 1.0)
+
+
+def test_solve_many_keeps_global_extrema_whole() -> None:
+    # the global maximum is taken over the window left by the distance constraint
+    c_max = MinMaxConstraint(AngularSize("JUICE_JANUS", "CALLISTO"), MinMaxConditionTypes.GLOBAL_MAXIMUM)
+    c = c_d & c_max
+
+    assert_same_windows(solve_many({"c": c}, w)["c"], c.solve(w), 1e-2)
+
+
+def test_sweep() -> None:
+    targets = ["GANYMEDE", "CALLISTO"]
+    table = sweep("distance < '20000 km'", w, target=targets, observer=["JUICE_JANUS"], processes=2)
+
+    assert list(table.columns) == ["observer", "target", "start", "end"]
+    for target in targets:
+        expected = (Distance("JUICE_JANUS", target) < "20000 km").solve(w)
+        assert (table.target == target).sum() == len(expected)
+
+
+def test_solve_async() -> None:
+    events = []
+    got = asyncio.run(c_d.solve_async(w, on_event=events.append, progress_chunks=4))
+
+    assert got._to_spice_window() == c_d.solve(w)._to_spice_window()
+    assert events[0].kind == "started"
+    assert events[-1].kind == "finished"
+    assert events[-1].fraction == 1.0
+    assert events[-1].intervals_found == len(got)
+
+
+def test_solve_async_cancel() -> None:
+    async def cancel_early() -> None:
+        task = asyncio.create_task(c_less.solve_async(w, grace=1.0))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_early())
+
+
+def test_solve_profile() -> None:
+    result = c_d.solve(w, profile=True)
+    profile = result.profile
+
+    nodes = [node for _, node in profile.nodes()]
+    assert nodes[0].solver == "MasterSolver"
+    assert nodes[1].solver == get_appropriate_solver(c_d).__name__
+    assert nodes[0].window_out == len(result)
+    assert nodes[1].capacity is not None
+
+    assert json.loads(profile.to_json())["nodes"][0]["solver"] == "MasterSolver"
+    assert len(profile.to_chrome_trace()["traceEvents"]) == len(nodes)
+
+
+def test_solve_profile_counts_callbacks() -> None:
+    c = c_less
+    profile = c.solve(w, profile=True, vectorized=False).profile
+
+    solvers = {node.solver: node for _, node in profile.nodes()}
+    assert solvers["GenericScalarSolver"].counters["callbacks"] > 0
+    assert solvers["GenericScalarSolver"].counters["derivative_callbacks"] > 0
+    assert c.solve(w).profile is None
+
+
+def test_iter_solve_matches_solve() -> None:
+    expected = c_less.solve(w)
+    got = np.array([segment.to_et() for segment in c_less.iter_solve(w, chunk="17 days")])
+
+    # intervals straddling the chunk borders are merged back
+    assert_same_windows(got, expected, 1e-6)
+    assert (np.diff(got[:, 0]) > 0).all()
+
+
+def test_iter_solve_merges_interval_ending_on_chunk_border() -> None:
+    start = w._to_spice_window().start
+    border = start + 30 * 86400.0
+    # the first interval of the window ends on the border of the two chunks: the
+    # second chunk, padded by a step, clips it to the single instant [border, border]
+    window = TimeSegmentsCollection._from_spice_window(
+        SpiceWindow.from_et_array(np.array([[start, border], [border + 86400.0, start + 60 * 86400.0]])),
+    )
+    always = Distance("JUICE_JANUS", "CALLISTO") > "1 km"
+
+    got = np.array([segment.to_et() for segment in always.iter_solve(window, chunk="30 days")])
+
+    assert_same_windows(got, window, 1e-6)
+
+
+def test_refine_coarse_solve() -> None:
+    fine = c_less.solve(w)
+    coarse = c_less.solve(w, tol=60.0)
+    assert coarse.tolerance == 60.0
+
+    refined = c_less.refine(coarse, tol=1e-3, window=w)
+
+    # only the edges are searched again, to the fine tolerance
+    assert_same_windows(refined, fine, 1e-2)
+    assert refined.tolerance == 1e-3
+
+    # a global maximum over the edge neighbourhoods is not the one over the window
+    c_max = MinMaxConstraint(AngularSize("JUICE_JANUS", "CALLISTO"), MinMaxConditionTypes.GLOBAL_MAXIMUM)
+    with pytest.raises(ValueError):
+        c_max.refine(c_max.solve(w, tol=60.0), tol=1e-3, window=w)
+
+
+def test_level_sets_match_solve() -> None:
+    prop = Distance("JUICE_JANUS", "CALLISTO")
+    thresholds = ["5000 km", "20000 km", "100000 km"]
+    sets = prop.level_sets(thresholds, w)
+
+    assert list(sets) == thresholds
+    for threshold in thresholds:
+        assert_same_windows(sets[threshold], (prop < threshold).solve(w, vectorized=True), 1e-2)
+
+
+def test_explain() -> None:
+    c = c_less & c_lat
+    plan = c.explain(w)
+
+    assert plan.root.label == "AND"
+    assert plan.root.solver == "SpiceWindowSolver"
+    leaves = {node.constraint: node for node in plan.root.children}
+    assert leaves[str(c_lat)].path == "native"
+    assert leaves[str(c_lat)].routine == "gfevnt"
+    assert leaves[str(c_less)].path == "callback"
+    assert all(node.step == config.solver_step_seconds for _, node in plan.nodes())
+    assert plan.root.cost == pytest.approx(sum(node.cost for node in plan.root.children))
+    assert plan.root.wall_time is None
+
+    analyzed = c.explain(w, analyze=True)
+    assert len(analyzed.result) == analyzed.root.intervals
+    assert analyzed.root.wall_time is not None
+    assert next(n for n in analyzed.root.children if n.constraint == str(c_less)).callbacks > 0
+    assert str(c_less) in str(analyzed)
+
+    # the plan of the optimized tree, as solved by solve(optimize=True)
+    optimized = (~~c_less).explain(w, optimize=True)
+    assert optimized.root.constraint == str(c_less)
+    assert optimized.root.solver == "GenericScalarSolver"
+
+
+def test_shared_samples_match_unshared() -> None:
+    c = (c_less & c_lat) | (c_gt & ~c_less)
+    with config.override(share_samples=False):
+        expected = c.solve(w, vectorized=True)
+
+    result = c.solve(w, vectorized=True, profile=True)
+    assert_same_windows(result, expected, 1e-2)
+
+    # the AngularSize leaves reuse the grid points sampled by the first one
+    counters = [node.counters for _, node in result.profile.nodes()]
+    assert sum(n.get("shared_samples", 0) for n in counters) > 0
+
+
+def test_shared_samples_reuse_grid_points() -> None:
+    prop = AngularSize("JUICE_JANUS", "CALLISTO")
+    sw = w._to_spice_window()
+    day = 86400.0
+    shared = SharedSamples(sw, day, {property_key(prop)})
+
+    # the second window overlaps the grid points sampled for the first one
+    first = SpiceWindow.from_et_array(np.array([[sw.start + 10.5 * day, sw.start + 40.3 * day]]))
+    second = SpiceWindow.from_et_array(
+        np.array([[sw.start + 20.2 * day, sw.start + 60.7 * day], [sw.start + 100.1 * day, sw.start + 100.2 * day]]),
+    )
+    for window in (first, second):
+        times, offsets, raw = shared.sample(prop, window)
+
+        assert list(times[offsets[:-1]]) == list(window.to_et_array()[:, 0])
+        assert list(times[offsets[1:] - 1]) == list(window.to_et_array()[:, 1])
+        assert raw.tolist() == pytest.approx(get_evaluator().evaluate_vector_raw(prop, times).tolist())
+
+    # only the grid points are memoized, not the window ends
+    assert shared.known[property_key(prop)].sum() == 30 + 20
+
+
+def test_min_event_duration_matches_fixed_step() -> None:
+    step = 2 * 60 * 60
+    with Config(min_event_duration=step):
+        assert get_appropriate_solver(c_d) == AdaptiveStepSolver
+        assert AdaptiveStepSolver.inner_solver(c_d) == SpiceEventSolver
+        # no bound on the rate of change of the angular size: uniform step
+        assert get_appropriate_solver(c_less) == GenericScalarSolver
+    assert get_appropriate_solver(c_d) == SpiceEventSolver
+
+    for constraint in (c_less, c_gt, ~c_d):
+        result = constraint.solve(w, min_event_duration="2h", profile=True)
+        assert_same_windows(result, constraint.solve(w, step=step), 1e-2)
+
+    # far from the threshold, the distance is only sampled on the pilot grid
+    notes = [node.notes for _, node in result.profile.nodes()]
+    assert min(n["searched_fraction"] for n in notes if "searched_fraction" in n) < 1.0
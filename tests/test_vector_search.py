@@ -0,0 +1,121 @@
+"""Tests of the grid-and-bracket primitives on analytic functions (no kernels needed)."""
+
+import numpy as np
+import pytest
+
+from spice_segmenter.constraint_solver.vector_search import (
+    assemble_intervals,
+    bisect_levels,
+    bisect_transitions,
+    brent,
+    golden_section,
+    level_crossings,
+    local_extrema_brackets,
+    refined_maximum,
+    sample_grid,
+    state_changes,
+)
+
+# a mission-like ET, where float64 values are about 1.2e-7 s apart
+ET = 1e9
+
+
+def test_sample_grid() -> None:
+    times, offsets = sample_grid(np.array([[0.0, 10.0], [20.0, 21.0]]), 3.0)
+
+    assert list(offsets) == [0, 5, 7]
+    assert list(times[:5]) == [0.0, 2.5, 5.0, 7.5, 10.0]
+    assert list(times[5:]) == [20.0, 21.0]
+
+
+def test_state_changes_within_grids() -> None:
+    mask = np.array([False, True, True, False, True])
+    # the change between samples 2 and 3 spans two grids
+    assert list(state_changes(mask, np.array([0, 3, 5]))) == [0, 3]
+
+
+@pytest.mark.parametrize("tol", [1e-3, 1e-7, 0.0])
+def test_bisect_transitions_converges_below_et_spacing(tol: float) -> None:
+    got = bisect_transitions(lambda t: t > ET + 3.3, [ET], [ET + 10.0], [False], tol)
+
+    assert abs(got[0] - (ET + 3.3)) <= max(tol, 2 * np.spacing(ET))
+
+
+def test_bisect_levels_each_bracket_its_level() -> None:
+    got = bisect_levels(
+        lambda t: t - ET,
+        [ET, ET],
+        [ET + 10.0, ET + 10.0],
+        [2.0, 7.5],
+        [False, False],
+        1e-9,
+    )
+
+    assert (got - ET).tolist() == pytest.approx([2.0, 7.5], abs=1e-6)
+
+
+@pytest.mark.parametrize("search", [golden_section, brent])
+def test_extremum_search(search) -> None:
+    t, v = search(lambda t: (t - ET - 3.3) ** 2, [ET], [ET + 10.0], 1e-9)
+    assert t[0] - ET == pytest.approx(3.3, abs=1e-3)
+    assert v[0] == pytest.approx(0.0, abs=1e-6)
+
+    t, v = search(lambda t: np.sin(t - ET), [ET], [ET + 3.0], 1e-9, maximize=True)
+    assert t[0] - ET == pytest.approx(np.pi / 2, abs=1e-3)
+    assert v[0] == pytest.approx(1.0)
+
+
+def test_local_extrema_brackets_stay_in_grid() -> None:
+    values = np.array([0.0, 1.0, 0.0, 2.0, 0.0])
+    # the maximum at 3 would be bracketed by samples of two grids
+    assert list(local_extrema_brackets(values, np.array([0, 3, 5]), maximum=True)) == [1]
+    assert list(local_extrema_brackets(values, np.array([0, 5]), maximum=True)) == [1, 3]
+    # two equal samples around a maximum are a single extremum
+    flat = np.array([0.0, 1.0, 1.0, 0.0])
+    assert list(local_extrema_brackets(flat, np.array([0, 4]), maximum=True)) == [1]
+    assert list(local_extrema_brackets(-flat, np.array([0, 4]), maximum=False)) == [1]
+
+
+def test_level_crossings_between_samples() -> None:
+    # a narrow bump above 0.5, entirely between two samples
+    def fn(t: np.ndarray) -> np.ndarray:
+        return np.exp(-(((t - ET - 5.4) / 0.3) ** 2))
+
+    times, offsets = sample_grid(np.array([[ET, ET + 10.0]]), 1.0)
+    above, crossings, levels = level_crossings(fn, times, offsets, fn(times), np.array([0.5]), 1e-6)
+
+    assert not above.any()
+    half_width = 0.3 * np.sqrt(np.log(2.0))
+    assert (np.sort(crossings) - ET).tolist() == pytest.approx([5.4 - half_width, 5.4 + half_width], abs=1e-5)
+    assert list(levels) == [0, 0]
+
+
+def test_level_crossings_symmetric_bump() -> None:
+    # the two samples around the bump are equal: its crossings are found once
+    def fn(t: np.ndarray) -> np.ndarray:
+        return np.exp(-(((t - ET - 5.5) / 0.3) ** 2))
+
+    times, offsets = sample_grid(np.array([[ET, ET + 10.0]]), 1.0)
+    _, crossings, _ = level_crossings(fn, times, offsets, fn(times), np.array([0.5]), 1e-6)
+
+    assert len(crossings) == 2
+
+
+def test_refined_maximum_between_samples() -> None:
+    # a narrow peak between two samples, above all of them
+    def fn(t: np.ndarray) -> np.ndarray:
+        return 1.0 + np.exp(-(((t - ET - 5.4) / 0.3) ** 2))
+
+    times, offsets = sample_grid(np.array([[ET, ET + 10.0]]), 1.0)
+
+    assert refined_maximum(fn, times, offsets, fn(times), 1e-6) == pytest.approx(2.0)
+    assert refined_maximum(fn, times, offsets, np.full(len(times), np.nan), 1e-6) == np.inf
+
+
+def test_assemble_intervals() -> None:
+    times, offsets = sample_grid(np.array([[0.0, 10.0], [20.0, 30.0]]), 5.0)
+    mask = np.array([True, True, False, True, True, False])
+
+    got = assemble_intervals(times, offsets, mask, [7.0, 25.0])
+
+    assert got.tolist() == [[0.0, 7.0], [20.0, 25.0]]